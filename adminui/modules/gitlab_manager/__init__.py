@@ -1,5 +1,4 @@
 import streamlit as st
-import requests
 import pandas as pd
 import json
 import os
@@ -9,13 +8,27 @@ from io import StringIO
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from modules.utils import version
+from modules.utils.pager import TokenBucket
+from modules.utils.config import get_module_setting, save_module_config
+from modules.utils.cache import ttl_cache, show_cache_status, api_cache
+from modules.utils import gitlab_warehouse
+from modules.utils import http_client
+from modules.utils import service_api
+from modules.utils.service_api import fetch_gitlab_pages
 
 # 모듈 ID와 버전 정보
 MODULE_ID = "gitlab_manager"
 VERSION = "v0.2.0"
 DEFAULT_REPO_URL = "https://gitlab.com/rluna-gitlab/gitlab-ce/-/tags"
 
+# 저장소 소유자 조회 요청당 타임아웃 (초)
+DEFAULT_OWNER_TIMEOUT = 10
+
+# 서버 검색 최소 검색어 길이 (한 글자 검색으로 전체 목록을 받아오지 않도록)
+SEARCH_MIN_LENGTH = 2
+
 def show_module():
     """GitLab 관리 모듈 메인 화면"""
     st.title("GitLab 관리")
@@ -90,7 +103,7 @@ def show_repository_statistics(repo_id):
         headers = {"PRIVATE-TOKEN": gitlab_token}
         url = f"{gitlab_host}/api/v4/projects/{repo_id}/statistics"
         
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, module_id=MODULE_ID, headers=headers)
         response.raise_for_status()
         
         return response.json()
@@ -98,6 +111,11 @@ def show_repository_statistics(repo_id):
         st.error(f"저장소 통계 정보 조회 실패: {e}")
         return None
 
+def get_pager_settings():
+    """GitLab API 병렬 조회 설정 (동시 요청 수, 초당 요청 수) 로드"""
+    return service_api.get_pager_settings(MODULE_ID)
+
+@ttl_cache(MODULE_ID, "projects_statistics", "GITLAB_HOST")
 def get_all_repositories_storage():
     """모든 GitLab 저장소 용량 조회"""
     try:
@@ -107,48 +125,34 @@ def get_all_repositories_storage():
         if not all([gitlab_host, gitlab_token]):
             return []
         
-        headers = {"PRIVATE-TOKEN": gitlab_token}
         projects = []
-        page = 1
-        
-        while True:
-            url = f"{gitlab_host}/api/v4/projects?per_page=100&page={page}&statistics=true"
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
+        data = fetch_gitlab_pages("projects", {"statistics": "true"})
 
-            data = response.json()
-            if not data:
-                break
-
-            # 저장소 정보 및 통계 정보 저장
-            for project in data:
-                # 필수 필드 확인
-                if all(key in project for key in ["id", "name", "namespace", "statistics"]):
-                    # 네임스페이스 확인 및 보정
-                    if not isinstance(project["namespace"], dict) or "name" not in project["namespace"]:
-                        project["namespace"] = {"name": "Unknown"}
-                    
-                    # 필요한 필드만 유지하여 메모리 절약
-                    clean_project = {
-                        "id": project["id"],
-                        "name": project["name"],
-                        "namespace": {"name": project["namespace"]["name"]},
-                        "web_url": project["web_url"],
-                        "created_at": project.get("created_at", ""),
-                        "last_activity_at": project.get("last_activity_at", ""),
-                        # "statistics": project["statistics"]
-                        "statistics": {
-                            "repository_size": project["statistics"].get("repository_size", 0),
-                            "lfs_objects_size": project["statistics"].get("lfs_objects_size", 0),
-                            "job_artifacts_size": project["statistics"].get("job_artifacts_size", 0),
-                            "packages_size": project["statistics"].get("packages_size", 0),
-                            "storage_size": project["statistics"].get("storage_size", 0)
-                        }
+        # 저장소 정보 및 통계 정보 저장
+        for project in data:
+            # 필수 필드 확인
+            if all(key in project for key in ["id", "name", "namespace", "statistics"]):
+                # 네임스페이스 확인 및 보정
+                if not isinstance(project["namespace"], dict) or "name" not in project["namespace"]:
+                    project["namespace"] = {"name": "Unknown"}
+                
+                # 필요한 필드만 유지하여 메모리 절약
+                clean_project = {
+                    "id": project["id"],
+                    "name": project["name"],
+                    "namespace": {"name": project["namespace"]["name"]},
+                    "web_url": project["web_url"],
+                    "created_at": project.get("created_at", ""),
+                    "last_activity_at": project.get("last_activity_at", ""),
+                    "statistics": {
+                        "repository_size": project["statistics"].get("repository_size", 0),
+                        "lfs_objects_size": project["statistics"].get("lfs_objects_size", 0),
+                        "job_artifacts_size": project["statistics"].get("job_artifacts_size", 0),
+                        "packages_size": project["statistics"].get("packages_size", 0),
+                        "storage_size": project["statistics"].get("storage_size", 0)
                     }
-                    projects.append(project)
-
-            page += 1
-            time.sleep(0.5)  # API 요청 제한 방지
+                }
+                projects.append(clean_project)
         
         return projects
     except Exception as e:
@@ -447,22 +451,20 @@ def show_repository_management():
             st.session_state.repositories = repositories
             st.success(f"총 {len(repositories)}개의 저장소를 불러왔습니다.")
     
+    # 검색 필터 (전체 목록을 불러왔으면 그 목록에서, 아니면 GitLab 서버에서 검색)
+    search_term = get_search_term("저장소 검색 (이름, 그룹, 설명)", "repo_search")
+    repositories = st.session_state.get("repositories")
+    
+    if repositories is not None:
+        filtered_stats = filter_repositories(repositories, search_term) if search_term else list(repositories)
+    elif search_term:
+        with st.spinner("GitLab에서 저장소를 검색하는 중입니다..."):
+            filtered_stats = search_repositories(search_term)
+    else:
+        filtered_stats = None
+    
     # 저장소 목록 표시
-    if hasattr(st.session_state, 'repositories'):
-        repositories = st.session_state.repositories
-        
-        # 검색 필터
-        search_term = st.text_input("저장소 검색 (이름, 그룹, 설명)", key="repo_search")
-        
-        # 필터링
-        if search_term:
-            filtered_stats = [repo for repo in repositories if 
-                             search_term.lower() in repo["name"].lower() or 
-                             search_term.lower() in repo["namespace"]["name"].lower() or 
-                             (repo.get("description") and search_term.lower() in repo["description"].lower())]
-        else:
-            filtered_stats = repositories
-        
+    if filtered_stats is not None:
         # 정렬 옵션
         sort_option = st.selectbox("정렬 기준", ["최근 활동순", "이름순", "생성일순"], key="repo_sort")
         
@@ -504,88 +506,104 @@ def show_repository_management():
         except Exception as e:
             st.error(f"저장소 목록 표시 중 오류가 발생했습니다: {str(e)}")
             st.info("저장소 데이터 형식이 예사과 다를 수 있습니다. GitLab API 응답을 확인해주세요.")
-        
-        # 선택한 저장소의 상세 정보 표시
-        st.subheader("저장소 상세 정보")
-        repo_id = st.number_input("저장소 ID", min_value=1, value=1, key="repo_id_input")
-        
-        if st.button("상세 정보 조회", key="fetch_repo_details"):
-            with st.spinner("저장소 정보를 불러오는 중입니다..."):
-                repo_details = get_repository_details(repo_id)
-                
-                if repo_details:
-                    # 저장소 정보 표시
-                    st.write("### 기본 정보")
-                    st.json({
-                        "ID": repo_details["id"],
-                        "이름": repo_details["name"],
-                        "그룹": repo_details["namespace"]["name"],
-                        "설명": repo_details.get("description", ""),
-                        "URL": repo_details["web_url"],
-                        "생성일": repo_details["created_at"],
-                        "최근 활동": repo_details["last_activity_at"],
-                        "가시성": repo_details["visibility"]
-                    })
-                    
-                    # 멤버 정보 불러오기
-                    members = get_project_members(repo_id)
-                    
-                    if members:
-                        st.write("### 멤버 정보")
-                        
-                        # 멤버 데이터프레임 생성
-                        members_df = pd.DataFrame([{
-                            "ID": member["id"],
-                            "이름": member["name"],
-                            "사용자명": member["username"],
-                            "이메일": member.get("email", ""),
-                            "권한": get_access_level_name(member["access_level"]),
-                            "추가일": member.get("created_at", "")
-                        } for member in members])
-                        
-                        # 멤버 데이터프레임 표시
-                        st.dataframe(members_df, key="members_dataframe")
-                        
-                        # CSV 다운로드 버튼
-                        csv = members_df.to_csv(index=False)
-                        st.download_button(
-                            label="멤버 목록 CSV 다운로드",
-                            data=csv,
-                            file_name=f"gitlab_repo_{repo_id}_members.csv",
-                            mime="text/csv",
-                            key="download_members_csv"
-                        )
-                    else:
-                        st.info("저장소 멤버 정보를 불러오는데 실패했습니다.")
-                    
-                    # 커밋 정보 불러오기
-                    commits = get_repository_commits(repo_id)
-                    
-                    if commits:
-                        st.write("### 최근 커밋 정보")
-                        
-                        # 커밋 데이터프레임 생성
-                        commits_df = pd.DataFrame([{
-                            "SHA": commit["id"][:8],
-                            "작성자": commit["author_name"],
-                            "메시지": commit["message"].split("\n")[0][:50],
-                            "일시": commit["created_at"]
-                        } for commit in commits])
-                        
-                        # 커밋 데이터프레임 표시
-                        st.dataframe(commits_df, key="commits_dataframe")
-                    else:
-                        st.info("저장소 커밋 정보를 불러오는데 실패했습니다.")
-                else:
-                    st.error("저장소 정보를 불러오는데 실패했습니다.")
-        
     else:
-        st.info("'저장소 목록 갱신' 버튼을 클릭하여 저장소 목록을 불러와주세요.")
+        st.info("저장소를 검색하거나 '저장소 목록 갱신' 버튼을 클릭하여 전체 목록을 불러와주세요.")
+    
+    # 선택한 저장소의 상세 정보 표시
+    st.subheader("저장소 상세 정보")
+    repo_id = st.number_input("저장소 ID", min_value=1, value=1, key="repo_id_input")
+    
+    if st.button("상세 정보 조회", key="fetch_repo_details"):
+        with st.spinner("저장소 정보를 불러오는 중입니다..."):
+            repo_details = get_repository_details(repo_id)
+    
+            if repo_details:
+                # 저장소 정보 표시
+                st.write("### 기본 정보")
+                st.json({
+                    "ID": repo_details["id"],
+                    "이름": repo_details["name"],
+                    "그룹": repo_details["namespace"]["name"],
+                    "설명": repo_details.get("description", ""),
+                    "URL": repo_details["web_url"],
+                    "생성일": repo_details["created_at"],
+                    "최근 활동": repo_details["last_activity_at"],
+                    "가시성": repo_details["visibility"]
+                })
+    
+                # 멤버 정보 불러오기
+                members = get_project_members(repo_id)
+    
+                if members:
+                    st.write("### 멤버 정보")
+    
+                    # 멤버 데이터프레임 생성
+                    members_df = pd.DataFrame([{
+                        "ID": member["id"],
+                        "이름": member["name"],
+                        "사용자명": member["username"],
+                        "이메일": member.get("email", ""),
+                        "권한": get_access_level_name(member["access_level"]),
+                        "추가일": member.get("created_at", "")
+                    } for member in members])
+    
+                    # 멤버 데이터프레임 표시
+                    st.dataframe(members_df, key="members_dataframe")
+    
+                    # CSV 다운로드 버튼
+                    csv = members_df.to_csv(index=False)
+                    st.download_button(
+                        label="멤버 목록 CSV 다운로드",
+                        data=csv,
+                        file_name=f"gitlab_repo_{repo_id}_members.csv",
+                        mime="text/csv",
+                        key="download_members_csv"
+                    )
+                else:
+                    st.info("저장소 멤버 정보를 불러오는데 실패했습니다.")
+    
+                # 커밋 정보 불러오기
+                commits = get_repository_commits(repo_id)
+    
+                if commits:
+                    st.write("### 최근 커밋 정보")
+    
+                    # 커밋 데이터프레임 생성
+                    commits_df = pd.DataFrame([{
+                        "SHA": commit["id"][:8],
+                        "작성자": commit["author_name"],
+                        "메시지": commit["message"].split("\n")[0][:50],
+                        "일시": commit["created_at"]
+                    } for commit in commits])
+    
+                    # 커밋 데이터프레임 표시
+                    st.dataframe(commits_df, key="commits_dataframe")
+                else:
+                    st.info("저장소 커밋 정보를 불러오는데 실패했습니다.")
+            else:
+                st.error("저장소 정보를 불러오는데 실패했습니다.")
+
+def get_search_term(label, key):
+    """검색어 입력 (최소 길이 미만이면 빈 문자열)
+
+    입력은 Enter 또는 포커스 이동 시에만 반영되고, 같은 검색어의 서버 검색 결과는
+    캐시되므로 화면을 다시 그릴 때마다 GitLab에 요청하지 않습니다.
+    """
+    search_term = st.text_input(label, key=key).strip()
+    if 0 < len(search_term) < SEARCH_MIN_LENGTH:
+        st.caption(f"검색어를 {SEARCH_MIN_LENGTH}자 이상 입력해주세요.")
+        return ""
+    return search_term
 
 def show_user_management():
     """사용자 관리 화면"""
     st.subheader("사용자 관리")
     
+    # 로컬 웨어하우스가 있으면 사용자별 소유 저장소를 바로 조회
+    warehouse_path = get_warehouse_path()
+    if gitlab_warehouse.is_available(warehouse_path):
+        show_warehouse_user_projects(warehouse_path)
+    
     # GitLab 연결 확인
     if not check_gitlab_connection():
         st.error("GitLab 연결에 실패했습니다. GitLab 설정을 확인해주세요.")
@@ -603,31 +621,25 @@ def show_user_management():
             else:
                 st.error("사용자 목록을 불러오는데 실패했습니다.")
     
-    # 사용자 목록 표시
-    if hasattr(st.session_state, 'gitlab_users'):
-        users = st.session_state.gitlab_users
-        
-        # 검색 필터
-        search_term = st.text_input("사용자 검색 (이름, 사용자명, 이메일)")
-        
-        # 필터링
-        if search_term:
-            filtered_users = [user for user in users if 
-                             search_term.lower() in user["name"].lower() or 
-                             search_term.lower() in user["username"].lower() or 
-                             (user.get("email") and search_term.lower() in user["email"].lower())]
-        else:
-            filtered_users = users
-        
-        # 사용자 상태 필터
+    # 검색 필터 (전체 목록을 불러왔으면 그 목록에서, 아니면 GitLab 서버에서 검색)
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        search_term = get_search_term("사용자 검색 (이름, 사용자명, 이메일)", "user_search")
+    with col2:
         status_filter = st.selectbox("상태 필터", ["모두", "활성", "차단됨"])
-        
-        if status_filter == "활성":
-            filtered_users = [user for user in filtered_users if user["state"] == "active"]
-        elif status_filter == "차단됨":
-            filtered_users = [user for user in filtered_users if user["state"] == "blocked"]
-        
-        # 사용자 목록 표시
+    state = {"활성": "active", "차단됨": "blocked"}.get(status_filter)
+    users = st.session_state.get("gitlab_users")
+    
+    if users is not None:
+        filtered_users = filter_users(users, search_term, state)
+    elif search_term:
+        with st.spinner("GitLab에서 사용자를 검색하는 중입니다..."):
+            filtered_users = search_users(search_term, state)
+    else:
+        filtered_users = None
+    
+    # 사용자 목록 표시
+    if filtered_users is not None:
         st.write(f"총 {len(filtered_users)}명의 사용자가 있습니다.")
         
         # 데이터프레임 생성
@@ -644,60 +656,6 @@ def show_user_management():
         # 데이터프레임 표시
         st.dataframe(df)
         
-        # 선택한 사용자의 상세 정보 표시
-        st.subheader("사용자 상세 정보")
-        user_id = st.number_input("사용자 ID", min_value=1, value=1, key="user_id_input")
-        
-        if st.button("상세 정보 조회", key=f"fetch_user_details_{user_id}"):
-            with st.spinner("사용자 정보를 불러오는 중입니다..."):
-                user_details = get_user_details(user_id)
-                
-                if user_details:
-                    # 사용자 정보 표시
-                    st.write("### 기본 정보")
-                    st.json({
-                        "ID": user_details["id"],
-                        "이름": user_details["name"],
-                        "사용자명": user_details["username"],
-                        "이메일": user_details.get("email", ""),
-                        "상태": "활성" if user_details["state"] == "active" else "차단됨",
-                        "관리자": "예" if user_details.get("is_admin", False) else "아니오",
-                        "마지막 로그인": user_details.get("last_sign_in_at", ""),
-                        "생성일": user_details["created_at"]
-                    })
-                    
-                    # 사용자 프로젝트 정보 불러오기
-                    projects = get_user_projects(user_id)
-                    
-                    if projects:
-                        st.write("### 프로젝트 정보")
-                        
-                        # 프로젝트 데이터프레임 생성
-                        projects_df = pd.DataFrame([{
-                            "ID": project["id"],
-                            "그룹": project["namespace"]["name"],
-                            "프로젝트": project["name"],
-                            "접근 레벨": get_access_level_name(project["access_level"]),
-                            "URL": project["web_url"]
-                        } for project in projects])
-                        
-                        # 프로젝트 데이터프레임 표시
-                        st.dataframe(projects_df)
-                        
-                        # CSV 다운로드 버튼
-                        csv = projects_df.to_csv(index=False)
-                        st.download_button(
-                            label="프로젝트 목록 CSV 다운로드",
-                            data=csv,
-                            file_name=f"gitlab_user_{user_id}_projects.csv",
-                            mime="text/csv"
-                        )
-                    else:
-                        st.info("사용자 프로젝트 정보를 불러오는데 실패했습니다.")
-                else:
-                    # st.error("사용자 정보를 불러오는데 실패했습니다.")
-                    st.warning(f"ID {user_id}에 해당하는 사용자 정보가 없습니다. 존재하지 않는 ID이거나 퇴사로 인해 삭제된 ID 일 수 있습니다.")
-        
         # CSV 다운로드 버튼
         csv = df.to_csv(index=False)
         st.download_button(
@@ -707,14 +665,106 @@ def show_user_management():
             mime="text/csv"
         )
     else:
-        st.info("'사용자 목록 갱신' 버튼을 클릭하여 사용자 목록을 불러와주세요.")
+        st.info("사용자를 검색하거나 '사용자 목록 갱신' 버튼을 클릭하여 전체 목록을 불러와주세요.")
+    
+    # 선택한 사용자의 상세 정보 표시
+    st.subheader("사용자 상세 정보")
+    user_id = st.number_input("사용자 ID", min_value=1, value=1, key="user_id_input")
+    
+    if st.button("상세 정보 조회", key=f"fetch_user_details_{user_id}"):
+        with st.spinner("사용자 정보를 불러오는 중입니다..."):
+            user_details = get_user_details(user_id)
+    
+            if user_details:
+                # 사용자 정보 표시
+                st.write("### 기본 정보")
+                st.json({
+                    "ID": user_details["id"],
+                    "이름": user_details["name"],
+                    "사용자명": user_details["username"],
+                    "이메일": user_details.get("email", ""),
+                    "상태": "활성" if user_details["state"] == "active" else "차단됨",
+                    "관리자": "예" if user_details.get("is_admin", False) else "아니오",
+                    "마지막 로그인": user_details.get("last_sign_in_at", ""),
+                    "생성일": user_details["created_at"]
+                })
+    
+                # 사용자 프로젝트 정보 불러오기
+                projects = get_user_projects(user_id)
+    
+                if projects:
+                    st.write("### 프로젝트 정보")
+    
+                    # 프로젝트 데이터프레임 생성
+                    projects_df = pd.DataFrame([{
+                        "ID": project["id"],
+                        "그룹": project["namespace"]["name"],
+                        "프로젝트": project["name"],
+                        "접근 레벨": get_access_level_name(project["access_level"]),
+                        "URL": project["web_url"]
+                    } for project in projects])
+    
+                    # 프로젝트 데이터프레임 표시
+                    st.dataframe(projects_df)
+    
+                    # CSV 다운로드 버튼
+                    csv = projects_df.to_csv(index=False)
+                    st.download_button(
+                        label="프로젝트 목록 CSV 다운로드",
+                        data=csv,
+                        file_name=f"gitlab_user_{user_id}_projects.csv",
+                        mime="text/csv"
+                    )
+                else:
+                    st.info("사용자 프로젝트 정보를 불러오는데 실패했습니다.")
+            else:
+                # st.error("사용자 정보를 불러오는데 실패했습니다.")
+                st.warning(f"ID {user_id}에 해당하는 사용자 정보가 없습니다. 존재하지 않는 ID이거나 퇴사로 인해 삭제된 ID 일 수 있습니다.")
+
+def show_warehouse_user_projects(warehouse_path):
+    """로컬 웨어하우스에서 사용자별 저장소 조회"""
+    with st.expander("사용자별 저장소 조회 (로컬 웨어하우스)", expanded=False):
+        col1, col2 = st.columns(2)
+        with col1:
+            user = st.text_input("사용자명, 이름 또는 ID", key="warehouse_user")
+        with col2:
+            role = st.selectbox("최소 권한", ["Owner", "Maintainer", "Developer"], key="warehouse_user_role")
+        
+        if user:
+            min_access_level = {"Owner": 50, "Maintainer": 40, "Developer": 30}[role]
+            try:
+                projects = gitlab_warehouse.get_user_projects(warehouse_path, user.strip(), min_access_level)
+            except Exception as e:
+                st.error(f"웨어하우스 조회 실패: {e}")
+                return
+            
+            if projects:
+                df = pd.DataFrame([{
+                    "ID": project["id"],
+                    "그룹": project["namespace"]["name"],
+                    "프로젝트": project["name"],
+                    "접근 레벨": get_access_level_name(project["access_level"]),
+                    "최근 활동": project["last_activity_at"],
+                    "URL": project["web_url"]
+                } for project in projects])
+                st.write(f"총 {len(projects)}개의 저장소가 있습니다.")
+                st.dataframe(df)
+            else:
+                st.info("조건에 맞는 저장소가 없습니다.")
 
 def show_unused_repositories():
     """미사용 저장소 화면"""
     st.subheader("미사용 저장소")
     
+    # 로컬 웨어하우스가 있으면 API 크롤링 없이 조회 가능
+    warehouse_path = get_warehouse_path()
+    use_warehouse = False
+    if gitlab_warehouse.is_available(warehouse_path):
+        source = st.radio("데이터 소스", ["로컬 웨어하우스", "실시간 API"], horizontal=True, key="unused_repos_source")
+        use_warehouse = source == "로컬 웨어하우스"
+    
     # GitLab 연결 확인
-    if not check_gitlab_connection():
+    if not use_warehouse and not check_gitlab_connection():
         st.error("GitLab 연결에 실패했습니다. GitLab 설정을 확인해주세요.")
         return
     
@@ -736,8 +786,24 @@ def show_unused_repositories():
             elif period == "2년":
                 days = 730
             
-            # 미사용 저장소 목록 불러오기
-            unused_repos = get_unused_repositories(days)
+            if use_warehouse:
+                # 웨어하우스 인덱스 조회
+                unused_repos = get_unused_repositories_from_warehouse(warehouse_path, days)
+            else:
+                # 소유자 조회 진행 상황 표시
+                progress_bar = st.progress(0.0)
+                partial_table = st.empty()
+                
+                def show_progress(repos, done, total):
+                    progress_bar.progress(done / total if total else 1.0, text=f"저장소 소유자 조회 중... ({done}/{total})")
+                    if done == total or done % 10 == 0:
+                        partial_table.dataframe(make_unused_repos_dataframe(repos))
+                
+                # 미사용 저장소 목록 불러오기
+                unused_repos = get_unused_repositories(days, on_progress=show_progress)
+                
+                progress_bar.empty()
+                partial_table.empty()
             
             if unused_repos:
                 # 세션 상태에 저장
@@ -751,16 +817,7 @@ def show_unused_repositories():
         unused_repos = st.session_state.unused_repos
         
         # 데이터프레임 생성
-        df = pd.DataFrame([{
-            "ID": repo["id"],
-            "그룹": repo["namespace"]["name"],
-            "프로젝트": repo["name"],
-            "설명": repo.get("description", ""),
-            "URL": repo["web_url"],
-            "생성일": repo["created_at"],
-            "최근 활동": repo["last_activity_at"],
-            "소유자": repo.get("owner_name", "알 수 없음")
-        } for repo in unused_repos])
+        df = make_unused_repos_dataframe(unused_repos)
         
         # 데이터프레임 표시
         st.dataframe(df)
@@ -776,6 +833,19 @@ def show_unused_repositories():
     else:
         st.info("'미사용 저장소 조회' 버튼을 클릭하여 미사용 저장소 목록을 불러와주세요.")
 
+def make_unused_repos_dataframe(unused_repos):
+    """미사용 저장소 목록 데이터프레임 생성"""
+    return pd.DataFrame([{
+        "ID": repo["id"],
+        "그룹": repo["namespace"]["name"],
+        "프로젝트": repo["name"],
+        "설명": repo.get("description", ""),
+        "URL": repo["web_url"],
+        "생성일": repo["created_at"],
+        "최근 활동": repo["last_activity_at"],
+        "소유자": repo.get("owner_name", "알 수 없음")
+    } for repo in unused_repos])
+
 def show_gitlab_settings():
     """GitLab 설정 화면"""
     st.subheader("GitLab 설정")
@@ -808,6 +878,78 @@ def show_gitlab_settings():
         else:
             st.error("GitLab 연결에 실패했습니다. 설정을 확인해주세요.")
 
+    # API 요청 설정
+    with st.expander("API 요청 설정", expanded=False):
+        max_workers, requests_per_second = get_pager_settings()
+
+        incremental_sync = bool(get_module_setting(MODULE_ID, "incremental_sync", False))
+
+        with st.form("gitlab_pager_form"):
+            new_max_workers = st.number_input("최대 동시 요청 수", min_value=1, max_value=16, value=max_workers)
+            new_requests_per_second = st.number_input("초당 최대 요청 수", min_value=1.0, max_value=50.0, value=requests_per_second, step=1.0)
+            new_incremental_sync = st.checkbox("저장소 목록 증분 동기화", value=incremental_sync,
+                                               help="로컬 웨어하우스의 저장소 목록을 유지하고 마지막 동기화 이후 활동이 있는 저장소만 조회합니다.")
+            submit = st.form_submit_button("저장")
+
+            if submit:
+                if save_module_config(MODULE_ID, {
+                    "max_workers": int(new_max_workers),
+                    "requests_per_second": float(new_requests_per_second),
+                    "incremental_sync": new_incremental_sync
+                }):
+                    st.success("API 요청 설정이 저장되었습니다.")
+                else:
+                    st.error("API 요청 설정 저장에 실패했습니다.")
+
+        if incremental_sync and not get_warehouse_path():
+            st.warning("증분 동기화를 사용하려면 로컬 웨어하우스 경로를 설정해주세요.")
+        elif incremental_sync:
+            store = get_project_store()
+            st.write(f"마지막 동기화: {store.get_state(gitlab_warehouse.LAST_SYNC_KEY) or '없음'}")
+
+            if st.button("저장소 목록 전체 동기화", key="gitlab_full_sync"):
+                with st.spinner("전체 저장소 목록을 동기화하는 중입니다..."):
+                    try:
+                        result = gitlab_warehouse.sync_projects(store, fetch_all_projects, clean_project, full=True)
+                        api_cache.invalidate(MODULE_ID, "projects")
+                        st.success(f"전체 동기화 완료: {result['updated']}개 저장소")
+                    except Exception as e:
+                        st.error(f"전체 동기화 실패: {e}")
+
+    # 로컬 웨어하우스 설정
+    with st.expander("로컬 웨어하우스", expanded=False):
+        warehouse_path = get_warehouse_path()
+        
+        with st.form("gitlab_warehouse_form"):
+            new_warehouse_path = st.text_input("웨어하우스 파일 경로", value=warehouse_path,
+                                               help="gitlab/*.py 수집 스크립트가 생성하는 gitlab_warehouse.db 경로 (저장소 목록 증분 동기화도 이 파일을 사용)")
+            submit = st.form_submit_button("저장")
+            
+            if submit:
+                if save_module_config(MODULE_ID, {"warehouse_path": new_warehouse_path.strip()}):
+                    st.success("웨어하우스 경로가 저장되었습니다.")
+                    warehouse_path = new_warehouse_path.strip()
+                else:
+                    st.error("웨어하우스 경로 저장에 실패했습니다.")
+        
+        if gitlab_warehouse.is_available(warehouse_path):
+            try:
+                status = gitlab_warehouse.get_status(warehouse_path)
+                st.dataframe(pd.DataFrame([{
+                    "테이블": table,
+                    "행 수": info["count"],
+                    "마지막 갱신": info["updated_at"] or ""
+                } for table, info in status.items()]))
+            except Exception as e:
+                st.error(f"웨어하우스 조회 실패: {e}")
+        elif warehouse_path:
+            st.warning(f"웨어하우스 파일이 없습니다: {warehouse_path}")
+        else:
+            st.info("웨어하우스 경로를 설정하면 미사용 저장소와 사용자별 저장소를 API 조회 없이 확인할 수 있습니다.")
+    
+    # API 캐시 상태
+    show_cache_status(MODULE_ID)
+
     # 버전 정보 섹션
     st.subheader("GitLab 서버 정보")
 
@@ -883,7 +1025,7 @@ def check_gitlab_connection():
         headers = {"PRIVATE-TOKEN": gitlab_token}
         url = f"{gitlab_host}/api/v4/version"
         
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, module_id=MODULE_ID, max_retries=0, headers=headers)
         response.raise_for_status()
         
         return True
@@ -891,8 +1033,65 @@ def check_gitlab_connection():
         st.error(f"GitLab 연결 실패: {e}")
         return False
 
+def clean_project(project):
+    """프로젝트 응답에서 화면에 필요한 필드만 추출 (필수 필드가 없으면 None)"""
+    # 필수 필드 확인
+    if not all(key in project for key in ["id", "name", "namespace", "web_url", "created_at", "last_activity_at"]):
+        return None
+    
+    # 네임스페이스 확인 및 보정
+    if not isinstance(project["namespace"], dict) or "name" not in project["namespace"]:
+        project["namespace"] = {"name": "Unknown"}
+    
+    # 필수 필드만 유지하여 메모리 절약
+    return {
+        "id": project["id"],
+        "name": project["name"],
+        "namespace": {"name": project["namespace"]["name"]},
+        "path_with_namespace": project.get("path_with_namespace", ""),
+        "description": project.get("description", ""),
+        "web_url": project["web_url"],
+        "created_at": project["created_at"],
+        "last_activity_at": project["last_activity_at"]
+    }
+
+def fetch_all_projects(params=None):
+    """프로젝트 목록 전체 조회 (GitLab 응답 그대로)"""
+    return fetch_gitlab_pages("projects", params)
+
+def fetch_clean_projects(params=None):
+    """프로젝트 목록을 조회하여 필요한 필드만 남긴 목록 반환"""
+    projects = []
+    for project in fetch_all_projects(params):
+        clean = clean_project(project)
+        if clean:
+            projects.append(clean)
+    return projects
+
+def get_project_store():
+    """증분 동기화용 웨어하우스 projects 테이블"""
+    gitlab_host = os.environ.get("GITLAB_HOST")
+    return gitlab_warehouse.ProjectStore(get_warehouse_path(), gitlab_host)
+
+def get_warehouse_path():
+    """config/modules/gitlab_manager.json의 웨어하우스 경로"""
+    return get_module_setting(MODULE_ID, "warehouse_path", "") or ""
+
+def get_unused_repositories_from_warehouse(warehouse_path, days):
+    """로컬 웨어하우스에서 미사용 저장소 목록 조회"""
+    try:
+        return gitlab_warehouse.get_unused_projects(warehouse_path, days)
+    except Exception as e:
+        st.error(f"웨어하우스 조회 실패: {e}")
+        return []
+
+@ttl_cache(MODULE_ID, "projects", "GITLAB_HOST")
 def get_all_repositories():
-    """모든 GitLab 저장소 목록 조회"""
+    """모든 GitLab 저장소 목록 조회
+
+    증분 동기화 설정이 켜져 있으면 로컬 웨어하우스의 projects 테이블을 마지막 동기화 이후
+    변경분만으로 갱신한 뒤 웨어하우스에서 목록을 반환합니다.
+    """
     try:
         gitlab_host = os.environ.get("GITLAB_HOST")
         gitlab_token = os.environ.get("GITLAB_TOKEN")
@@ -900,43 +1099,12 @@ def get_all_repositories():
         if not all([gitlab_host, gitlab_token]):
             return []
         
-        headers = {"PRIVATE-TOKEN": gitlab_token}
-        projects = []
-        page = 1
-        
-        while True:
-            url = f"{gitlab_host}/api/v4/projects?per_page=100&page={page}"
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            data = response.json()
-            if not data:
-                break
-            
-            # 데이터 형식 검증 및 불필요한 필드 제거
-            for project in data:
-                # 필수 필드 확인
-                if all(key in project for key in ["id", "name", "namespace", "web_url", "created_at", "last_activity_at"]):
-                    # 네임스페이스 확인 및 보정
-                    if not isinstance(project["namespace"], dict) or "name" not in project["namespace"]:
-                        project["namespace"] = {"name": "Unknown"}
-                    
-                    # 필수 필드만 유지하여 메모리 절약
-                    clean_project = {
-                        "id": project["id"],
-                        "name": project["name"],
-                        "namespace": {"name": project["namespace"]["name"]},
-                        "description": project.get("description", ""),
-                        "web_url": project["web_url"],
-                        "created_at": project["created_at"],
-                        "last_activity_at": project["last_activity_at"]
-                    }
-                    projects.append(clean_project)
-            
-            page += 1
-            time.sleep(0.5)  # API 요청 제한 방지
+        if get_module_setting(MODULE_ID, "incremental_sync", False) and get_warehouse_path():
+            store = get_project_store()
+            gitlab_warehouse.sync_projects(store, fetch_all_projects, clean_project)
+            return store.load_projects()
         
-        return projects
+        return fetch_clean_projects()
     except Exception as e:
         st.error(f"저장소 목록 조회 실패: {e}")
         return []
@@ -953,7 +1121,7 @@ def get_repository_details(repo_id):
         headers = {"PRIVATE-TOKEN": gitlab_token}
         url = f"{gitlab_host}/api/v4/projects/{repo_id}"
         
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, module_id=MODULE_ID, headers=headers)
         response.raise_for_status()
         
         return response.json()
@@ -961,6 +1129,7 @@ def get_repository_details(repo_id):
         st.error(f"저장소 상세 정보 조회 실패: {e}")
         return None
 
+@ttl_cache(MODULE_ID, "project_members", "GITLAB_HOST")
 def get_project_members(project_id):
     """프로젝트 멤버 목록 조회"""
     try:
@@ -976,7 +1145,7 @@ def get_project_members(project_id):
         
         while True:
             url = f"{gitlab_host}/api/v4/projects/{project_id}/members/all?per_page=100&page={page}"
-            response = requests.get(url, headers=headers)
+            response = http_client.get(url, module_id=MODULE_ID, headers=headers)
             
             if response.status_code == 404:
                 return []
@@ -1008,7 +1177,7 @@ def get_repository_commits(repo_id):
         headers = {"PRIVATE-TOKEN": gitlab_token}
         url = f"{gitlab_host}/api/v4/projects/{repo_id}/repository/commits?per_page=20"
         
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, module_id=MODULE_ID, headers=headers)
         
         if response.status_code == 404:
             return []
@@ -1020,6 +1189,7 @@ def get_repository_commits(repo_id):
         st.error(f"저장소 커밋 조회 실패: {e}")
         return []
 
+@ttl_cache(MODULE_ID, "users", "GITLAB_HOST")
 def get_all_users():
     """모든 GitLab 사용자 목록 조회"""
     try:
@@ -1029,28 +1199,75 @@ def get_all_users():
         if not all([gitlab_host, gitlab_token]):
             return []
         
-        headers = {"PRIVATE-TOKEN": gitlab_token}
-        users = []
-        page = 1
-        
-        while True:
-            url = f"{gitlab_host}/api/v4/users?per_page=100&page={page}"
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            data = response.json()
-            if not data:
-                break
-            
-            users.extend(data)
-            page += 1
-            time.sleep(0.5)  # API 요청 제한 방지
-        
-        return users
+        return fetch_gitlab_pages("users")
     except Exception as e:
         st.error(f"사용자 목록 조회 실패: {e}")
         return []
 
+@ttl_cache(MODULE_ID, "user_search", "GITLAB_HOST")
+def search_users(search_term, state=None):
+    """GitLab 서버에서 사용자 검색 (이름, 사용자명, 이메일)
+
+    Args:
+        search_term (str): 검색어 (/users?search=)
+        state (str, optional): "active" 또는 "blocked" 상태 필터
+
+    Returns:
+        list: 검색된 사용자 목록 (조회 실패 시 None)
+    """
+    try:
+        gitlab_host = os.environ.get("GITLAB_HOST")
+        gitlab_token = os.environ.get("GITLAB_TOKEN")
+        
+        if not all([gitlab_host, gitlab_token]):
+            return None
+        
+        params = {"search": search_term}
+        if state in ("active", "blocked"):
+            params[state] = "true"
+        
+        return fetch_gitlab_pages("users", params)
+    except Exception as e:
+        st.error(f"사용자 검색 실패: {e}")
+        return None
+
+@ttl_cache(MODULE_ID, "project_search", "GITLAB_HOST")
+def search_repositories(search_term):
+    """GitLab 서버에서 저장소 검색 (이름, 경로, 설명, 그룹)
+
+    Returns:
+        list: 검색된 저장소 목록 (조회 실패 시 None)
+    """
+    try:
+        gitlab_host = os.environ.get("GITLAB_HOST")
+        gitlab_token = os.environ.get("GITLAB_TOKEN")
+        
+        if not all([gitlab_host, gitlab_token]):
+            return None
+        
+        return fetch_clean_projects({"search": search_term, "search_namespaces": "true", "simple": "true"})
+    except Exception as e:
+        st.error(f"저장소 검색 실패: {e}")
+        return None
+
+def filter_users(users, search_term, state=None):
+    """불러온 사용자 목록을 검색어와 상태로 필터링"""
+    search_term = search_term.lower()
+    return [user for user in users if
+            (not search_term or
+             search_term in user["name"].lower() or
+             search_term in user["username"].lower() or
+             (user.get("email") and search_term in user["email"].lower())) and
+            (state is None or user["state"] == state)]
+
+def filter_repositories(repositories, search_term):
+    """불러온 저장소 목록을 검색어로 필터링"""
+    search_term = search_term.lower()
+    return [repo for repo in repositories if
+            search_term in repo["name"].lower() or
+            search_term in repo["namespace"]["name"].lower() or
+            (repo.get("description") and search_term in repo["description"].lower())]
+
 def get_user_details(user_id):
     """사용자 상세 정보 조회"""
     try:
@@ -1063,7 +1280,7 @@ def get_user_details(user_id):
         headers = {"PRIVATE-TOKEN": gitlab_token}
         url = f"{gitlab_host}/api/v4/users/{user_id}"
         
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, module_id=MODULE_ID, headers=headers)
 
         if response.status_code == 404:
             return None
@@ -1075,6 +1292,7 @@ def get_user_details(user_id):
         st.error(f"사용자 상세 정보 조회 실패: {e}")
         return None
 
+@ttl_cache(MODULE_ID, "user_projects", "GITLAB_HOST")
 def get_user_projects(user_id):
     """사용자 프로젝트 목록 조회"""
     try:
@@ -1087,7 +1305,7 @@ def get_user_projects(user_id):
         headers = {"PRIVATE-TOKEN": gitlab_token}
         url = f"{gitlab_host}/api/v4/users/{user_id}/projects"
         
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, module_id=MODULE_ID, headers=headers)
         response.raise_for_status()
         
         return response.json()
@@ -1095,8 +1313,60 @@ def get_user_projects(user_id):
         st.error(f"사용자 프로젝트 조회 실패: {e}")
         return []
 
-def get_unused_repositories(days):
-    """미사용 저장소 목록 조회"""
+def get_project_owner(project_id, timeout=DEFAULT_OWNER_TIMEOUT, rate_limiter=None):
+    """프로젝트 Owner 이름 조회
+
+    워커 스레드에서 호출되므로 Streamlit 출력 없이 예외를 호출자에게 전달합니다.
+
+    Args:
+        project_id (int): 프로젝트 ID
+        timeout (float): 요청당 타임아웃 (초)
+        rate_limiter (TokenBucket, optional): 요청 속도 제한기
+
+    Returns:
+        str: Owner 이름 (없으면 빈 문자열)
+    """
+    gitlab_host = os.environ.get("GITLAB_HOST")
+    gitlab_token = os.environ.get("GITLAB_TOKEN")
+    
+    headers = {"PRIVATE-TOKEN": gitlab_token}
+    url = f"{gitlab_host}/api/v4/projects/{project_id}/members/all"
+    page = 1
+    
+    while True:
+        if rate_limiter:
+            rate_limiter.acquire()
+        
+        response = http_client.get(url, module_id=MODULE_ID, headers=headers, params={"per_page": 100, "page": page}, timeout=timeout)
+        
+        if response.status_code == 404:
+            return ""
+        
+        response.raise_for_status()
+        
+        data = response.json()
+        for member in data:
+            if member["access_level"] == 50:  # Owner
+                return member["name"]
+        
+        if len(data) < 100:
+            return ""
+        
+        page += 1
+
+def get_unused_repositories(days, on_progress=None):
+    """미사용 저장소 목록 조회
+
+    소유자 조회는 설정된 동시 요청 수만큼 병렬로 수행하며, 조회한 소유자는
+    세션에 보관하여 기간을 바꿔 다시 조회할 때 재사용합니다.
+
+    Args:
+        days (int): 미사용 기간 (일)
+        on_progress (callable, optional): (저장소 목록, 완료 수, 전체 수)를 받는 진행 콜백
+
+    Returns:
+        list: 미사용 저장소 목록
+    """
     try:
         # 모든 저장소 목록 조회
         repositories = get_all_repositories()
@@ -1118,17 +1388,59 @@ def get_unused_repositories(days):
             delta = now - last_activity_at
             
             if delta.days > days:
-                # 저장소 소유자 정보 추가
-                members = get_project_members(repo["id"])
-                
-                if members:
-                    for member in members:
-                        if member["access_level"] == 50:  # Owner
-                            repo["owner_name"] = member["name"]
-                            break
-                
                 unused_repos.append(repo)
         
+        # 이전에 조회한 소유자 정보 재사용
+        if "gitlab_project_owners" not in st.session_state:
+            st.session_state.gitlab_project_owners = {}
+        owner_cache = st.session_state.gitlab_project_owners
+        
+        pending_repos = []
+        for repo in unused_repos:
+            if repo["id"] in owner_cache:
+                if owner_cache[repo["id"]]:
+                    repo["owner_name"] = owner_cache[repo["id"]]
+            else:
+                pending_repos.append(repo)
+        
+        total = len(unused_repos)
+        done = total - len(pending_repos)
+        if on_progress:
+            on_progress(unused_repos, done, total)
+        
+        if not pending_repos:
+            return unused_repos
+        
+        # 저장소 소유자 정보 병렬 조회
+        max_workers, requests_per_second = get_pager_settings()
+        timeout = float(get_module_setting(MODULE_ID, "owner_lookup_timeout", DEFAULT_OWNER_TIMEOUT))
+        rate_limiter = TokenBucket(requests_per_second)
+        failed = 0
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(get_project_owner, repo["id"], timeout, rate_limiter): repo
+                for repo in pending_repos
+            }
+            
+            for future in as_completed(futures):
+                repo = futures[future]
+                try:
+                    owner_name = future.result()
+                    owner_cache[repo["id"]] = owner_name
+                    if owner_name:
+                        repo["owner_name"] = owner_name
+                except Exception:
+                    # 실패한 항목은 캐시하지 않아 다음 조회 시 다시 시도
+                    failed += 1
+                
+                done += 1
+                if on_progress:
+                    on_progress(unused_repos, done, total)
+        
+        if failed:
+            st.warning(f"{failed}개 저장소의 소유자 조회에 실패했습니다. 다시 조회하면 실패한 저장소만 재시도합니다.")
+        
         return unused_repos
     except Exception as e:
         st.error(f"미사용 저장소 조회 실패: {e}")
@@ -1187,7 +1499,7 @@ def get_gitlab_version():
         headers = {"PRIVATE-TOKEN": gitlab_token}
         url = f"{gitlab_host}/api/v4/version"
 
-        response = requests.get(url, headers=headers, timeout=5)
+        response = http_client.get(url, module_id=MODULE_ID, max_retries=0, headers=headers, timeout=5)
         response.raise_for_status()
 
         return response.json()
@@ -1,13 +1,19 @@
 import streamlit as st
-import requests
 from requests.auth import HTTPBasicAuth
 import pandas as pd
 import os
 from datetime import datetime
-import time
 import urllib.parse
 import base64
+from concurrent.futures import ThreadPoolExecutor
 from modules.utils.version import show_version_info, save_repo_url, load_repo_url
+from modules.utils.cache import ttl_cache, show_cache_status, api_cache, get_ttl
+from modules.utils.config import save_module_config
+from modules.utils.pager import TokenBucket
+from modules.utils.folder_tree import walk_folder_tree
+from modules.utils.folder_permissions import REQUIRED_COLUMNS, TEAM_COLUMNS, load_desired_state, plan_permission_changes, apply_permission_changes, format_plan
+from modules.utils import http_client
+from modules.utils import service_api
 
 # 모듈 ID와 버전 정보
 MODULE_ID = "grafana_manager"
@@ -200,7 +206,7 @@ def show_folder_permission_management():
     # 폴더 목록 불러오기
     if st.button("폴더 목록 갱신"):
         with st.spinner("폴더 목록을 불러오는 중입니다..."):
-            folders = get_all_folders()
+            folders = get_folder_tree()
             
             if folders:
                 # 세션 상태에 저장
@@ -214,12 +220,12 @@ def show_folder_permission_management():
         folders = st.session_state.grafana_folders
         
         # 검색 필터
-        search_term = st.text_input("폴더 검색 (이름)")
+        search_term = st.text_input("폴더 검색 (이름, 경로)")
         
         # 필터링
         if search_term:
             filtered_folders = [folder for folder in folders if 
-                               search_term.lower() in folder["title"].lower()]
+                               search_term.lower() in folder.get("path", folder["title"]).lower()]
         else:
             filtered_folders = folders
         
@@ -231,6 +237,8 @@ def show_folder_permission_management():
             "ID": folder["id"],
             "UID": folder["uid"],
             "제목": folder["title"],
+            "경로": folder.get("path", folder["title"]),
+            "깊이": folder.get("depth", 0),
             "URL": folder["url"],
             "생성일": folder.get("created", "")
         } for folder in filtered_folders])
@@ -276,13 +284,8 @@ def show_folder_permission_management():
                 } for p in team_permissions])
                 
                 # 팀 이름 추가
-                for i, row in team_df.iterrows():
-                    team_id = row["팀 ID"]
-                    team_details = get_team_details(team_id)
-                    if team_details:
-                        team_df.at[i, "팀 이름"] = team_details["name"]
-                    else:
-                        team_df.at[i, "팀 이름"] = f"팀 ID {team_id}"
+                team_directory = get_team_directory()
+                team_df["팀 이름"] = [get_team_name(p["teamId"], team_directory, p) for p in team_permissions]
                 
                 # 열 순서 조정
                 team_df = team_df[["팀 이름", "팀 ID", "권한"]]
@@ -324,7 +327,7 @@ def show_folder_permission_management():
             with st.spinner("모든 폴더의 권한을 조회 중입니다..."):
                 all_permissions = collect_all_folder_permissions(filtered_folders)
                 
-                if all_permissions:
+                if all_permissions is not None:
                     # CSV 다운로드 버튼
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                     csv = all_permissions.to_csv(index=False)
@@ -345,6 +348,9 @@ def show_folder_permission_management():
             file_name="grafana_folders.csv",
             mime="text/csv"
         )
+        
+        # 목표 권한 CSV로 여러 폴더 권한 일괄 적용
+        show_bulk_permission_apply(folders)
     else:
         st.info("'폴더 목록 갱신' 버튼을 클릭하여 폴더 목록을 불러와주세요.")
 
@@ -382,6 +388,27 @@ def show_grafana_settings():
         else:
             st.error("Grafana 연결에 실패했습니다. 설정을 확인해주세요.")
 
+    # API 요청 설정
+    with st.expander("API 요청 설정", expanded=False):
+        max_workers, requests_per_second = get_pager_settings()
+
+        with st.form("grafana_pager_form"):
+            new_max_workers = st.number_input("최대 동시 요청 수", min_value=1, max_value=16, value=max_workers)
+            new_requests_per_second = st.number_input("초당 최대 요청 수", min_value=1.0, max_value=50.0, value=requests_per_second, step=1.0)
+            submit = st.form_submit_button("저장")
+
+            if submit:
+                if save_module_config(MODULE_ID, {
+                    "max_workers": int(new_max_workers),
+                    "requests_per_second": float(new_requests_per_second)
+                }):
+                    st.success("API 요청 설정이 저장되었습니다.")
+                else:
+                    st.error("API 요청 설정 저장에 실패했습니다.")
+
+    # API 캐시 상태
+    show_cache_status(MODULE_ID)
+
 def check_grafana_connection():
     """Grafana 연결 테스트"""
     try:
@@ -394,7 +421,7 @@ def check_grafana_connection():
         headers = {"Authorization": f"Bearer {grafana_token}"}
         url = f"{grafana_url}/api/org"
         
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, module_id=MODULE_ID, max_retries=0, headers=headers)
         response.raise_for_status()
         
         return True
@@ -402,6 +429,7 @@ def check_grafana_connection():
         st.error(f"Grafana 연결 실패: {e}")
         return False
 
+@ttl_cache(MODULE_ID, "teams", "GRAFANA_URL")
 def get_all_teams():
     """Grafana 팀 목록 조회"""
     try:
@@ -414,7 +442,7 @@ def get_all_teams():
         headers = {"Authorization": f"Bearer {grafana_token}"}
         url = f"{grafana_url}/api/teams/search?perpage=1000"
         
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, module_id=MODULE_ID, headers=headers)
         response.raise_for_status()
         
         return response.json()["teams"]
@@ -422,6 +450,7 @@ def get_all_teams():
         st.error(f"팀 목록 조회 실패: {e}")
         return []
 
+@ttl_cache(MODULE_ID, "team_details", "GRAFANA_URL")
 def get_team_details(team_id):
     """팀 상세 정보 조회"""
     try:
@@ -435,7 +464,7 @@ def get_team_details(team_id):
         auth = HTTPBasicAuth(grafana_username, grafana_password)
         url = f"{grafana_url}/api/teams/{team_id}"
         
-        response = requests.get(url, auth=auth)
+        response = http_client.get(url, module_id=MODULE_ID, auth=auth)
         response.raise_for_status()
         
         return response.json()
@@ -443,6 +472,7 @@ def get_team_details(team_id):
         st.error(f"팀 상세 정보 조회 실패: {e}")
         return None
 
+@ttl_cache(MODULE_ID, "team_members", "GRAFANA_URL")
 def get_team_members(team_id):
     """팀 멤버 목록 조회"""
     try:
@@ -456,7 +486,7 @@ def get_team_members(team_id):
         auth = HTTPBasicAuth(grafana_username, grafana_password)
         url = f"{grafana_url}/api/teams/{team_id}/members"
         
-        response = requests.get(url, auth=auth)
+        response = http_client.get(url, module_id=MODULE_ID, auth=auth)
         response.raise_for_status()
         
         return response.json()
@@ -477,14 +507,20 @@ def update_team_info(team_id, team_info):
         auth = HTTPBasicAuth(grafana_username, grafana_password)
         url = f"{grafana_url}/api/teams/{team_id}"
         
-        response = requests.put(url, auth=auth, json=team_info)
+        response = http_client.put(url, module_id=MODULE_ID, auth=auth, json=team_info)
         response.raise_for_status()
         
+        # 변경된 팀 정보가 캐시에 남지 않도록 무효화
+        api_cache.invalidate(MODULE_ID, "teams")
+        api_cache.invalidate(MODULE_ID, "team_details")
+        api_cache.invalidate(MODULE_ID, "team_directory")
+        
         return True
     except Exception as e:
         st.error(f"팀 정보 업데이트 실패: {e}")
         return False
 
+@ttl_cache(MODULE_ID, "folders", "GRAFANA_URL")
 def get_all_folders():
     """Grafana 폴더 목록 조회"""
     try:
@@ -498,7 +534,7 @@ def get_all_folders():
         auth = HTTPBasicAuth(grafana_username, grafana_password)
         url = f"{grafana_url}/api/folders"
         
-        response = requests.get(url, auth=auth)
+        response = http_client.get(url, module_id=MODULE_ID, auth=auth)
         response.raise_for_status()
         
         return response.json()
@@ -506,8 +542,54 @@ def get_all_folders():
         st.error(f"폴더 목록 조회 실패: {e}")
         return []
 
-def get_nested_folders(parent_uid=None):
-    """중첩된 폴더 목록 조회"""
+def get_pager_settings():
+    """Grafana API 병렬 조회 설정 (동시 요청 수, 초당 요청 수) 로드"""
+    return service_api.get_pager_settings(MODULE_ID)
+
+def fetch_child_folders(parent_uid=None):
+    """하위 폴더 목록 조회 (폴더 트리 워커 스레드에서 호출되므로 실패 시 예외 발생)"""
+    grafana_url = os.environ.get("GRAFANA_URL")
+    auth = HTTPBasicAuth(os.environ.get("GRAFANA_USERNAME"), os.environ.get("GRAFANA_PASSWORD"))
+    params = {"parentUid": parent_uid} if parent_uid else None
+    
+    response = http_client.get(f"{grafana_url}/api/folders", module_id=MODULE_ID, auth=auth, params=params)
+    response.raise_for_status()
+    
+    return response.json()
+
+def load_folder_tree():
+    """중첩 폴더를 포함한 전체 폴더 트리 조회 (캐시 사용)
+
+    레벨 단위로 하위 폴더를 동시에 조회합니다. 일부 폴더의 하위 폴더를 조회하지 못한
+    트리는 캐시하지 않고 다음 조회 시 다시 불러옵니다.
+
+    Returns:
+        tuple: (너비 우선 순서의 폴더 목록, 하위 폴더를 조회하지 못한 폴더 목록)
+    """
+    ttl = get_ttl(MODULE_ID, "folder_tree")
+    key = (MODULE_ID, os.environ.get("GRAFANA_URL", ""), "folder_tree", (), ())
+    
+    if ttl > 0:
+        cached = api_cache.get(key, ttl)
+        if cached is not None:
+            return cached, []
+    
+    max_workers, requests_per_second = get_pager_settings()
+    folders, failed = walk_folder_tree(fetch_child_folders, max_workers=max_workers, rate_limiter=TokenBucket(requests_per_second))
+    if ttl > 0 and folders and not failed:
+        api_cache.set(key, folders)
+    
+    return folders, failed
+
+def get_folder_tree():
+    """중첩 폴더를 포함한 전체 폴더 트리 조회
+
+    결과는 캐시되어 폴더 목록, 권한 조회, 전체 권한 내보내기가 한 번의 조회 결과를 함께 사용합니다.
+    하위 폴더를 조회하지 못한 폴더는 경고로 표시하고 나머지 트리를 반환합니다.
+
+    Returns:
+        list: 너비 우선 순서의 폴더 목록 (parentUid, depth, path 포함)
+    """
     try:
         grafana_url = os.environ.get("GRAFANA_URL")
         grafana_username = os.environ.get("GRAFANA_USERNAME")
@@ -516,34 +598,43 @@ def get_nested_folders(parent_uid=None):
         if not all([grafana_url, grafana_username, grafana_password]):
             return []
         
-        auth = HTTPBasicAuth(grafana_username, grafana_password)
+        folders, failed = load_folder_tree()
+        if failed:
+            failed_paths = [f"{folder['path']} ({folder['error']})" for folder in failed]
+            st.warning(f"{len(failed)}개 폴더의 하위 폴더를 조회하지 못했습니다: {', '.join(failed_paths)}")
         
-        # URL 구성
-        url = f"{grafana_url}/api/folders"
-        if parent_uid:
-            url += f"?parentUid={parent_uid}"
-        
-        response = requests.get(url, auth=auth)
-        response.raise_for_status()
-        
-        folders = response.json()
-        
-        # 재귀적으로 하위 폴더 조회
-        result = []
-        
-        for folder in folders:
-            result.append(folder)
-            try:
-                nested = get_nested_folders(folder["uid"])
-                result.extend(nested)
-            except Exception:
-                pass
-        
-        return result
+        return folders
     except Exception as e:
-        st.error(f"중첩 폴더 조회 실패: {e}")
+        st.error(f"폴더 트리 조회 실패: {e}")
         return []
 
+def get_nested_folders(parent_uid=None):
+    """중첩된 폴더 목록 조회 (parent_uid 아래의 모든 하위 폴더, 기본값: 전체 폴더)"""
+    folders = get_folder_tree()
+    if not parent_uid:
+        return folders
+    
+    # 너비 우선 순서라 부모 폴더가 항상 자식보다 먼저 나옴
+    ancestors = {parent_uid}
+    descendants = []
+    for folder in folders:
+        if folder["parentUid"] in ancestors:
+            descendants.append(folder)
+            ancestors.add(folder["uid"])
+    
+    return descendants
+
+@ttl_cache(MODULE_ID, "folder_permissions", "GRAFANA_URL")
+def fetch_folder_permissions(folder_uid):
+    """폴더 권한 조회 (전체 권한 수집 워커 스레드에서 호출되므로 실패 시 예외 발생)"""
+    grafana_url = os.environ.get("GRAFANA_URL")
+    auth = HTTPBasicAuth(os.environ.get("GRAFANA_USERNAME"), os.environ.get("GRAFANA_PASSWORD"))
+    
+    response = http_client.get(f"{grafana_url}/api/folders/{folder_uid}/permissions", module_id=MODULE_ID, auth=auth)
+    response.raise_for_status()
+    
+    return response.json()
+
 def get_folder_permissions(folder_uid):
     """폴더 권한 조회"""
     try:
@@ -554,50 +645,119 @@ def get_folder_permissions(folder_uid):
         if not all([grafana_url, grafana_username, grafana_password]):
             return []
         
-        auth = HTTPBasicAuth(grafana_username, grafana_password)
-        url = f"{grafana_url}/api/folders/{folder_uid}/permissions"
-        
-        response = requests.get(url, auth=auth)
-        response.raise_for_status()
-        
-        return response.json()
+        return fetch_folder_permissions(folder_uid)
     except Exception as e:
         st.error(f"폴더 권한 조회 실패: {e}")
         return []
 
+@ttl_cache(MODULE_ID, "team_directory", "GRAFANA_URL")
+def get_team_directory():
+    """전체 팀 목록을 한 번에 불러와 팀 ID -> 팀 정보 사전으로 반환
+
+    폴더 권한에 나오는 팀 이름을 팀마다 /api/teams/{id}로 조회하지 않고 이 사전에서 찾습니다.
+
+    Returns:
+        dict: {팀 ID: 팀 정보}
+    """
+    try:
+        grafana_url = os.environ.get("GRAFANA_URL")
+        grafana_username = os.environ.get("GRAFANA_USERNAME")
+        grafana_password = os.environ.get("GRAFANA_PASSWORD")
+        
+        if not all([grafana_url, grafana_username, grafana_password]):
+            return {}
+        
+        teams = service_api.fetch_grafana_pages("api/teams/search", "teams")
+        
+        return {team["id"]: team for team in teams}
+    except Exception as e:
+        st.error(f"팀 목록 조회 실패: {e}")
+        return {}
+
+def get_team_name(team_id, team_directory, permission=None):
+    """팀 디렉터리에서 팀 이름 조회 (디렉터리에 없으면 권한 항목의 team 필드, 그것도 없으면 "Team {ID}")"""
+    team = team_directory.get(team_id)
+    if team:
+        return team["name"]
+    
+    if permission and permission.get("team"):
+        return permission["team"]
+    
+    return f"Team {team_id}"
+
+def fetch_all_folder_permissions(folder_uids):
+    """여러 폴더의 권한을 동시에 조회
+
+    Returns:
+        tuple: ({폴더 UID: 권한 목록}, {폴더 UID: 조회 실패 예외})
+    """
+    max_workers, requests_per_second = get_pager_settings()
+    rate_limiter = TokenBucket(requests_per_second)
+    
+    def fetch(folder_uid):
+        rate_limiter.acquire()
+        try:
+            return fetch_folder_permissions(folder_uid), None
+        except Exception as e:
+            return [], e
+    
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        results = dict(zip(folder_uids, executor.map(fetch, folder_uids)))
+    
+    permissions = {uid: perms for uid, (perms, error) in results.items() if not error}
+    errors = {uid: error for uid, (perms, error) in results.items() if error}
+    return permissions, errors
+
+def plan_folder_permission_changes(desired):
+    """목표 상태를 서버의 현재 권한과 비교해 변경 계획 생성
+
+    권한 적용 API는 폴더 권한 전체를 교체하므로, 캐시된 권한으로 계획하면 그 사이 추가된
+    권한이 지워질 수 있습니다. 항상 캐시를 비우고 현재 권한을 새로 조회합니다.
+
+    Returns:
+        tuple: (변경 계획, 현재 권한을 조회하지 못한 폴더 오류 메시지 목록)
+    """
+    api_cache.invalidate(MODULE_ID, "folder_permissions")
+    current, fetch_errors = fetch_all_folder_permissions(list(desired))
+    
+    plan = plan_permission_changes({uid: teams for uid, teams in desired.items() if uid in current}, current)
+    return plan, [f"폴더 {uid}: 현재 권한 조회 실패 ({error})" for uid, error in fetch_errors.items()]
+
 def collect_all_folder_permissions(folders):
-    """모든 폴더의 권한 정보 수집"""
+    """모든 폴더의 권한 정보 수집
+
+    팀 이름은 한 번 불러온 팀 디렉터리에서 찾고, 폴더별 권한 조회는 동시에 보냅니다.
+    일부 폴더 조회에 실패해도 나머지 폴더의 권한은 수집합니다.
+    """
     try:
+        team_directory = get_team_directory()
+        all_perms, errors = fetch_all_folder_permissions([folder["uid"] for folder in folders])
+        
         permissions_data = []
+        failed_folders = []
         
         for folder in folders:
-            folder_uid = folder["uid"]
-            folder_title = folder["title"]
-            
-            # 폴더 권한 조회
-            perms = get_folder_permissions(folder_uid)
+            if folder["uid"] in errors:
+                failed_folders.append(f"{folder['title']} ({errors[folder['uid']]})")
+                continue
             
             # 팀 권한만 필터링
-            team_perms = [p for p in perms if p["type"] == "team"]
+            team_perms = [p for p in all_perms[folder["uid"]] if p.get("teamId")]
             
             for perm in team_perms:
-                team_id = perm.get("teamId")
+                team_id = perm["teamId"]
                 
-                if team_id:
-                    # 팀 정보 조회
-                    team_info = get_team_details(team_id)
-                    team_name = team_info.get("name", f"Team {team_id}") if team_info else f"Team {team_id}"
-                    
-                    permissions_data.append({
-                        "folder_uid": folder_uid,
-                        "folder_title": folder_title,
-                        "team_id": team_id,
-                        "team_name": team_name,
-                        "permission": get_permission_name(perm["permission"]),
-                        "parent_folder": folder.get("parentUid", "")
-                    })
-            
-            time.sleep(0.2)  # API 요청 제한 방지
+                permissions_data.append({
+                    "folder_uid": folder["uid"],
+                    "folder_title": folder["title"],
+                    "team_id": team_id,
+                    "team_name": get_team_name(team_id, team_directory, perm),
+                    "permission": get_permission_name(perm["permission"]),
+                    "parent_folder": folder.get("parentUid", "")
+                })
+        
+        if failed_folders:
+            st.warning(f"{len(failed_folders)}개 폴더의 권한 조회에 실패했습니다: {', '.join(failed_folders)}")
         
         # 데이터프레임 생성
         if permissions_data:
@@ -608,6 +768,94 @@ def collect_all_folder_permissions(folders):
         st.error(f"폴더 권한 수집 실패: {e}")
         return None
 
+def update_folder_permissions(folder_uid, items):
+    """폴더 권한 목록 전체 교체 (일괄 적용 워커 스레드에서 호출되므로 실패 시 예외 발생)"""
+    grafana_url = os.environ.get("GRAFANA_URL")
+    auth = HTTPBasicAuth(os.environ.get("GRAFANA_USERNAME"), os.environ.get("GRAFANA_PASSWORD"))
+    
+    response = http_client.post(f"{grafana_url}/api/folders/{folder_uid}/permissions", module_id=MODULE_ID, auth=auth, json={"items": items})
+    response.raise_for_status()
+
+def show_bulk_permission_apply(folders):
+    """폴더 권한 일괄 적용 화면 (목표 권한 CSV 업로드 -> 변경 미리보기 -> 적용)"""
+    st.subheader("폴더 권한 일괄 적용")
+    st.caption("folder_uid, team_id 또는 team_name, permission(Viewer/Editor/Admin/None) 컬럼의 CSV를 업로드하세요. "
+               "'모든 폴더 권한 조회'로 내려받은 CSV를 수정해 사용할 수 있습니다. "
+               "CSV에 없는 팀 권한은 유지되고, None은 해당 팀 권한을 삭제합니다(빈 칸은 오류). "
+               "현재 권한은 미리보기와 적용 직전에 서버에서 다시 조회해 비교합니다.")
+    
+    uploaded_file = st.file_uploader("목표 권한 CSV 파일을 업로드하세요", type=["csv"], key="folder_permission_uploader")
+    if not uploaded_file:
+        return
+    
+    try:
+        # 폴더 UID가 숫자로 바뀌지 않도록 모든 컬럼을 문자열로 읽음
+        desired_df = pd.read_csv(uploaded_file, dtype=str)
+    except Exception as e:
+        st.error(f"CSV 파일을 읽을 수 없습니다: {e}")
+        return
+    
+    missing_fields = [field for field in REQUIRED_COLUMNS if field not in desired_df.columns]
+    if not any(field in desired_df.columns for field in TEAM_COLUMNS):
+        missing_fields.append(" 또는 ".join(TEAM_COLUMNS))
+    
+    if missing_fields:
+        st.error(f"CSV 파일에 필수 필드가 누락되었습니다: {', '.join(missing_fields)}")
+        return
+    
+    upload_key = (uploaded_file.name, uploaded_file.size)
+    
+    if st.button("변경 미리보기 (dry-run)"):
+        with st.spinner("현재 폴더 권한과 비교하는 중입니다..."):
+            desired, errors = load_desired_state(desired_df, get_team_directory())
+            plan, fetch_errors = plan_folder_permission_changes(desired)
+            
+            st.session_state.folder_permission_plan = {
+                "upload": upload_key,
+                "desired": desired,
+                "plan": plan,
+                "errors": errors + fetch_errors
+            }
+    
+    # 다른 파일을 올렸으면 이전 미리보기는 사용하지 않음
+    saved = st.session_state.get("folder_permission_plan")
+    if not saved or saved["upload"] != upload_key:
+        return
+    
+    if saved["errors"]:
+        st.warning(f"{len(saved['errors'])}개 항목은 적용 대상에서 제외됩니다.\n\n" + "\n".join(f"- {error}" for error in saved["errors"]))
+    
+    plan = saved["plan"]
+    if not plan:
+        st.info("변경할 권한이 없습니다. 현재 권한이 목표 상태와 같습니다.")
+        return
+    
+    folder_titles = {folder["uid"]: folder.get("path", folder["title"]) for folder in folders}
+    st.write(f"{len(plan)}개 폴더에서 {sum(len(change['changes']) for change in plan)}개 팀 권한이 변경됩니다.")
+    st.dataframe(pd.DataFrame(format_plan(plan, get_team_directory(), folder_titles)))
+    
+    if st.button("변경 적용", type="primary"):
+        with st.spinner(f"{len(plan)}개 폴더에 권한을 적용하는 중입니다..."):
+            # 미리보기 이후 바뀐 권한을 덮어쓰지 않도록 현재 권한을 다시 조회해 계획을 새로 만듦
+            plan, fetch_errors = plan_folder_permission_changes(saved["desired"])
+            max_workers, requests_per_second = get_pager_settings()
+            results = apply_permission_changes(plan, update_folder_permissions, max_workers=max_workers, rate_limiter=TokenBucket(requests_per_second))
+        
+        # 적용한 권한이 다음 비교에 반영되도록 캐시 무효화
+        api_cache.invalidate(MODULE_ID, "folder_permissions")
+        del st.session_state.folder_permission_plan
+        
+        if fetch_errors:
+            st.error(f"{len(fetch_errors)}개 폴더는 현재 권한을 다시 조회하지 못해 적용하지 않았습니다.\n\n" + "\n".join(f"- {error}" for error in fetch_errors))
+        if not results and not fetch_errors:
+            st.info("변경할 권한이 없습니다. 현재 권한이 이미 목표 상태와 같습니다.")
+        
+        failed = {uid: error for uid, error in results.items() if error}
+        if len(failed) < len(results):
+            st.success(f"{len(results) - len(failed)}개 폴더에 권한을 적용했습니다.")
+        if failed:
+            st.error(f"{len(failed)}개 폴더 적용 실패:\n\n" + "\n".join(f"- {folder_titles.get(uid, uid)}: {error}" for uid, error in failed.items()))
+
 def get_permission_name(permission):
     """권한 코드를 이름으로 변환"""
     if permission == 1:
@@ -697,7 +945,7 @@ def get_grafana_version():
         headers = {"Authorization": f"Bearer {grafana_token}"}
         url = f"{grafana_url}/api/health"
         
-        response = requests.get(url, headers=headers, timeout=5)
+        response = http_client.get(url, module_id=MODULE_ID, max_retries=0, headers=headers, timeout=5)
         response.raise_for_status()
         
         health_info = response.json()
@@ -2,9 +2,13 @@ import streamlit as st
 import ldap
 import os
 from datetime import datetime, timedelta
+import time
 import pandas as pd
 from pathlib import Path
 from modules.utils.version import show_version_info, save_repo_url, load_repo_url, get_latest_version, compare_versions
+from modules.utils.leaver_audit import AUDIT_SYSTEMS, REPORT_COLUMNS, run_leaver_audit
+from modules.utils.ldap_pool import ldap_pool, DEFAULT_POOL_SIZE, DEFAULT_PAGE_SIZE, DEFAULT_MAX_ENTRIES
+from modules.utils.config import get_module_setting, save_module_config
 
 # 모듈 ID와 버전 정보
 MODULE_ID = "ldap_manager"
@@ -91,15 +95,22 @@ def show_employee_exit_management():
     # 퇴사자 조회 버튼
     if st.button("퇴사자 조회"):
         with st.spinner("퇴사자 정보를 조회 중입니다..."):
-            exited_users = get_exited_users(start_date, end_date, inactive_only=show_inactive_only, search_ou=search_ou)
+            progress = st.empty()
+            exited_users = get_exited_users(start_date, end_date, inactive_only=show_inactive_only, search_ou=search_ou,
+                                            on_progress=lambda count: progress.caption(f"{count}건 조회됨..."))
+            progress.empty()
             
             if not exited_users:
                 st.info("조회된 퇴사자가 없습니다.")
+                st.session_state.pop("ldap_exited_users", None)
             else:
                 # 사원 구분별 필터링
                 if employee_type != "전체":
                     exited_users = filter_employees_by_type(exited_users, employee_type)
                 
+                # 서비스 계정 감사에 사용하도록 세션 상태에 저장
+                st.session_state.ldap_exited_users = exited_users
+                
                 if not exited_users:
                     st.info(f"조회된 {employee_type} 퇴사자가 없습니다.")
                 else:
@@ -123,7 +134,61 @@ def show_employee_exit_management():
                     )
                     
                     # 안내 메시지 추가
-                    st.info("다운로드한 CSV 파일을 GitLab, Redmine, Grafana 관리 모듈에서 사용하여 서비스 권한을 확인할 수 있습니다.")
+                    st.info("아래 '서비스 계정 감사'에서 GitLab, Redmine, Grafana 계정과 권한을 한 번에 확인할 수 있습니다.")
+    
+    # 조회한 퇴사자의 서비스 계정 감사
+    if st.session_state.get("ldap_exited_users"):
+        show_leaver_audit(st.session_state.ldap_exited_users)
+
+def show_leaver_audit(exited_users):
+    """퇴사자의 GitLab, Redmine, Grafana 계정 통합 감사 화면"""
+    st.write("### 서비스 계정 감사")
+    st.caption(f"조회된 퇴사자 {len(exited_users)}명의 서비스 계정과 권한을 동시에 확인합니다.")
+    
+    systems = st.multiselect("감사 대상 서비스", AUDIT_SYSTEMS, default=AUDIT_SYSTEMS, key="leaver_audit_systems")
+    
+    if st.button("서비스 계정 감사", key="run_leaver_audit"):
+        with st.spinner("GitLab, Redmine, Grafana 계정을 확인하는 중입니다..."):
+            started_at = time.monotonic()
+            rows, summary = run_leaver_audit(exited_users, systems)
+            elapsed = time.monotonic() - started_at
+        
+        # 서비스별 결과 요약
+        columns = st.columns(max(1, len(summary)))
+        for column, (system, result) in zip(columns, summary.items()):
+            with column:
+                st.metric(system, f"{result['accounts']}개 계정" if result["status"] == "완료" else result["status"])
+                if result["status"] == "실패":
+                    st.error(f"{system} 점검 실패: {result['message']}")
+                elif result["status"] == "건너뜀":
+                    st.info(result["message"])
+                elif result["message"]:
+                    st.warning(result["message"])
+        
+        st.caption(f"소요 시간: {elapsed:.1f}초")
+        
+        if not rows:
+            st.success("퇴사자와 일치하는 서비스 계정이 없습니다.")
+            return
+        
+        df = pd.DataFrame(rows, columns=REPORT_COLUMNS)
+        
+        # 활성 계정 또는 권한이 남아 있는 계정 알림
+        remaining = df[df["계정상태"].eq("활성") | (df["권한수"] > 0)]
+        if not remaining.empty:
+            st.warning(f"활성 상태이거나 권한이 남아 있는 퇴사자 계정이 {len(remaining)}개 있습니다!")
+        
+        st.dataframe(df)
+        
+        # CSV 다운로드 버튼 (UTF-8 BOM 추가)
+        csv = '\ufeff' + df.to_csv(index=False)
+        st.download_button(
+            label="서비스 계정 감사 결과 CSV 다운로드",
+            data=csv,
+            file_name=f"퇴사자_서비스계정_감사_{datetime.now().strftime('%Y%m%d')}.csv",
+            mime="text/csv",
+            key="download_leaver_audit"
+        )
 
 def show_user_search():
     """사용자 검색 화면"""
@@ -146,7 +211,10 @@ def show_user_search():
     # 검색 버튼
     if st.button("검색") and search_term:
         with st.spinner("사용자를 검색 중입니다..."):
-            users = search_users(search_term, account_status)
+            progress = st.empty()
+            users = search_users(search_term, account_status,
+                                 on_progress=lambda count: progress.caption(f"{count}건 조회됨..."))
+            progress.empty()
             
             if not users:
                 st.info("검색 결과가 없습니다.")
@@ -232,6 +300,34 @@ def show_ldap_settings():
         else:
             st.error("LDAP 연결에 실패했습니다. 설정을 확인해주세요.")
     
+    # 검색 및 연결 풀 설정
+    with st.expander("검색 설정", expanded=False):
+        page_size, max_entries = get_search_settings()
+        pool_size = int(get_module_setting(MODULE_ID, "pool_size", DEFAULT_POOL_SIZE))
+        
+        with st.form("ldap_search_settings_form"):
+            new_page_size = st.number_input("페이지 크기", min_value=50, max_value=1000, value=page_size, step=50,
+                                            help="페이지 검색(RFC 2696) 한 번에 받을 항목 수. AD의 MaxPageSize(기본 1000)보다 클 수 없습니다.")
+            new_max_entries = st.number_input("최대 조회 건수", min_value=0, value=max_entries, step=1000,
+                                              help="검색 한 번에 받을 최대 항목 수 (0이면 제한 없음)")
+            new_pool_size = st.number_input("연결 풀 크기", min_value=1, max_value=16, value=pool_size)
+            submit = st.form_submit_button("저장")
+            
+            if submit:
+                if save_module_config(MODULE_ID, {
+                    "page_size": int(new_page_size),
+                    "max_entries": int(new_max_entries),
+                    "pool_size": int(new_pool_size)
+                }):
+                    st.success("검색 설정이 저장되었습니다.")
+                else:
+                    st.error("검색 설정 저장에 실패했습니다.")
+    
+    # LDAP 연결 풀 상태 (모든 세션이 바인드된 연결을 공유)
+    pool_status = ldap_pool.get_status()
+    st.caption(f"연결 풀: 유휴 연결 {pool_status['idle']}개, 새 바인드 {pool_status['created']}회, "
+               f"재사용 {pool_status['reused']}회, 폐기 {pool_status['discarded']}회")
+    
     # LDAP 서버 정보 섹션
     st.subheader("LDAP 서버 정보")
     
@@ -308,9 +404,9 @@ def check_ldap_connection():
         if not all([ldap_server, ldap_user_dn, ldap_password]):
             return False
         
-        conn = ldap.initialize(ldap_server)
-        conn.simple_bind_s(ldap_user_dn, ldap_password)
-        conn.unbind_s()
+        # 풀에서 바인드된 연결을 꺼낼 수 있으면 연결 가능 (최근 사용한 연결은 추가 요청 없이 재사용)
+        with ldap_pool.connection():
+            pass
         return True
     except Exception as e:
         st.error(f"LDAP 연결 실패: {e}")
@@ -326,13 +422,8 @@ def get_ldap_version():
         if not all([ldap_server, ldap_user_dn, ldap_password]):
             return None
         
-        # LDAP 연결
-        conn = ldap.initialize(ldap_server)
-        conn.simple_bind_s(ldap_user_dn, ldap_password)
-        
         # 루트 DSE 조회
-        result = conn.search_s("", ldap.SCOPE_BASE, "(objectClass=*)", ["*", "+"])
-        conn.unbind_s()
+        result = ldap_pool.search_s("", ldap.SCOPE_BASE, "(objectClass=*)", ["*", "+"])
         
         if result:
             dn, attrs = result[0]
@@ -353,7 +444,31 @@ def get_ldap_version():
         st.error(f"LDAP 버전 조회 실패: {e}")
         return None
 
-def get_exited_users(start_date, end_date, inactive_only=True, search_ou=""):
+def get_search_settings():
+    """LDAP 페이지 검색 설정 (페이지 크기, 최대 항목 수)"""
+    page_size = int(get_module_setting(MODULE_ID, "page_size", DEFAULT_PAGE_SIZE))
+    max_entries = int(get_module_setting(MODULE_ID, "max_entries", DEFAULT_MAX_ENTRIES))
+    return page_size, max_entries
+
+def search_entries(base_dn, ldap_filter, attrs, on_progress=None):
+    """하위 트리 페이지 검색 결과를 (dn, 속성) 단위로 반환하는 제너레이터
+
+    서버 크기 제한(AD 기본 1000건)과 관계없이 설정된 최대 항목 수까지 조회하며,
+    최대 항목 수에 도달하면 경고를 표시합니다.
+    """
+    page_size, max_entries = get_search_settings()
+    count = 0
+    
+    for page in ldap_pool.paged_search(base_dn, ldap.SCOPE_SUBTREE, ldap_filter, attrs, page_size, max_entries):
+        count += len(page)
+        if on_progress:
+            on_progress(count)
+        yield from page
+    
+    if max_entries and count >= max_entries:
+        st.warning(f"최대 조회 건수({max_entries}건)에 도달하여 일부 결과만 표시합니다. 기간이나 검색 범위를 좁혀주세요.")
+
+def get_exited_users(start_date, end_date, inactive_only=True, search_ou="", on_progress=None):
     """퇴사자 목록 조회
     LDAP에서 비활성화된 계정 또는 퇴사일이 시작일과 종료일 사이인 사용자 목록 반환
     
@@ -362,6 +477,7 @@ def get_exited_users(start_date, end_date, inactive_only=True, search_ou=""):
         end_date (datetime.date): 종료일
         inactive_only (bool): 비활성화된 계정만 조회할지 여부
         search_ou (str): 특정 OU에서만 검색할 경우 지정
+        on_progress (callable, optional): 페이지를 받을 때마다 지금까지 받은 항목 수를 받는 콜백
     
     Returns:
         list: 퇴사자 목록 (dict 형태)
@@ -370,20 +486,14 @@ def get_exited_users(start_date, end_date, inactive_only=True, search_ou=""):
     ldap_type = os.environ.get("LDAP_TYPE", "openldap").lower()
     
     if ldap_type == "activedirectory":
-        return get_exited_users_ad(start_date, end_date, inactive_only, search_ou)
+        return get_exited_users_ad(start_date, end_date, inactive_only, search_ou, on_progress)
     else:
-        return get_exited_users_openldap(start_date, end_date, inactive_only, search_ou)
+        return get_exited_users_openldap(start_date, end_date, inactive_only, search_ou, on_progress)
 
-def get_exited_users_openldap(start_date, end_date, inactive_only=True, search_ou=""):
+def get_exited_users_openldap(start_date, end_date, inactive_only=True, search_ou="", on_progress=None):
     """OpenLDAP 방식의 퇴사자 목록 조회"""
     try:
-        ldap_server = os.environ.get("LDAP_SERVER")
         ldap_base_dn = os.environ.get("LDAP_BASE_DN")
-        ldap_user_dn = os.environ.get("LDAP_USER_DN")
-        ldap_password = os.environ.get("LDAP_PASSWORD")
-        
-        conn = ldap.initialize(ldap_server)
-        conn.simple_bind_s(ldap_user_dn, ldap_password)
         
         # 검색 베이스 DN 설정
         base_dn = search_ou if search_ou else ldap_base_dn
@@ -401,9 +511,8 @@ def get_exited_users_openldap(start_date, end_date, inactive_only=True, search_o
         # LDAP 검색 속성
         attrs = ["uid", "cn", "mail", "employeeNumber", "exitDate", "department", "shadowExpire"]
         
-        # LDAP 검색
-        result = conn.search_s(base_dn, ldap.SCOPE_SUBTREE, ldap_filter, attrs)
-        conn.unbind_s()
+        # LDAP 페이지 검색 (페이지를 받는 대로 처리)
+        result = search_entries(base_dn, ldap_filter, attrs, on_progress)
         
         # 검색 결과 처리
         exited_users = []
@@ -425,16 +534,10 @@ def get_exited_users_openldap(start_date, end_date, inactive_only=True, search_o
         st.error(f"퇴사자 조회 실패: {e}")
         return []
 
-def get_exited_users_ad(start_date, end_date, inactive_only=True, search_ou=""):
+def get_exited_users_ad(start_date, end_date, inactive_only=True, search_ou="", on_progress=None):
     """Active Directory 방식의 퇴사자 목록 조회"""
     try:
-        ldap_server = os.environ.get("LDAP_SERVER")
         ldap_base_dn = os.environ.get("LDAP_BASE_DN")
-        ldap_user_dn = os.environ.get("LDAP_USER_DN")
-        ldap_password = os.environ.get("LDAP_PASSWORD")
-        
-        conn = ldap.initialize(ldap_server)
-        conn.simple_bind_s(ldap_user_dn, ldap_password)
         
         # 검색 베이스 DN 설정
         base_dn = search_ou if search_ou else ldap_base_dn
@@ -464,9 +567,8 @@ def get_exited_users_ad(start_date, end_date, inactive_only=True, search_ou=""):
         # LDAP 검색 속성
         attrs = ["sAMAccountName", "displayName", "mail", "employeeID", "whenChanged", "department", "userAccountControl"]
         
-        # LDAP 검색
-        result = conn.search_s(base_dn, ldap.SCOPE_SUBTREE, ldap_filter, attrs)
-        conn.unbind_s()
+        # LDAP 페이지 검색 (페이지를 받는 대로 처리)
+        result = search_entries(base_dn, ldap_filter, attrs, on_progress)
         
         # 검색 결과 처리
         exited_users = []
@@ -498,13 +600,14 @@ def get_exited_users_ad(start_date, end_date, inactive_only=True, search_ou=""):
         st.write(f"예외 상세 정보: {str(e)}")
         return []
 
-def search_users(search_term, account_status="전체"):
+def search_users(search_term, account_status="전체", on_progress=None):
     """사용자 검색
     LDAP에서 검색어와 일치하는 사용자 목록 반환
     
     Args:
         search_term (str): 검색어
         account_status (str): 계정 상태 필터 ('전체', '활성', '비활성')
+        on_progress (callable, optional): 페이지를 받을 때마다 지금까지 받은 항목 수를 받는 콜백
     
     Returns:
         list: 사용자 목록 (dict 형태)
@@ -513,20 +616,14 @@ def search_users(search_term, account_status="전체"):
     ldap_type = os.environ.get("LDAP_TYPE", "openldap").lower()
     
     if ldap_type == "activedirectory":
-        return search_users_ad(search_term, account_status)
+        return search_users_ad(search_term, account_status, on_progress)
     else:
-        return search_users_openldap(search_term, account_status)
+        return search_users_openldap(search_term, account_status, on_progress)
 
-def search_users_openldap(search_term, account_status="전체"):
+def search_users_openldap(search_term, account_status="전체", on_progress=None):
     """OpenLDAP 방식의 사용자 검색"""
     try:
-        ldap_server = os.environ.get("LDAP_SERVER")
         ldap_base_dn = os.environ.get("LDAP_BASE_DN")
-        ldap_user_dn = os.environ.get("LDAP_USER_DN")
-        ldap_password = os.environ.get("LDAP_PASSWORD")
-        
-        conn = ldap.initialize(ldap_server)
-        conn.simple_bind_s(ldap_user_dn, ldap_password)
         
         # 계정 상태 필터 구성
         status_filter = ""
@@ -546,9 +643,8 @@ def search_users_openldap(search_term, account_status="전체"):
         # LDAP 검색 속성
         attrs = ["uid", "cn", "mail", "employeeNumber", "department", "title", "shadowExpire"]
         
-        # LDAP 검색
-        result = conn.search_s(ldap_base_dn, ldap.SCOPE_SUBTREE, ldap_filter, attrs)
-        conn.unbind_s()
+        # LDAP 페이지 검색 (페이지를 받는 대로 처리)
+        result = search_entries(ldap_base_dn, ldap_filter, attrs, on_progress)
         
         # 검색 결과 처리
         users = []
@@ -575,16 +671,10 @@ def search_users_openldap(search_term, account_status="전체"):
         st.error(f"사용자 검색 실패: {e}")
         return []
 
-def search_users_ad(search_term, account_status="전체"):
+def search_users_ad(search_term, account_status="전체", on_progress=None):
     """Active Directory 방식의 사용자 검색"""
     try:
-        ldap_server = os.environ.get("LDAP_SERVER")
         ldap_base_dn = os.environ.get("LDAP_BASE_DN")
-        ldap_user_dn = os.environ.get("LDAP_USER_DN")
-        ldap_password = os.environ.get("LDAP_PASSWORD")
-        
-        conn = ldap.initialize(ldap_server)
-        conn.simple_bind_s(ldap_user_dn, ldap_password)
         
         # 계정 상태 필터 구성
         status_filter = ""
@@ -607,9 +697,8 @@ def search_users_ad(search_term, account_status="전체"):
         # LDAP 검색 속성
         attrs = ["sAMAccountName", "displayName", "mail", "employeeID", "department", "title", "userAccountControl"]
         
-        # LDAP 검색
-        result = conn.search_s(ldap_base_dn, ldap.SCOPE_SUBTREE, ldap_filter, attrs)
-        conn.unbind_s()
+        # LDAP 페이지 검색 (페이지를 받는 대로 처리)
+        result = search_entries(ldap_base_dn, ldap_filter, attrs, on_progress)
         
         # 검색 결과 처리
         users = []
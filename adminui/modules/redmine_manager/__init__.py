@@ -1,16 +1,25 @@
 import streamlit as st
-import requests
 import pandas as pd
 import os
 from datetime import datetime, timedelta
-import time
+from concurrent.futures import ThreadPoolExecutor
 from modules.utils.version import show_version_info, save_repo_url, load_repo_url
+from modules.utils.cache import ttl_cache, show_cache_status, api_cache, get_ttl
+from modules.utils.config import save_module_config
+from modules.utils.pager import TokenBucket
+from modules.utils import http_client
+from modules.utils.identity import IdentityIndex, match_identities, format_match_keys
+from modules.utils import service_api
+from modules.utils.service_api import fetch_redmine_pages, fetch_redmine_user_memberships, get_redmine_employee_id
 
 # 모듈 ID와 버전 정보
 MODULE_ID = "redmine_manager"
 VERSION = "v0.1.6"
 DEFAULT_REPO_URL = "https://github.com/redmine/redmine/tags"
 
+# 사용자별 멤버십(users/{id}.json?include=memberships)에 나오는 프로젝트 상태 (1: 활성, 5: 종료)
+PROJECT_STATUSES = [1, 5]
+
 def check_redmine_connection():
     """Redmine 연결 테스트"""
     try:
@@ -23,7 +32,7 @@ def check_redmine_connection():
         headers = {"X-Redmine-API-Key": redmine_api_key}
         url = f"{redmine_url}/users/current.json"
         
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, module_id=MODULE_ID, max_retries=0, headers=headers)
         response.raise_for_status()
         
         return True
@@ -31,6 +40,11 @@ def check_redmine_connection():
         st.error(f"Redmine 연결 실패: {e}")
         return False
 
+def get_pager_settings():
+    """Redmine API 병렬 조회 설정 (동시 요청 수, 초당 요청 수) 로드"""
+    return service_api.get_pager_settings(MODULE_ID)
+
+@ttl_cache(MODULE_ID, "projects", "REDMINE_URL")
 def get_all_projects():
     """모든 Redmine 프로젝트 목록 조회"""
     try:
@@ -40,29 +54,7 @@ def get_all_projects():
         if not all([redmine_url, redmine_api_key]):
             return []
         
-        headers = {"X-Redmine-API-Key": redmine_api_key}
-        projects = []
-        offset = 0
-        limit = 100
-        
-        while True:
-            url = f"{redmine_url}/projects.json?offset={offset}&limit={limit}&include=trackers,issue_categories"
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            data = response.json()
-            if not data["projects"]:
-                break
-            
-            projects.extend(data["projects"])
-            
-            if len(data["projects"]) < limit:
-                break
-            
-            offset += limit
-            time.sleep(0.5)  # API 요청 제한 방지
-        
-        return projects
+        return fetch_redmine_pages("projects.json", "projects", {"include": "trackers,issue_categories"})
     except Exception as e:
         st.error(f"프로젝트 목록 조회 실패: {e}")
         return []
@@ -79,7 +71,7 @@ def get_project_details(project_id):
         headers = {"X-Redmine-API-Key": redmine_api_key}
         url = f"{redmine_url}/projects/{project_id}.json?include=trackers,issue_categories"
         
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, module_id=MODULE_ID, headers=headers)
         response.raise_for_status()
         
         return response.json()["project"]
@@ -87,6 +79,7 @@ def get_project_details(project_id):
         st.error(f"프로젝트 상세 정보 조회 실패: {e}")
         return None
 
+@ttl_cache(MODULE_ID, "project_memberships", "REDMINE_URL")
 def get_project_memberships(project_id):
     """프로젝트 멤버십 목록 조회"""
     try:
@@ -99,7 +92,7 @@ def get_project_memberships(project_id):
         headers = {"X-Redmine-API-Key": redmine_api_key}
         url = f"{redmine_url}/projects/{project_id}/memberships.json"
         
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, module_id=MODULE_ID, headers=headers)
         response.raise_for_status()
         
         return response.json()["memberships"]
@@ -107,6 +100,7 @@ def get_project_memberships(project_id):
         st.error(f"프로젝트 멤버십 조회 실패: {e}")
         return []
 
+@ttl_cache(MODULE_ID, "issues", "REDMINE_URL")
 def get_project_issues(project_id):
     """프로젝트 이슈 목록 조회"""
     try:
@@ -116,33 +110,16 @@ def get_project_issues(project_id):
         if not all([redmine_url, redmine_api_key]):
             return []
         
-        headers = {"X-Redmine-API-Key": redmine_api_key}
-        issues = []
-        offset = 0
-        limit = 100
-        
-        while True:
-            url = f"{redmine_url}/issues.json?project_id={project_id}&offset={offset}&limit={limit}&status_id=*&include=status,priority,assigned_to"
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            data = response.json()
-            if not data["issues"]:
-                break
-            
-            issues.extend(data["issues"])
-            
-            if len(data["issues"]) < limit:
-                break
-            
-            offset += limit
-            time.sleep(0.5)  # API 요청 제한 방지
-        
-        return issues
+        return fetch_redmine_pages("issues.json", "issues", {
+            "project_id": project_id,
+            "status_id": "*",
+            "include": "status,priority,assigned_to"
+        })
     except Exception as e:
         st.error(f"프로젝트 이슈 조회 실패: {e}")
         return []
 
+@ttl_cache(MODULE_ID, "users", "REDMINE_URL")
 def get_all_users():
     """모든 Redmine 사용자 목록 조회"""
     try:
@@ -152,33 +129,12 @@ def get_all_users():
         if not all([redmine_url, redmine_api_key]):
             return []
         
-        headers = {"X-Redmine-API-Key": redmine_api_key}
-        users = []
-        offset = 0
-        limit = 100
-        
-        while True:
-            url = f"{redmine_url}/users.json?offset={offset}&limit={limit}&status=*&include=custom_fields"
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            data = response.json()
-            if not data["users"]:
-                break
-            
-            users.extend(data["users"])
-            
-            if len(data["users"]) < limit:
-                break
-            
-            offset += limit
-            time.sleep(0.5)  # API 요청 제한 방지
-        
-        return users
+        return fetch_redmine_pages("users.json", "users", {"status": "*", "include": "custom_fields"})
     except Exception as e:
         st.error(f"사용자 목록 조회 실패: {e}")
         return []
 
+@ttl_cache(MODULE_ID, "user_details", "REDMINE_URL")
 def get_user_details(user_id):
     """사용자 상세 정보 조회"""
     try:
@@ -191,7 +147,7 @@ def get_user_details(user_id):
         headers = {"X-Redmine-API-Key": redmine_api_key}
         url = f"{redmine_url}/users/{user_id}.json?include=memberships,groups,custom_fields"
         
-        response = requests.get(url, headers=headers)
+        response = http_client.get(url, module_id=MODULE_ID, headers=headers)
         response.raise_for_status()
         
         return response.json()["user"]
@@ -213,6 +169,140 @@ def get_user_memberships(user_id):
         st.error(f"사용자 멤버십 조회 실패: {e}")
         return []
 
+def fetch_membership_projects():
+    """멤버십 인덱스 대상 프로젝트 (활성 + 종료)
+
+    projects.json은 기본적으로 활성 프로젝트만 반환하지만, 사용자별 멤버십(users/{id}.json)에는
+    종료(closed)된 프로젝트도 포함되므로 상태별로 조회해 합칩니다. 보관(archived)된 프로젝트는
+    사용자별 멤버십에도 나오지 않으므로 제외합니다.
+    """
+    projects = {}
+    for status in PROJECT_STATUSES:
+        # status 필터를 지원하지 않는 서버는 활성 프로젝트를 다시 반환하므로 ID로 중복 제거
+        for project in fetch_redmine_pages("projects.json", "projects", {"status": status}):
+            projects.setdefault(project["id"], project)
+    return list(projects.values())
+
+def build_membership_index():
+    """전체 프로젝트 멤버십을 사용자별로 뒤집은 인덱스 생성
+
+    활성/종료 프로젝트의 /projects/{id}/memberships.json을 병렬로 조회합니다.
+
+    Returns:
+        tuple: ({사용자 ID: 멤버십 목록 (users/{id}.json?include=memberships와 같은 형식)}, 조회하지 못한 프로젝트 ID 목록)
+    """
+    projects = fetch_membership_projects()
+    max_workers, requests_per_second = get_pager_settings()
+    rate_limiter = TokenBucket(requests_per_second)
+    
+    def fetch(project):
+        try:
+            return fetch_redmine_pages(f"projects/{project['id']}/memberships.json", "memberships", rate_limiter=rate_limiter)
+        except Exception:
+            # 보관(archived)된 프로젝트 등 조회할 수 없는 프로젝트
+            return None
+    
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        results = list(executor.map(fetch, projects))
+    
+    index = {}
+    failed_ids = []
+    for project, memberships in zip(projects, results):
+        if memberships is None:
+            failed_ids.append(project["id"])
+            continue
+        
+        for membership in memberships:
+            # 그룹 멤버십은 소속 사용자별 멤버십(inherited 역할)으로도 내려오므로 사용자 항목만 사용
+            if "user" in membership:
+                index.setdefault(membership["user"]["id"], []).append({
+                    "id": membership["id"],
+                    "project": membership["project"],
+                    "roles": membership.get("roles", [])
+                })
+    
+    return index, failed_ids
+
+def get_membership_index():
+    """캐시된 멤버십 인덱스 조회
+
+    일부 프로젝트를 조회하지 못한 인덱스는 캐시하지 않고 다음 조회 시 다시 생성합니다.
+
+    Returns:
+        tuple: (멤버십 인덱스, 조회하지 못한 프로젝트 ID 목록)
+    """
+    ttl = get_ttl(MODULE_ID, "membership_index")
+    key = (MODULE_ID, os.environ.get("REDMINE_URL", ""), "membership_index", (), ())
+    
+    if ttl > 0:
+        cached = api_cache.get(key, ttl)
+        if cached is not None:
+            return cached, []
+    
+    index, failed_ids = build_membership_index()
+    if ttl > 0 and index and not failed_ids:
+        api_cache.set(key, index)
+    
+    return index, failed_ids
+
+def get_memberships_by_user(user_ids):
+    """여러 사용자의 프로젝트 멤버십을 한 번에 조회
+
+    사용자 수와 프로젝트 수 중 요청이 적게 드는 방식을 고릅니다.
+    - 사용자가 적으면 사용자별 멤버십을 병렬로 조회
+    - 프로젝트가 적으면 프로젝트별 멤버십을 병렬로 조회해 사용자별로 뒤집은 인덱스 사용
+    조회하지 못한 사용자/프로젝트는 경고로 표시합니다.
+
+    Args:
+        user_ids (list): 사용자 ID 목록
+
+    Returns:
+        dict: {사용자 ID: 멤버십 목록 (조회하지 못한 사용자는 None)}
+            일괄 조회 자체가 실패하면 빈 dict를 반환하므로, 결과에 없는 사용자도 조회 실패로 취급해야 함
+    """
+    try:
+        redmine_url = os.environ.get("REDMINE_URL")
+        redmine_api_key = os.environ.get("REDMINE_API_KEY")
+        
+        user_ids = list(dict.fromkeys(user_ids))
+        if not all([redmine_url, redmine_api_key]) or not user_ids:
+            return {}
+        
+        if len(user_ids) >= len(get_all_projects()):
+            index, failed_project_ids = get_membership_index()
+            if failed_project_ids:
+                st.warning(f"{len(failed_project_ids)}개 프로젝트의 멤버십을 조회하지 못했습니다: "
+                           f"{', '.join(map(str, failed_project_ids))}")
+            return {user_id: index.get(user_id, []) for user_id in user_ids}
+        
+        max_workers, requests_per_second = get_pager_settings()
+        rate_limiter = TokenBucket(requests_per_second)
+        
+        def fetch(user_id):
+            rate_limiter.acquire()
+            try:
+                return fetch_redmine_user_memberships(user_id), None
+            except Exception as e:
+                return None, e
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            results = list(executor.map(fetch, user_ids))
+        
+        memberships_by_user = {}
+        failed = []
+        for user_id, (memberships, error) in zip(user_ids, results):
+            memberships_by_user[user_id] = memberships
+            if error is not None:
+                failed.append(f"{user_id} ({error})")
+        
+        if failed:
+            st.warning(f"{len(failed)}명의 멤버십을 조회하지 못했습니다: {', '.join(failed)}")
+        
+        return memberships_by_user
+    except Exception as e:
+        st.error(f"사용자 멤버십 일괄 조회 실패: {e}")
+        return {}
+
 def get_inactive_projects(projects, inactive_days):
     """비활성 프로젝트 목록 조회"""
     try:
@@ -243,19 +333,17 @@ def get_inactive_projects(projects, inactive_days):
         return []
 
 def get_employee_id_from_user(user):
-    """사용자 객체에서 사번/ID 추출"""
-    # 사용자 정의 필드에서 사번/ID 찾기
-    if "custom_fields" in user:
-        for field in user["custom_fields"]:
-            if field.get("name", "").lower() in ["사번", "employeeid", "employee_id"]:
-                return field.get("value", "")
-    
-    # 만약 로그인 ID가 특정 패턴(예: A0, K1, K9 등 시작)이면 사번으로 간주
-    login = user.get("login", "")
-    if login.startswith(("A0", "K1", "K9")):
-        return login
-    
-    return ""
+    """사용자 객체에서 사번/ID 추출 (사용자 정의 필드 또는 사번 형식의 로그인 ID)"""
+    return get_redmine_employee_id(user)
+
+def build_identity_index(users):
+    """Redmine 사용자 목록의 퇴사자 매칭 인덱스 (사번, 이메일, 로그인ID, 이름)"""
+    return IdentityIndex(users, {
+        "employee_id": get_employee_id_from_user,
+        "email": lambda user: user.get("mail", ""),
+        "login": lambda user: user.get("login", ""),
+        "name": lambda user: f"{user['firstname']} {user['lastname']}"
+    })
 
 def update_env_file(new_values):
     """환경 변수 파일 업데이트
@@ -297,7 +385,7 @@ def get_redmine_version():
         # Redmine은 버전 정보를 제공하는 별도의 API가 없어 /users/current.json을 사용
         url = f"{redmine_url}/users/current.json"
         
-        response = requests.get(url, headers=headers, timeout=5)
+        response = http_client.get(url, module_id=MODULE_ID, max_retries=0, headers=headers, timeout=5)
         response.raise_for_status()
         
         # API 버전은 응답 헤더에서 가져올 수 있음
@@ -307,7 +395,7 @@ def get_redmine_version():
         try:
             # 일부 Redmine 인스턴스에서는 /info 경로에서 버전 정보 확인 가능
             info_url = f"{redmine_url}/admin/info"
-            info_response = requests.get(info_url, headers=headers, timeout=5)
+            info_response = http_client.get(info_url, module_id=MODULE_ID, max_retries=0, headers=headers, timeout=5)
             
             if info_response.status_code == 200 and "text/html" in info_response.headers.get("Content-Type", ""):
                 # HTML 응답에서 버전 추출 시도
@@ -728,43 +816,36 @@ def show_ex_employee_management():
                         else:
                             redmine_users = st.session_state.redmine_users
                         
-                        # 퇴사자와 일치하는 Redmine 계정 찾기
+                        # 퇴사자와 일치하는 Redmine 계정 찾기 (사번, 이메일, 로그인ID, 이름 인덱스 조인)
                         matched_accounts = []
                         
-                        for _, ex_employee in df_ex_employees.iterrows():
-                            # 이름, 이메일, 사번으로 매치
-                            employee_name = ex_employee["name"]
-                            employee_email = ex_employee["email"] if not pd.isna(ex_employee["email"]) else ""
-                            employee_id = ex_employee["employee_id"] if not pd.isna(ex_employee["employee_id"]) else ""
-                            
-                            for user in redmine_users:
-                                user_name = f"{user['firstname']} {user['lastname']}"
-                                user_email = user.get("mail", "")
-                                
-                                # 이름 또는 이메일로 일치하는 경우
-                                if (employee_name and user_name.lower() == employee_name.lower()) or \
-                                   (employee_email and user_email.lower() == employee_email.lower()):
-                                    
-                                    # 사용자의 프로젝트 멤버십 가져오기
-                                    memberships = get_user_memberships(user["id"])
-                                    
-                                    matched_accounts.append({
-                                        "퇴사자명": employee_name,
-                                        "퇴사자이메일": employee_email,
-                                        "사번/ID": employee_id,
-                                        "Redmine계정ID": user["id"],
-                                        "Redmine계정명": user_name,
-                                        "Redmine이메일": user_email,
-                                        "계정상태": "활성" if user["status"] == 1 else "잠금",
-                                        "마지막로그인": user.get("last_login_on", ""),
-                                        "프로젝트수": len(memberships)
-                                    })
+                        for ex_employee, user, keys in match_identities(df_ex_employees, build_identity_index(redmine_users)):
+                            matched_accounts.append({
+                                "퇴사자명": ex_employee["name"],
+                                "퇴사자이메일": ex_employee["email"] if not pd.isna(ex_employee["email"]) else "",
+                                "사번/ID": ex_employee["employee_id"] if not pd.isna(ex_employee["employee_id"]) else "",
+                                "Redmine계정ID": user["id"],
+                                "Redmine계정명": f"{user['firstname']} {user['lastname']}",
+                                "Redmine이메일": user.get("mail", ""),
+                                "계정상태": "활성" if user["status"] == 1 else "잠금",
+                                "마지막로그인": user.get("last_login_on", ""),
+                                "매칭기준": format_match_keys(keys),
+                                "프로젝트수": None
+                            })
+                        
+                        # 매칭된 계정의 프로젝트 멤버십을 한 번에 조회
+                        memberships_by_user = get_memberships_by_user([account["Redmine계정ID"] for account in matched_accounts])
+                        for account in matched_accounts:
+                            # 멤버십을 조회하지 못한 계정은 0(권한 없음)이 아닌 None(알 수 없음)으로 표시
+                            memberships = memberships_by_user.get(account["Redmine계정ID"])
+                            account["프로젝트수"] = None if memberships is None else len(memberships)
                         
                         if matched_accounts:
                             st.write(f"### 매칭된 퇴사자 Redmine 계정 ({len(matched_accounts)}명)")
                             
                             # 매칭된 계정 데이터프레임 생성
                             df_matched = pd.DataFrame(matched_accounts)
+                            df_matched["프로젝트수"] = df_matched["프로젝트수"].astype("Int64")
                             
                             # 데이터프레임 표시
                             st.dataframe(df_matched)
@@ -874,12 +955,12 @@ def show_ex_employee_management():
                 if matched_users:
                     st.success(f"{len(matched_users)}명의 사용자를 찾았습니다.")
                     
-                    # 매칭된 사용자 정보 테이블 생성
+                    # 매칭된 사용자 정보 테이블 생성 (프로젝트 멤버십은 한 번에 조회)
+                    memberships_by_user = get_memberships_by_user([user["id"] for user in matched_users])
                     matched_data = []
                     
                     for user in matched_users:
-                        # 사용자의 프로젝트 멤버십 가져오기
-                        memberships = get_user_memberships(user["id"])
+                        memberships = memberships_by_user.get(user["id"])
                         
                         matched_data.append({
                             "ID": user["id"],
@@ -889,11 +970,12 @@ def show_ex_employee_management():
                             "상태": "활성" if user["status"] == 1 else "잠금",
                             "사번/ID": get_employee_id_from_user(user),
                             "마지막 로그인": user.get("last_login_on", ""),
-                            "프로젝트 수": len(memberships)
+                            "프로젝트 수": None if memberships is None else len(memberships)
                         })
                     
                     # 데이터프레임 생성 및 표시
                     df_matched = pd.DataFrame(matched_data)
+                    df_matched["프로젝트 수"] = df_matched["프로젝트 수"].astype("Int64")
                     st.dataframe(df_matched)
                     
                     # 계정 상세 조회
@@ -969,6 +1051,27 @@ def show_redmine_settings():
         else:
             st.error("Redmine 연결에 실패했습니다. 설정을 확인해주세요.")
 
+    # API 요청 설정
+    with st.expander("API 요청 설정", expanded=False):
+        max_workers, requests_per_second = get_pager_settings()
+
+        with st.form("redmine_pager_form"):
+            new_max_workers = st.number_input("최대 동시 요청 수", min_value=1, max_value=16, value=max_workers)
+            new_requests_per_second = st.number_input("초당 최대 요청 수", min_value=1.0, max_value=50.0, value=requests_per_second, step=1.0)
+            submit = st.form_submit_button("저장")
+
+            if submit:
+                if save_module_config(MODULE_ID, {
+                    "max_workers": int(new_max_workers),
+                    "requests_per_second": float(new_requests_per_second)
+                }):
+                    st.success("API 요청 설정이 저장되었습니다.")
+                else:
+                    st.error("API 요청 설정 저장에 실패했습니다.")
+
+    # API 캐시 상태
+    show_cache_status(MODULE_ID)
+
     # Redmine 버전 정보 섹션
     st.subheader("Redmine 서버 정보")
     if st.button("Redmine 서버 버전 확인", key="check_redmine_version"):
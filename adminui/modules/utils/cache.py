@@ -0,0 +1,128 @@
+import copy
+import functools
+import os
+import threading
+import time
+import streamlit as st
+import pandas as pd
+from modules.utils.config import get_module_setting
+
+# 엔드포인트별 TTL이 설정되지 않았을 때 사용할 기본 TTL (초)
+DEFAULT_TTL = 300
+
+class TTLCache:
+    """API 조회 결과를 보관하는 프로세스 전역 TTL 캐시
+
+    Streamlit 서버 프로세스 안에서 모든 브라우저 세션이 공유합니다.
+    키는 (모듈 ID, 호스트, 엔드포인트, 파라미터) 형태입니다.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.stats = {}
+        self.lock = threading.Lock()
+
+    def _count(self, module_id, kind):
+        module_stats = self.stats.setdefault(module_id, {"hits": 0, "misses": 0})
+        module_stats[kind] += 1
+
+    def get(self, key, ttl):
+        """유효한 캐시 값 조회 (없거나 만료되면 None)"""
+        module_id = key[0]
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and time.monotonic() - entry[0] < ttl:
+                self._count(module_id, "hits")
+                return copy.deepcopy(entry[1])
+
+            self._count(module_id, "misses")
+            return None
+
+    def set(self, key, value):
+        """캐시 값 저장"""
+        with self.lock:
+            self.entries[key] = (time.monotonic(), copy.deepcopy(value))
+
+    def invalidate(self, module_id, endpoint=None):
+        """모듈(또는 모듈의 특정 엔드포인트)의 캐시 항목 삭제"""
+        with self.lock:
+            for key in list(self.entries):
+                if key[0] == module_id and (endpoint is None or key[2] == endpoint):
+                    del self.entries[key]
+
+    def get_stats(self, module_id):
+        """모듈의 캐시 적중/실패 횟수와 항목 수 반환"""
+        with self.lock:
+            module_stats = self.stats.get(module_id, {"hits": 0, "misses": 0})
+            entries = sum(1 for key in self.entries if key[0] == module_id)
+            return {"hits": module_stats["hits"], "misses": module_stats["misses"], "entries": entries}
+
+# 모든 모듈이 공유하는 캐시 인스턴스
+api_cache = TTLCache()
+
+def get_ttl(module_id, endpoint):
+    """config/modules/<id>.json의 cache_ttl 설정에서 엔드포인트 TTL 조회"""
+    ttl_settings = get_module_setting(module_id, "cache_ttl", {}) or {}
+    return float(ttl_settings.get(endpoint, ttl_settings.get("default", DEFAULT_TTL)))
+
+def ttl_cache(module_id, endpoint, host_env):
+    """API 조회 함수의 결과를 TTL 캐시에 저장하는 데코레이터
+
+    호스트(host_env 환경변수 값), 엔드포인트, 함수 인자를 키로 사용합니다.
+    조회 실패 시 빈 값을 반환하는 기존 함수 규칙에 맞춰 빈 결과는 캐시하지 않습니다.
+
+    Args:
+        module_id (str): 모듈 ID
+        endpoint (str): TTL 설정에 사용할 엔드포인트 이름
+        host_env (str): 서버 주소가 저장된 환경변수 이름
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            ttl = get_ttl(module_id, endpoint)
+            if ttl <= 0:
+                return func(*args, **kwargs)
+
+            key = (module_id, os.environ.get(host_env, ""), endpoint, args, tuple(sorted(kwargs.items())))
+
+            cached = api_cache.get(key, ttl)
+            if cached is not None:
+                return cached
+
+            result = func(*args, **kwargs)
+            if result:
+                api_cache.set(key, result)
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+def show_cache_status(module_id):
+    """설정 탭에 캐시 상태와 새로고침 버튼을 표시"""
+    st.subheader("API 캐시")
+
+    stats = api_cache.get_stats(module_id)
+    total = stats["hits"] + stats["misses"]
+    hit_rate = stats["hits"] / total * 100 if total > 0 else 0
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("캐시 적중", f"{stats['hits']}회")
+    with col2:
+        st.metric("캐시 실패", f"{stats['misses']}회")
+    with col3:
+        st.metric("적중률", f"{hit_rate:.1f}%")
+    with col4:
+        st.metric("캐시 항목", f"{stats['entries']}개")
+
+    ttl_settings = get_module_setting(module_id, "cache_ttl", {}) or {}
+    if ttl_settings:
+        st.dataframe(pd.DataFrame([{"엔드포인트": endpoint, "TTL (초)": ttl} for endpoint, ttl in ttl_settings.items()]))
+    st.caption(f"엔드포인트별 TTL은 config/modules/{module_id}.json의 cache_ttl 항목에서 설정합니다. (기본값: {DEFAULT_TTL}초)")
+
+    if st.button("지금 새로고침", key=f"{module_id}_cache_refresh"):
+        api_cache.invalidate(module_id)
+        st.success("캐시를 비웠습니다. 다음 조회 시 서버에서 새로 불러옵니다.")
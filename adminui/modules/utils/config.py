@@ -0,0 +1,61 @@
+import json
+import os
+
+CONFIG_DIR = os.path.join("config", "modules")
+
+def load_module_config(module_id):
+    """모듈 설정 파일(config/modules/<id>.json)을 로드합니다.
+
+    Args:
+        module_id (str): 모듈 ID
+
+    Returns:
+        dict: 모듈 설정 (파일이 없거나 읽을 수 없으면 빈 dict)
+    """
+    config_file = os.path.join(CONFIG_DIR, f"{module_id}.json")
+
+    try:
+        if os.path.exists(config_file):
+            with open(config_file, "r") as f:
+                return json.load(f)
+    except Exception:
+        pass
+
+    return {}
+
+def get_module_setting(module_id, key, default=None):
+    """모듈 설정 값 하나를 조회합니다.
+
+    Args:
+        module_id (str): 모듈 ID
+        key (str): 설정 키
+        default: 설정이 없을 때 사용할 기본값
+
+    Returns:
+        설정 값 또는 기본값
+    """
+    return load_module_config(module_id).get(key, default)
+
+def save_module_config(module_id, values):
+    """모듈 설정 파일에 값을 병합하여 저장합니다.
+
+    Args:
+        module_id (str): 모듈 ID
+        values (dict): 저장할 설정 값
+
+    Returns:
+        bool: 저장 성공 여부
+    """
+    try:
+        os.makedirs(CONFIG_DIR, exist_ok=True)
+
+        config = load_module_config(module_id)
+        config.update(values)
+
+        config_file = os.path.join(CONFIG_DIR, f"{module_id}.json")
+        with open(config_file, "w") as f:
+            json.dump(config, f, indent=4)
+
+        return True
+    except Exception:
+        return False
@@ -0,0 +1,194 @@
+from concurrent.futures import ThreadPoolExecutor
+from modules.utils.identity import normalize
+from modules.utils.pager import DEFAULT_MAX_WORKERS
+
+# Grafana 폴더 팀 권한 일괄 적용 엔진
+# 목표 상태(폴더 -> 팀 -> 권한) CSV를 현재 권한과 비교해 바뀌는 폴더만 POST /api/folders/{uid}/permissions로 보냅니다.
+# 이 API는 폴더의 권한 목록 전체를 교체하므로, 변경 요청에는 기존 사용자/역할 권한을 그대로 포함합니다.
+# 워커 스레드에서 실행되는 부분은 st.* 를 호출하지 않고 결과에 오류를 기록합니다.
+
+# 권한 이름과 Grafana 권한 코드 (0은 팀 권한 삭제)
+PERMISSION_LEVELS = {"none": 0, "viewer": 1, "editor": 2, "admin": 4}
+PERMISSION_NAMES = {0: "없음", 1: "Viewer", 2: "Editor", 4: "Admin"}
+
+# 목표 상태 CSV 컬럼 (team_id 또는 team_name 중 하나는 있어야 함)
+# "모든 폴더 권한 조회"로 내보낸 CSV를 수정해 그대로 업로드할 수 있습니다.
+REQUIRED_COLUMNS = ["folder_uid", "permission"]
+TEAM_COLUMNS = ["team_id", "team_name"]
+
+def parse_permission(value):
+    """권한 값(Viewer/Editor/Admin/None 또는 0/1/2/4)을 권한 코드로 변환
+
+    None, 0, 삭제만 팀 권한 삭제로 보고, 빈 칸은 실수로 지워진 값일 수 있으므로 오류로 처리합니다.
+
+    Raises:
+        ValueError: 비어 있거나 알 수 없는 권한 값
+    """
+    value = normalize(value)
+    if not value:
+        raise ValueError("권한이 비어 있습니다. (삭제하려면 None으로 지정)")
+    if value == "삭제":
+        return 0
+    if value in PERMISSION_LEVELS:
+        return PERMISSION_LEVELS[value]
+    if value.isdigit() and int(value) in PERMISSION_NAMES:
+        return int(value)
+    raise ValueError(f"알 수 없는 권한: {value}")
+
+def load_desired_state(records, team_directory):
+    """목표 상태 CSV를 {폴더 UID: {팀 ID: 권한 코드}}로 변환
+
+    팀은 team_id가 있으면 ID로, 없으면 team_name으로 팀 디렉터리에서 찾습니다.
+
+    Args:
+        records (DataFrame|list): 목표 상태 (folder_uid, team_id/team_name, permission)
+        team_directory (dict): {팀 ID: 팀 정보}
+
+    Returns:
+        tuple: (목표 상태, 오류 메시지 목록)
+    """
+    if hasattr(records, "to_dict"):
+        records = records.to_dict("records")
+
+    team_ids_by_name = {normalize(team["name"]): team_id for team_id, team in team_directory.items()}
+    desired = {}
+    conflicts = set()
+    errors = []
+
+    for line, record in enumerate(records, start=2):
+        folder_uid = normalize(record.get("folder_uid"))
+        if not folder_uid:
+            errors.append(f"{line}행: folder_uid가 없습니다.")
+            continue
+        # 폴더 UID는 대소문자를 구분하므로 정규화 값이 아닌 원래 값을 사용
+        folder_uid = str(record["folder_uid"]).strip()
+
+        team_id = normalize(record.get("team_id"))
+        team_name = normalize(record.get("team_name"))
+        if team_id.isdigit() and int(team_id) in team_directory:
+            team_id = int(team_id)
+        elif not team_id and team_name in team_ids_by_name:
+            team_id = team_ids_by_name[team_name]
+        else:
+            errors.append(f"{line}행: 팀을 찾을 수 없습니다. ({record.get('team_id') if team_id else record.get('team_name')})")
+            continue
+
+        try:
+            permission = parse_permission(record.get("permission"))
+        except ValueError as e:
+            errors.append(f"{line}행: {e}")
+            continue
+
+        folder = desired.setdefault(folder_uid, {})
+        if folder.get(team_id, permission) != permission:
+            errors.append(f"{line}행: 폴더 {folder_uid}의 팀 {team_id} 권한이 서로 다르게 중복 지정되었습니다.")
+            conflicts.add((folder_uid, team_id))
+            continue
+        folder[team_id] = permission
+
+    # 권한이 엇갈리게 지정된 팀은 어느 쪽도 적용하지 않음
+    for folder_uid, team_id in conflicts:
+        desired[folder_uid].pop(team_id, None)
+
+    return {folder_uid: teams for folder_uid, teams in desired.items() if teams}, errors
+
+def split_permissions(permissions):
+    """현재 권한 목록을 (팀 권한 {팀 ID: 권한 코드}, 그대로 유지할 사용자/역할 권한 항목)으로 분리
+
+    상위 폴더에서 상속된 권한은 이 폴더에서 바꿀 수 없으므로 제외합니다.
+    """
+    team_permissions = {}
+    other_items = []
+
+    for permission in permissions:
+        if permission.get("inherited"):
+            continue
+
+        if permission.get("teamId"):
+            team_permissions[permission["teamId"]] = permission["permission"]
+        elif permission.get("userId"):
+            other_items.append({"userId": permission["userId"], "permission": permission["permission"]})
+        elif permission.get("role"):
+            other_items.append({"role": permission["role"], "permission": permission["permission"]})
+
+    return team_permissions, other_items
+
+def plan_permission_changes(desired, current_permissions):
+    """목표 상태와 현재 권한을 비교해 변경이 필요한 폴더만 추림
+
+    목표 상태에 지정된 팀의 권한만 바꾸고(권한 없음/0은 삭제), 지정되지 않은 팀 권한과
+    목표 상태에 없는 폴더는 건드리지 않습니다.
+
+    Args:
+        desired (dict): {폴더 UID: {팀 ID: 권한 코드}}
+        current_permissions (dict): {폴더 UID: 현재 권한 목록}
+
+    Returns:
+        list: 폴더별 변경 계획
+            ({"folder_uid", "items": POST 본문 항목, "changes": [(팀 ID, 변경 전, 변경 후)]})
+    """
+    plan = []
+
+    for folder_uid, team_targets in desired.items():
+        current_teams, items = split_permissions(current_permissions[folder_uid])
+        target_teams = {team_id: permission for team_id, permission in team_targets.items() if permission}
+
+        for team_id, permission in current_teams.items():
+            if team_id not in team_targets:
+                target_teams[team_id] = permission
+
+        if target_teams == current_teams:
+            continue
+
+        changes = [
+            (team_id, current_teams.get(team_id, 0), target_teams.get(team_id, 0))
+            for team_id in sorted(set(current_teams) | set(target_teams))
+            if current_teams.get(team_id, 0) != target_teams.get(team_id, 0)
+        ]
+        items += [{"teamId": team_id, "permission": permission} for team_id, permission in sorted(target_teams.items())]
+
+        plan.append({"folder_uid": folder_uid, "items": items, "changes": changes})
+
+    return plan
+
+def apply_permission_changes(plan, update_permissions, max_workers=DEFAULT_MAX_WORKERS, rate_limiter=None):
+    """변경 계획의 폴더 권한을 동시에 적용
+
+    Args:
+        plan (list): plan_permission_changes 결과
+        update_permissions (callable): (폴더 UID, 권한 항목 목록)을 받아 폴더 권한을 교체하는 함수.
+            워커 스레드에서 호출되므로 st.* 를 사용하지 않고 실패 시 예외를 발생시켜야 함
+        max_workers (int): 최대 동시 요청 수
+        rate_limiter (TokenBucket, optional): 요청 속도 제한기
+
+    Returns:
+        dict: {폴더 UID: 오류 메시지 (성공이면 None)}
+    """
+    def apply(change):
+        if rate_limiter:
+            rate_limiter.acquire()
+        try:
+            update_permissions(change["folder_uid"], change["items"])
+            return None
+        except Exception as e:
+            return str(e)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        return dict(zip([change["folder_uid"] for change in plan], executor.map(apply, plan)))
+
+def format_plan(plan, team_directory, folder_titles):
+    """변경 계획을 미리보기 표 행 목록으로 변환"""
+    rows = []
+    for change in plan:
+        for team_id, before, after in change["changes"]:
+            team = team_directory.get(team_id)
+            rows.append({
+                "폴더": folder_titles.get(change["folder_uid"], change["folder_uid"]),
+                "폴더 UID": change["folder_uid"],
+                "팀": team["name"] if team else f"Team {team_id}",
+                "팀 ID": team_id,
+                "변경 전": PERMISSION_NAMES.get(before, before),
+                "변경 후": PERMISSION_NAMES.get(after, after),
+                "구분": "추가" if not before else "삭제" if not after else "변경"
+            })
+    return rows
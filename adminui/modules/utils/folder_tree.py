@@ -0,0 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+from modules.utils.pager import DEFAULT_MAX_WORKERS
+
+def walk_folder_tree(fetch_children, max_workers=DEFAULT_MAX_WORKERS, rate_limiter=None):
+    """Grafana 폴더 트리를 레벨 단위(너비 우선)로 조회
+
+    한 레벨의 모든 폴더에 대한 하위 폴더 요청을 동시에 보내고, 다음 레벨로 내려갑니다.
+    요청 수는 폴더 수와 같지만 직렬 체인 길이가 트리 깊이로 줄어듭니다.
+    중첩 폴더 기능이 꺼진 Grafana는 parentUid를 무시하고 최상위 폴더를 다시 돌려주므로
+    이미 방문한 폴더는 건너뜁니다.
+    하위 폴더 조회에 실패한 폴더는 그 아래를 건너뛰고 실패 목록에 기록하며,
+    최상위 목록 조회 실패만 예외로 올립니다.
+
+    Args:
+        fetch_children (callable): 부모 폴더 UID(최상위는 None)를 받아 하위 폴더 목록을 반환하는 함수.
+            워커 스레드에서 호출되므로 st.* 를 사용하지 않아야 함
+        max_workers (int): 최대 동시 요청 수
+        rate_limiter (TokenBucket, optional): 요청 속도 제한기
+
+    Returns:
+        tuple: (너비 우선 순서의 폴더 목록, 하위 폴더를 조회하지 못한 폴더 목록)
+            각 폴더에 parentUid, depth(최상위 0), path("상위/하위") 추가.
+            실패 항목은 {"uid", "path", "error"} 형식
+    """
+    def fetch(parent_uid):
+        if rate_limiter:
+            rate_limiter.acquire()
+        if parent_uid is None:
+            return fetch_children(parent_uid), None
+
+        try:
+            return fetch_children(parent_uid), None
+        except Exception as e:
+            return [], e
+
+    folders = []
+    failed = []
+    visited = set()
+    level = [None]
+    depth = 0
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        while level:
+            next_level = []
+
+            for parent, (children, error) in zip(level, executor.map(fetch, [parent["uid"] if parent else None for parent in level])):
+                if error is not None:
+                    failed.append({"uid": parent["uid"], "path": parent["path"], "error": str(error)})
+                    continue
+
+                for child in children:
+                    if child["uid"] in visited:
+                        continue
+                    visited.add(child["uid"])
+
+                    folder = {
+                        **child,
+                        "parentUid": parent["uid"] if parent else "",
+                        "depth": depth,
+                        "path": f"{parent['path']}/{child['title']}" if parent else child["title"]
+                    }
+                    folders.append(folder)
+                    next_level.append(folder)
+
+            level = next_level
+            depth += 1
+
+    return folders, failed
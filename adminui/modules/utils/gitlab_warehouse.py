@@ -0,0 +1,253 @@
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+
+# gitlab/*.py 수집 스크립트가 채우는 로컬 SQLite 웨어하우스 조회 (스키마는 gitlab/warehouse.py 참고)
+# 수집 스크립트가 WAL 모드로 기록하므로 수집 중에도 읽기 전용으로 조회할 수 있습니다.
+# 저장소 목록 증분 동기화(sync_projects)는 같은 웨어하우스의 projects, sync_state 테이블을 갱신합니다.
+
+# 증분 동기화 상태 키 (gitlab/warehouse.py와 동일)
+HOST_KEY = "projects_host"
+LAST_SYNC_KEY = "projects_last_sync"
+
+# GitLab은 last_activity_at을 최대 1시간 간격으로 갱신하므로 증분 조회 시 여유를 둠
+ACTIVITY_LAG = timedelta(hours=1)
+
+# 증분 동기화에 필요한 테이블 (gitlab/warehouse.py SCHEMA와 동일)
+PROJECTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    namespace TEXT,
+    name TEXT,
+    path_with_namespace TEXT,
+    description TEXT,
+    web_url TEXT,
+    created_at TEXT,
+    last_activity_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_projects_last_activity ON projects (last_activity_at);
+
+CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+def is_available(path):
+    """웨어하우스 사용 가능 여부 (수집 스크립트가 멤버 테이블까지 생성한 경우)"""
+    if not path or not os.path.exists(path):
+        return False
+
+    with closing(_connect(path)) as conn:
+        return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'members'").fetchone() is not None
+
+def _connect(path):
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=10)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+def _to_project(row):
+    """projects 행을 GitLab projects API 응답과 같은 형식으로 변환"""
+    return {
+        "id": row["id"],
+        "namespace": {"name": row["namespace"]},
+        "name": row["name"],
+        "path_with_namespace": row["path_with_namespace"],
+        "description": row["description"],
+        "web_url": row["web_url"],
+        "created_at": row["created_at"],
+        "last_activity_at": row["last_activity_at"]
+    }
+
+def get_status(path):
+    """테이블별 행 수와 마지막 갱신 시각"""
+    with closing(_connect(path)) as conn:
+        status = {}
+        for table in ["projects", "users", "members", "commit_authors"]:
+            count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            status[table] = {"count": count, "updated_at": None}
+
+        for row in conn.execute("SELECT key, value FROM sync_state WHERE key LIKE '%_updated_at'"):
+            table = row["key"][:-len("_updated_at")]
+            if table in status:
+                status[table]["updated_at"] = row["value"]
+            if table == "members":
+                status["commit_authors"]["updated_at"] = row["value"]
+
+        return status
+
+def get_unused_projects(path, days):
+    """마지막 활동이 days일 이전인 저장소와 소유자(Owner) 목록
+
+    Returns:
+        list: GitLab projects API 형식의 저장소 목록 (owner_name 포함)
+    """
+    # 실시간 조회(get_unused_repositories)와 같이 경과 일수가 days일을 초과한 저장소
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=days + 1)).strftime("%Y-%m-%dT%H:%M:%S")
+
+    with closing(_connect(path)) as conn:
+        rows = conn.execute(
+            """
+            SELECT p.*, (
+                SELECT GROUP_CONCAT(m.name, ', ') FROM members m
+                WHERE m.project_id = p.id AND m.access_level = 50
+            ) AS owner_name
+            FROM projects p
+            WHERE p.last_activity_at <= ?
+            ORDER BY p.last_activity_at
+            """,
+            (cutoff,)
+        ).fetchall()
+
+    return [{**_to_project(row), "owner_name": row["owner_name"] or "알 수 없음"} for row in rows]
+
+def get_user_projects(path, user, min_access_level=50):
+    """사용자(사용자명, 이름 또는 ID)가 min_access_level 이상 권한을 가진 저장소 목록
+
+    Returns:
+        list: GitLab projects API 형식의 저장소 목록 (access_level 포함)
+    """
+    with closing(_connect(path)) as conn:
+        rows = conn.execute(
+            """
+            SELECT p.*, MAX(m.access_level) AS access_level
+            FROM members m JOIN projects p ON p.id = m.project_id
+            WHERE (m.username = ? OR m.name = ? OR m.user_id = ?) AND m.access_level >= ?
+            GROUP BY p.id
+            ORDER BY p.path_with_namespace
+            """,
+            (user, user, int(user) if str(user).isdigit() else None, min_access_level)
+        ).fetchall()
+
+    return [{**_to_project(row), "access_level": row["access_level"]} for row in rows]
+
+class ProjectStore:
+    """증분 동기화용 웨어하우스 projects 테이블
+
+    마지막 동기화 시각과 GitLab 호스트는 sync_state 테이블에 보관하며,
+    호스트가 바뀌면 저장된 프로젝트를 비웁니다.
+    """
+
+    def __init__(self, path, host):
+        self.path = path
+        self.host = host
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with closing(self._connect()) as conn:
+            conn.executescript(PROJECTS_SCHEMA)
+
+        if self.get_state(HOST_KEY) != host:
+            self.reset()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def get_state(self, key):
+        """동기화 상태 값 조회"""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+            return row[0] if row else None
+
+    def set_state(self, key, value):
+        """동기화 상태 값 저장"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, value))
+
+    def reset(self):
+        """저장된 프로젝트와 동기화 시각 초기화"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM projects")
+            conn.execute("DELETE FROM sync_state WHERE key = ?", (LAST_SYNC_KEY,))
+            conn.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (HOST_KEY, self.host))
+
+    def load_projects(self):
+        """저장된 모든 프로젝트 반환 (GitLab projects API 형식)"""
+        with closing(self._connect()) as conn:
+            return [_to_project(row) for row in conn.execute("SELECT * FROM projects ORDER BY id")]
+
+    def project_ids(self):
+        """저장된 프로젝트 ID 집합 반환"""
+        with closing(self._connect()) as conn:
+            return {row[0] for row in conn.execute("SELECT id FROM projects")}
+
+    def upsert_projects(self, projects):
+        """프로젝트 추가 또는 갱신"""
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO projects VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(p["id"], p["namespace"]["name"], p["name"], p.get("path_with_namespace", ""), p.get("description") or "",
+                  p["web_url"], p["created_at"], p["last_activity_at"]) for p in projects]
+            )
+            _mark_projects_updated(conn)
+
+    def delete_projects(self, project_ids):
+        """프로젝트 삭제"""
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("DELETE FROM projects WHERE id = ?", [(project_id,) for project_id in project_ids])
+            _mark_projects_updated(conn)
+
+def _mark_projects_updated(conn):
+    conn.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES ('projects_updated_at', ?)",
+                 (datetime.now().strftime("%Y-%m-%d %H:%M:%S"),))
+
+def utc_now():
+    """현재 UTC 시각 (GitLab API 형식)"""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+def activity_cutoff(last_sync):
+    """마지막 동기화 시각에서 증분 조회 기준 시각 계산"""
+    synced_at = datetime.strptime(last_sync, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    return (synced_at - ACTIVITY_LAG).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+def sync_projects(store, fetch_projects, clean_project=None, full=False):
+    """웨어하우스 projects 테이블을 GitLab 프로젝트 목록과 동기화
+
+    처음이거나 full=True이면 전체 목록을 받아 테이블을 교체합니다. 이후에는
+    last_activity_after로 변경된 프로젝트만 받아 병합하고, 가벼운 simple 목록으로
+    삭제된 프로젝트와 누락된 신규 프로젝트를 반영합니다.
+
+    Args:
+        store (ProjectStore): 웨어하우스 projects 테이블
+        fetch_projects (callable): 쿼리 파라미터 dict를 받아 GitLab 응답 그대로의 프로젝트 목록을 반환하는 함수
+        clean_project (callable, optional): 저장할 필드만 남기는 함수 (None을 반환하면 저장하지 않음)
+        full (bool): 전체 동기화 여부
+
+    Returns:
+        dict: 동기화 결과 (mode, updated, deleted)
+    """
+    def clean(projects):
+        if not clean_project:
+            return projects
+        return [project for project in map(clean_project, projects) if project]
+
+    started_at = utc_now()
+    last_sync = store.get_state(LAST_SYNC_KEY)
+
+    if full or not last_sync:
+        projects = clean(fetch_projects({}))
+        store.reset()
+        store.upsert_projects(projects)
+        store.set_state(LAST_SYNC_KEY, started_at)
+        return {"mode": "full", "updated": len(projects), "deleted": 0}
+
+    # 1. 마지막 동기화 이후 활동이 있는 프로젝트
+    changed = clean(fetch_projects({"last_activity_after": activity_cutoff(last_sync)}))
+    store.upsert_projects(changed)
+
+    # 2. 삭제/누락 확인용 간략 목록 (필드가 빠진 프로젝트도 존재하므로 정제 전 ID로 비교)
+    listing = fetch_projects({"simple": "true"})
+    listed_ids = {project["id"] for project in listing}
+    stored_ids = store.project_ids()
+
+    deleted_ids = stored_ids - listed_ids
+    store.delete_projects(deleted_ids)
+
+    missing = clean([project for project in listing if project["id"] not in stored_ids])
+    store.upsert_projects(missing)
+
+    store.set_state(LAST_SYNC_KEY, started_at)
+    return {"mode": "incremental", "updated": len(changed) + len(missing), "deleted": len(deleted_ids)}
@@ -0,0 +1,112 @@
+import threading
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from modules.utils.config import get_module_setting
+
+# 기본 타임아웃 (연결, 읽기) 초
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 30
+
+# 기본 재시도 횟수와 지수 백오프 계수 (0.5초, 1초, 2초, ...)
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+
+# 재시도할 응답 코드 (429/503은 Retry-After 헤더가 있으면 그만큼 대기)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# 호스트별 최대 커넥션 수 (병렬 페이지 조회의 최대 동시 요청 수 이상)
+POOL_MAXSIZE = 16
+
+class HttpClient:
+    """백엔드 호스트별로 커넥션 풀을 유지하는 공용 HTTP 클라이언트
+
+    호스트(스킴, 주소, 포트)마다 requests.Session을 하나씩 만들어 keep-alive 연결을 재사용하고,
+    모든 요청에 타임아웃과 재시도(지수 백오프, Retry-After 준수)를 적용합니다.
+    Streamlit 서버 프로세스 안에서 모든 세션과 스레드가 공유합니다.
+    """
+
+    def __init__(self):
+        self.sessions = {}
+        self.lock = threading.Lock()
+
+    def _create_session(self, max_retries, backoff_factor):
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["Accept-Encoding"] = "gzip, deflate"
+        return session
+
+    def get_session(self, url, max_retries=DEFAULT_MAX_RETRIES, backoff_factor=DEFAULT_BACKOFF_FACTOR):
+        """URL의 호스트에 해당하는 세션 반환 (없으면 생성)"""
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc, max_retries, backoff_factor)
+
+        with self.lock:
+            session = self.sessions.get(key)
+            if session is None:
+                session = self._create_session(max_retries, backoff_factor)
+                self.sessions[key] = session
+            return session
+
+    def close(self):
+        """모든 세션 종료"""
+        with self.lock:
+            for session in self.sessions.values():
+                session.close()
+            self.sessions.clear()
+
+# 모든 모듈이 공유하는 클라이언트 인스턴스
+http_client = HttpClient()
+
+def get_http_settings(module_id):
+    """config/modules/<id>.json의 http 설정 (timeout, max_retries, backoff_factor)"""
+    settings = get_module_setting(module_id, "http", {}) if module_id else {}
+    settings = settings or {}
+
+    timeout = (
+        float(settings.get("connect_timeout", DEFAULT_CONNECT_TIMEOUT)),
+        float(settings.get("read_timeout", DEFAULT_READ_TIMEOUT))
+    )
+    return timeout, int(settings.get("max_retries", DEFAULT_MAX_RETRIES)), float(settings.get("backoff_factor", DEFAULT_BACKOFF_FACTOR))
+
+def request(method, url, module_id=None, timeout=None, max_retries=None, **kwargs):
+    """공용 클라이언트로 HTTP 요청
+
+    Args:
+        method (str): HTTP 메서드
+        url (str): 요청 URL
+        module_id (str, optional): 타임아웃/재시도 설정을 읽을 모듈 ID
+        timeout (float|tuple, optional): 이 요청에만 적용할 타임아웃 (기본값: 모듈 설정)
+        max_retries (int, optional): 이 요청에만 적용할 재시도 횟수 (연결 테스트 등은 0으로 빠르게 실패)
+        **kwargs: requests에 전달할 인자 (headers, params, auth, json 등)
+
+    Returns:
+        requests.Response: 응답 (재시도 후에도 실패한 상태 코드는 그대로 반환)
+    """
+    default_timeout, default_max_retries, backoff_factor = get_http_settings(module_id)
+    if max_retries is None:
+        max_retries = default_max_retries
+
+    session = http_client.get_session(url, max_retries, backoff_factor)
+    return session.request(method, url, timeout=timeout or default_timeout, **kwargs)
+
+def get(url, **kwargs):
+    return request("GET", url, **kwargs)
+
+def put(url, **kwargs):
+    return request("PUT", url, **kwargs)
+
+def post(url, **kwargs):
+    return request("POST", url, **kwargs)
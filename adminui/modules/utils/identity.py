@@ -0,0 +1,85 @@
+import math
+
+# 퇴사자 목록(LDAP 모듈에서 내보낸 CSV: name, email, uid, employee_id)과
+# 각 서비스(Redmine, GitLab, Grafana) 계정 목록을 해시 인덱스로 조인합니다.
+
+# 매칭 키 (우선순위 순)와 퇴사자 CSV의 대응 컬럼
+MATCH_KEYS = ["employee_id", "email", "login", "name"]
+RECORD_FIELDS = {"employee_id": "employee_id", "email": "email", "login": "uid", "name": "name"}
+MATCH_KEY_LABELS = {"employee_id": "사번", "email": "이메일", "login": "로그인ID", "name": "이름"}
+
+def normalize(value):
+    """비교용 값 정규화 (빈 값/NaN은 빈 문자열, 앞뒤 공백 제거 후 소문자)"""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    # CSV에서 숫자로 읽힌 사번(12345.0)은 정수 문자열로 비교
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip().lower()
+
+class IdentityIndex:
+    """서비스 계정 목록의 사번/이메일/로그인ID/이름 해시 인덱스
+
+    계정 목록을 한 번만 훑어 키별 dict(정규화된 값 -> 계정 위치)를 만들고,
+    퇴사자 한 명은 키마다 dict 조회 한 번으로 매칭합니다.
+
+    Args:
+        accounts (list): 서비스 계정 목록
+        key_funcs (dict): {매칭 키: 계정에서 값(또는 값 목록)을 꺼내는 함수}.
+            서비스에 없는 키는 생략
+    """
+
+    def __init__(self, accounts, key_funcs):
+        self.accounts = list(accounts)
+        self.indexes = {key: {} for key in MATCH_KEYS if key in key_funcs}
+
+        for position, account in enumerate(self.accounts):
+            for key, index in self.indexes.items():
+                values = key_funcs[key](account)
+                if isinstance(values, (list, tuple, set)):
+                    values = [normalize(value) for value in values]
+                else:
+                    values = [normalize(values)]
+
+                for value in dict.fromkeys(values):
+                    if value:
+                        index.setdefault(value, []).append(position)
+
+    def lookup(self, record):
+        """퇴사자 한 명과 일치하는 계정 목록
+
+        Args:
+            record (dict): 퇴사자 정보 (name, email, uid, employee_id)
+
+        Returns:
+            list: (계정, 일치한 키 목록) 튜플 목록 (계정 목록 순서)
+        """
+        matches = {}
+        for key, index in self.indexes.items():
+            value = normalize(record.get(RECORD_FIELDS[key]))
+            if not value:
+                continue
+
+            for position in index.get(value, []):
+                matches.setdefault(position, []).append(key)
+
+        return [(self.accounts[position], keys) for position, keys in sorted(matches.items())]
+
+def match_identities(records, index):
+    """퇴사자 목록 전체를 계정 인덱스와 조인
+
+    Args:
+        records (DataFrame|list): 퇴사자 목록
+        index (IdentityIndex): 서비스 계정 인덱스
+
+    Returns:
+        list: (퇴사자, 계정, 일치한 키 목록) 튜플 목록
+    """
+    if hasattr(records, "to_dict"):
+        records = records.to_dict("records")
+
+    return [(record, account, keys) for record in records for account, keys in index.lookup(record)]
+
+def format_match_keys(keys):
+    """일치한 키 목록을 화면 표시용 문자열로 변환 (예: "사번, 이메일")"""
+    return ", ".join(MATCH_KEY_LABELS[key] for key in keys)
@@ -0,0 +1,224 @@
+import os
+import threading
+import time
+from contextlib import closing, contextmanager
+import ldap
+from ldap.controls import SimplePagedResultsControl
+from modules.utils.config import get_module_setting
+
+# 유휴 연결 최대 보관 수
+DEFAULT_POOL_SIZE = 4
+
+# 이 시간(초) 이상 쉰 연결은 꺼내기 전에 whoami로 상태 확인
+HEALTH_CHECK_INTERVAL = 60
+
+# 이 시간(초) 이상 쉰 연결은 서버가 끊었을 수 있으므로 닫고 새로 바인드 (AD 기본 MaxConnIdleTime 900초)
+MAX_IDLE_TIME = 600
+
+# 연결 시도 타임아웃 (초)
+NETWORK_TIMEOUT = 10
+
+# 페이지 검색 기본 페이지 크기와 최대 항목 수 (AD MaxPageSize 기본값 1000)
+DEFAULT_PAGE_SIZE = 500
+DEFAULT_MAX_ENTRIES = 20000
+
+# 연결 자체가 끊어졌음을 뜻하는 예외 (이 경우 연결을 버리고 재바인드)
+CONNECTION_ERRORS = (ldap.SERVER_DOWN, ldap.CONNECT_ERROR, ldap.TIMEOUT)
+
+class LdapConnectionPool:
+    """바인드된 LDAP 연결을 재사용하는 연결 풀
+
+    Streamlit 서버 프로세스 안에서 모든 세션과 재실행(rerun)이 공유하므로
+    화면을 그릴 때마다 initialize + simple_bind_s를 반복하지 않습니다.
+    LDAP 서버/계정 설정이 바뀌면 기존 연결을 모두 닫고 새로 바인드합니다.
+    """
+
+    def __init__(self):
+        self.settings = None
+        self.idle = []
+        self.lock = threading.Lock()
+        self.stats = {"created": 0, "reused": 0, "discarded": 0}
+
+    def _close(self, conn):
+        try:
+            conn.unbind_s()
+        except ldap.LDAPError:
+            pass
+
+    def _connect(self, settings):
+        server, user_dn, password = settings
+        conn = ldap.initialize(server)
+        conn.set_option(ldap.OPT_NETWORK_TIMEOUT, NETWORK_TIMEOUT)
+        conn.simple_bind_s(user_dn, password)
+        return conn
+
+    def _is_healthy(self, conn, last_used):
+        idle_time = time.monotonic() - last_used
+        if idle_time > MAX_IDLE_TIME:
+            return False
+
+        if idle_time > HEALTH_CHECK_INTERVAL:
+            try:
+                conn.whoami_s()
+            except ldap.LDAPError:
+                return False
+
+        return True
+
+    def _take_idle(self, settings, drain=False):
+        with self.lock:
+            if settings != self.settings or drain:
+                # 설정이 바뀌면 이전 서버/계정의 연결을, drain이면 남은 유휴 연결을 모두 폐기
+                stale, self.idle = self.idle, []
+                self.settings = settings
+            else:
+                stale = []
+            item = self.idle.pop() if self.idle else None
+
+        if drain:
+            self.stats["discarded"] += len(stale)
+        for conn, _ in stale:
+            self._close(conn)
+        return item
+
+    def acquire(self, fresh=False):
+        """바인드된 연결 하나 꺼내기 (유휴 연결이 없거나 모두 끊어졌으면 새로 바인드)
+
+        Args:
+            fresh (bool): 유휴 연결을 모두 버리고 새로 바인드 (연결 오류 후 재시도용)
+
+        Returns:
+            tuple: (연결, 연결에 사용한 설정)
+        """
+        settings = (os.environ.get("LDAP_SERVER"), os.environ.get("LDAP_USER_DN"), os.environ.get("LDAP_PASSWORD"))
+        if not all(settings):
+            raise ValueError("LDAP 서버 설정이 없습니다.")
+
+        while True:
+            item = self._take_idle(settings, drain=fresh)
+            if item is None:
+                break
+
+            conn, last_used = item
+            if self._is_healthy(conn, last_used):
+                self.stats["reused"] += 1
+                return conn, settings
+
+            self.stats["discarded"] += 1
+            self._close(conn)
+
+        conn = self._connect(settings)
+        self.stats["created"] += 1
+        return conn, settings
+
+    def release(self, conn, settings, broken=False):
+        """연결 반납 (끊어졌거나 풀이 가득 찼으면 닫음)"""
+        pool_size = int(get_module_setting("ldap_manager", "pool_size", DEFAULT_POOL_SIZE))
+
+        with self.lock:
+            if not broken and settings == self.settings and len(self.idle) < pool_size:
+                self.idle.append((conn, time.monotonic()))
+                return
+
+        if broken:
+            self.stats["discarded"] += 1
+        self._close(conn)
+
+    @contextmanager
+    def connection(self, fresh=False):
+        """with 블록 동안 바인드된 연결 사용 (fresh이면 유휴 연결을 버리고 새로 바인드)"""
+        conn, settings = self.acquire(fresh=fresh)
+        broken = False
+        try:
+            yield conn
+        except CONNECTION_ERRORS:
+            broken = True
+            raise
+        finally:
+            # 검색 조건 오류나 제너레이터 중단은 연결 상태와 무관하므로 그대로 반납
+            self.release(conn, settings, broken=broken)
+
+    def search_s(self, base, scope, filterstr="(objectClass=*)", attrlist=None):
+        """풀의 연결로 검색 (연결이 끊어져 있었으면 새로 바인드해 한 번 재시도)"""
+        for attempt in range(2):
+            try:
+                # 한 연결이 끊겼으면 같은 서버의 다른 유휴 연결도 끊겼을 수 있으므로 재시도는 새 연결로
+                with self.connection(fresh=bool(attempt)) as conn:
+                    return conn.search_s(base, scope, filterstr, attrlist)
+            except CONNECTION_ERRORS:
+                if attempt:
+                    raise
+
+    def _pages(self, conn, base, scope, filterstr, attrlist, page_size, max_entries):
+        control = SimplePagedResultsControl(True, size=page_size, cookie="")
+        remaining = max_entries or None
+
+        try:
+            while True:
+                msgid = conn.search_ext(base, scope, filterstr, attrlist, serverctrls=[control])
+                _, data, _, response_controls = conn.result3(msgid)
+
+                control.cookie = next((c.cookie for c in response_controls
+                                       if c.controlType == SimplePagedResultsControl.controlType), b"")
+
+                # AD가 돌려주는 참조(referral) 항목은 dn이 None
+                page = [(dn, entry) for dn, entry in data if dn]
+                if remaining is not None:
+                    page = page[:remaining]
+                    remaining -= len(page)
+
+                yield page
+
+                if not control.cookie or remaining == 0:
+                    break
+        finally:
+            if control.cookie:
+                # 중간에 멈춘 검색은 size=0 요청으로 서버의 페이지 상태를 해제
+                control.size = 0
+                try:
+                    conn.result3(conn.search_ext(base, scope, filterstr, attrlist, serverctrls=[control]))
+                except ldap.LDAPError:
+                    pass
+
+    def paged_search(self, base, scope, filterstr="(objectClass=*)", attrlist=None,
+                     page_size=DEFAULT_PAGE_SIZE, max_entries=DEFAULT_MAX_ENTRIES):
+        """페이지 검색 결과 컨트롤(RFC 2696)로 검색 결과를 페이지 단위로 반환
+
+        서버의 크기 제한(AD 기본 1000건)에 걸리지 않고, 전체 결과를 한 번에 받지 않으므로
+        넓은 범위의 검색도 메모리를 적게 사용합니다.
+
+        Args:
+            page_size (int): 페이지당 항목 수
+            max_entries (int): 최대 항목 수 (0이면 제한 없음)
+
+        Yields:
+            list: 한 페이지의 (dn, 속성) 목록
+        """
+        started = False
+        for attempt in range(2):
+            try:
+                # 호출자가 중간에 멈춰도 연결을 반납하기 전에 페이지 상태를 정리하도록 closing 사용
+                with self.connection(fresh=bool(attempt)) as conn, closing(self._pages(conn, base, scope, filterstr, attrlist, page_size, max_entries)) as pages:
+                    for page in pages:
+                        started = True
+                        yield page
+                return
+            except CONNECTION_ERRORS:
+                # 이미 일부 결과를 넘겼으면 중복되지 않도록 재시도하지 않음
+                if attempt or started:
+                    raise
+
+    def get_status(self):
+        """유휴 연결 수와 생성/재사용/폐기 횟수"""
+        with self.lock:
+            return {"idle": len(self.idle), **self.stats}
+
+    def close(self):
+        """모든 유휴 연결 종료"""
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for conn, _ in idle:
+            self._close(conn)
+
+# 모든 세션이 공유하는 LDAP 연결 풀
+ldap_pool = LdapConnectionPool()
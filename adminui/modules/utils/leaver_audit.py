@@ -0,0 +1,195 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from modules.utils.cache import ttl_cache
+from modules.utils.identity import IdentityIndex, match_identities, format_match_keys
+from modules.utils.pager import TokenBucket
+from modules.utils.service_api import (
+    get_pager_settings, fetch_gitlab_pages, fetch_redmine_pages, fetch_grafana_pages, get_redmine_employee_id,
+    fetch_gitlab_user_memberships, fetch_redmine_user_memberships, fetch_grafana_user_teams
+)
+
+# LDAP 퇴사자 목록(get_exited_users 결과)을 GitLab, Redmine, Grafana 계정과 동시에 대조하는 감사 작업
+# 각 서비스 점검은 워커 스레드에서 실행되므로 st.* 를 호출하지 않고, 실패는 예외로 올려 결과에 기록합니다.
+# 계정 목록은 각 모듈 캐시의 "audit_users" 항목에 저장되어 모듈 설정 탭의 새로고침으로 함께 비워집니다.
+
+AUDIT_SYSTEMS = ["GitLab", "Redmine", "Grafana"]
+
+REPORT_COLUMNS = ["퇴사자명", "퇴사자이메일", "사번/ID", "시스템", "계정ID", "계정명", "로그인ID", "계정상태", "매칭기준", "권한수", "권한"]
+
+def fetch_for_accounts(module_id, fetch, account_ids):
+    """매칭된 계정별 권한을 병렬로 조회 (계정별 실패는 따로 모아 반환)
+
+    Returns:
+        tuple: ({계정 ID: fetch 결과}, {계정 ID: 오류 메시지})
+    """
+    account_ids = list(dict.fromkeys(account_ids))
+    if not account_ids:
+        return {}, {}
+
+    max_workers, requests_per_second = get_pager_settings(module_id)
+    rate_limiter = TokenBucket(requests_per_second)
+
+    def fetch_one(account_id):
+        rate_limiter.acquire()
+        try:
+            return fetch(account_id), None
+        except Exception as e:
+            return None, str(e)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        results = list(executor.map(fetch_one, account_ids))
+
+    permissions = {account_id: result for account_id, (result, error) in zip(account_ids, results) if error is None}
+    errors = {account_id: error for account_id, (_, error) in zip(account_ids, results) if error is not None}
+    return permissions, errors
+
+def make_row(system, leaver, keys, account_id, name, login, state, permissions, error=None):
+    """감사 보고서 행 생성 (권한 조회에 실패한 계정은 권한수를 비우고 오류를 기록)"""
+    if error is not None:
+        permissions_count, permissions_text = None, f"조회 실패: {error}"
+    else:
+        permissions_count, permissions_text = len(permissions), ", ".join(permissions)
+
+    return {
+        "퇴사자명": leaver.get("name", ""),
+        "퇴사자이메일": leaver.get("email", ""),
+        "사번/ID": leaver.get("employee_id", ""),
+        "시스템": system,
+        "계정ID": account_id,
+        "계정명": name,
+        "로그인ID": login,
+        "계정상태": state,
+        "매칭기준": format_match_keys(keys),
+        "권한수": permissions_count,
+        "권한": permissions_text
+    }
+
+# GitLab
+
+@ttl_cache("gitlab_manager", "audit_users", "GITLAB_HOST")
+def get_gitlab_users():
+    """GitLab 전체 사용자 목록"""
+    return fetch_gitlab_pages("users")
+
+def get_gitlab_memberships(user_id):
+    """GitLab 사용자의 프로젝트/그룹 멤버십 ("그룹/프로젝트 이름(권한)" 목록)"""
+    access_levels = {50: "Owner", 40: "Maintainer", 30: "Developer", 20: "Reporter", 10: "Guest"}
+    memberships = fetch_gitlab_user_memberships(user_id)
+    return [f"{m['source_name']}({access_levels.get(m.get('access_level'), m.get('access_level'))})" for m in memberships]
+
+def check_gitlab(leavers):
+    """퇴사자의 GitLab 계정과 멤버십 점검"""
+    index = IdentityIndex(get_gitlab_users(), {
+        "email": lambda user: [user.get("email", ""), user.get("public_email", "")],
+        "login": lambda user: user.get("username", ""),
+        "name": lambda user: user.get("name", "")
+    })
+    matches = match_identities(leavers, index)
+    memberships, errors = fetch_for_accounts("gitlab_manager", get_gitlab_memberships, [user["id"] for _, user, _ in matches])
+
+    return [
+        make_row("GitLab", leaver, keys, user["id"], user.get("name", ""), user.get("username", ""),
+                 "활성" if user.get("state") == "active" else "차단됨", memberships.get(user["id"], []), errors.get(user["id"]))
+        for leaver, user, keys in matches
+    ]
+
+# Redmine
+
+@ttl_cache("redmine_manager", "audit_users", "REDMINE_URL")
+def get_redmine_users():
+    """Redmine 전체 사용자 목록 (사번 확인용 사용자 정의 필드 포함)"""
+    return fetch_redmine_pages("users.json", "users", {"status": "*", "include": "custom_fields"})
+
+def get_redmine_memberships(user_id):
+    """Redmine 사용자의 프로젝트 멤버십 ("프로젝트(역할)" 목록)"""
+    memberships = fetch_redmine_user_memberships(user_id)
+    return [f"{m['project']['name']}({', '.join(role['name'] for role in m.get('roles', []))})" for m in memberships]
+
+def check_redmine(leavers):
+    """퇴사자의 Redmine 계정과 프로젝트 멤버십 점검"""
+    index = IdentityIndex(get_redmine_users(), {
+        "employee_id": get_redmine_employee_id,
+        "email": lambda user: user.get("mail", ""),
+        "login": lambda user: user.get("login", ""),
+        "name": lambda user: f"{user['firstname']} {user['lastname']}"
+    })
+    matches = match_identities(leavers, index)
+    memberships, errors = fetch_for_accounts("redmine_manager", get_redmine_memberships, [user["id"] for _, user, _ in matches])
+
+    return [
+        make_row("Redmine", leaver, keys, user["id"], f"{user['firstname']} {user['lastname']}", user.get("login", ""),
+                 "활성" if user.get("status") == 1 else "잠금", memberships.get(user["id"], []), errors.get(user["id"]))
+        for leaver, user, keys in matches
+    ]
+
+# Grafana
+
+@ttl_cache("grafana_manager", "audit_users", "GRAFANA_URL")
+def get_grafana_users():
+    """Grafana 전체 사용자 목록 (서버 관리자 권한 필요)"""
+    return fetch_grafana_pages("api/users/search", "users")
+
+def get_grafana_teams(user_id):
+    """Grafana 사용자의 소속 팀 이름 목록"""
+    return [team["name"] for team in fetch_grafana_user_teams(user_id)]
+
+def check_grafana(leavers):
+    """퇴사자의 Grafana 계정과 팀 멤버십 점검"""
+    index = IdentityIndex(get_grafana_users(), {
+        "email": lambda user: user.get("email", ""),
+        "login": lambda user: user.get("login", ""),
+        "name": lambda user: user.get("name", "")
+    })
+    matches = match_identities(leavers, index)
+    teams, errors = fetch_for_accounts("grafana_manager", get_grafana_teams, [user["id"] for _, user, _ in matches])
+
+    return [
+        make_row("Grafana", leaver, keys, user["id"], user.get("name", ""), user.get("login", ""),
+                 "비활성" if user.get("isDisabled") else "활성", teams.get(user["id"], []), errors.get(user["id"]))
+        for leaver, user, keys in matches
+    ]
+
+# 서비스별 점검 함수와 필요한 환경변수
+SYSTEM_CHECKS = {
+    "GitLab": (check_gitlab, ["GITLAB_HOST", "GITLAB_TOKEN"]),
+    "Redmine": (check_redmine, ["REDMINE_URL", "REDMINE_API_KEY"]),
+    "Grafana": (check_grafana, ["GRAFANA_URL", "GRAFANA_USERNAME", "GRAFANA_PASSWORD"])
+}
+
+def run_leaver_audit(leavers, systems=None):
+    """퇴사자 목록을 여러 서비스 계정과 동시에 대조
+
+    Args:
+        leavers (list): 퇴사자 목록 (name, email, uid, employee_id)
+        systems (list, optional): 점검할 서비스 (기본값: 전체)
+
+    Returns:
+        tuple: (보고서 행 목록, {서비스: {"status": 완료/건너뜀/실패, "accounts": 매칭 계정 수, "message": 메시지}})
+    """
+    systems = [system for system in (systems or AUDIT_SYSTEMS) if system in SYSTEM_CHECKS]
+    summary = {}
+    runnable = []
+
+    for system in systems:
+        missing = [env for env in SYSTEM_CHECKS[system][1] if not os.environ.get(env)]
+        if missing:
+            summary[system] = {"status": "건너뜀", "accounts": 0, "message": f"설정 없음: {', '.join(missing)}"}
+        else:
+            runnable.append(system)
+
+    rows = []
+    if runnable:
+        with ThreadPoolExecutor(max_workers=len(runnable)) as executor:
+            futures = {system: executor.submit(SYSTEM_CHECKS[system][0], leavers) for system in runnable}
+
+        for system in runnable:
+            try:
+                system_rows = futures[system].result()
+                rows.extend(system_rows)
+                failed = sum(1 for row in system_rows if row["권한수"] is None)
+                message = f"{failed}개 계정의 권한 조회 실패" if failed else ""
+                summary[system] = {"status": "완료", "accounts": len(system_rows), "message": message}
+            except Exception as e:
+                summary[system] = {"status": "실패", "accounts": 0, "message": str(e)}
+
+    return rows, summary
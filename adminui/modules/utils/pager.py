@@ -0,0 +1,77 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# 기본 동시 요청 수 및 초당 요청 수
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_REQUESTS_PER_SECOND = 5
+
+class TokenBucket:
+    """토큰 버킷 방식의 요청 속도 제한기
+
+    고정 sleep 대신 초당 rate 개의 토큰을 채우고, 요청마다 토큰 하나를 소비합니다.
+    여러 스레드에서 동시에 사용해도 안전합니다.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1, rate))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        if self.rate <= 0:
+            return
+
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+def fetch_paginated(fetch_page, max_workers=DEFAULT_MAX_WORKERS, rate_limiter=None):
+    """페이지 단위 API를 병렬로 조회하여 하나의 목록으로 합칩니다.
+
+    첫 페이지 응답에서 전체 페이지 수를 알 수 있으면 나머지 페이지를 동시에 요청하고,
+    알 수 없으면 빈 페이지가 나올 때까지 순차적으로 요청합니다.
+    결과는 항상 페이지 순서대로 합쳐집니다.
+
+    Args:
+        fetch_page (callable): page(1부터 시작)를 받아 (items, total_pages)를 반환하는 함수.
+            total_pages를 알 수 없으면 None을 반환
+        max_workers (int): 최대 동시 요청 수
+        rate_limiter (TokenBucket, optional): 요청 속도 제한기
+
+    Returns:
+        list: 모든 페이지의 항목
+    """
+    def fetch(page):
+        if rate_limiter:
+            rate_limiter.acquire()
+        return fetch_page(page)
+
+    items, total_pages = fetch(1)
+    pages = [items]
+
+    if total_pages is None:
+        # 전체 페이지 수를 알 수 없는 경우 순차 조회
+        page = 2
+        while items:
+            items, _ = fetch(page)
+            pages.append(items)
+            page += 1
+    elif total_pages > 1:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            pages.extend(executor.map(lambda page: fetch(page)[0], range(2, total_pages + 1)))
+
+    return [item for page_items in pages for item in page_items]
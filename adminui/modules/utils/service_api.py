@@ -0,0 +1,150 @@
+import os
+from requests.auth import HTTPBasicAuth
+from modules.utils import http_client
+from modules.utils.cache import ttl_cache
+from modules.utils.config import get_module_setting
+from modules.utils.pager import TokenBucket, fetch_paginated, DEFAULT_MAX_WORKERS, DEFAULT_REQUESTS_PER_SECOND
+
+# GitLab, Redmine, Grafana 목록/계정별 API 공용 조회 함수 (관리 모듈과 퇴사자 감사에서 함께 사용)
+# 워커 스레드에서도 호출되므로 st.* 를 호출하지 않고, 실패는 예외로 올립니다.
+
+# Redmine 목록 API의 페이지당 최대 항목 수
+REDMINE_PAGE_LIMIT = 100
+
+# Grafana 검색 API(/api/users/search, /api/teams/search)의 페이지당 항목 수
+GRAFANA_PAGE_SIZE = 1000
+
+def get_pager_settings(module_id):
+    """config/modules/<id>.json의 병렬 조회 설정 (동시 요청 수, 초당 요청 수) 로드"""
+    max_workers = int(get_module_setting(module_id, "max_workers", DEFAULT_MAX_WORKERS))
+    requests_per_second = float(get_module_setting(module_id, "requests_per_second", DEFAULT_REQUESTS_PER_SECOND))
+    return max_workers, requests_per_second
+
+def fetch_gitlab_pages(endpoint, params=None):
+    """GitLab 목록 API의 모든 페이지를 병렬로 조회
+
+    첫 페이지 응답의 X-Total-Pages 헤더로 전체 페이지 수를 확인한 뒤
+    나머지 페이지를 설정된 동시 요청 수와 속도 제한 내에서 동시에 요청합니다.
+
+    Args:
+        endpoint (str): API 경로 (예: "projects")
+        params (dict, optional): 추가 쿼리 파라미터
+
+    Returns:
+        list: 모든 페이지의 항목
+    """
+    gitlab_host = os.environ.get("GITLAB_HOST")
+    gitlab_token = os.environ.get("GITLAB_TOKEN")
+    headers = {"PRIVATE-TOKEN": gitlab_token}
+    url = f"{gitlab_host}/api/v4/{endpoint}"
+
+    def fetch_page(page):
+        response = http_client.get(url, module_id="gitlab_manager", headers=headers, params={**(params or {}), "per_page": 100, "page": page})
+        response.raise_for_status()
+
+        # 대용량 목록(1만 건 이상)에서는 GitLab이 X-Total-Pages를 생략함
+        total_pages = response.headers.get("X-Total-Pages")
+        return response.json(), int(total_pages) if total_pages else None
+
+    max_workers, requests_per_second = get_pager_settings("gitlab_manager")
+    return fetch_paginated(fetch_page, max_workers=max_workers, rate_limiter=TokenBucket(requests_per_second))
+
+def fetch_redmine_pages(endpoint, key, params=None, rate_limiter=None):
+    """Redmine 목록 API의 모든 페이지를 병렬로 조회
+
+    첫 페이지 응답의 total_count로 나머지 offset을 모두 계산한 뒤
+    설정된 동시 요청 수와 속도 제한 내에서 동시에 요청하고, offset 순서대로 합칩니다.
+
+    Args:
+        endpoint (str): API 경로 (예: "projects.json")
+        key (str): 응답에서 항목 목록이 담긴 키 (예: "projects")
+        params (dict, optional): 추가 쿼리 파라미터
+        rate_limiter (TokenBucket, optional): 여러 조회가 함께 사용할 속도 제한기 (기본값: 설정값으로 새로 생성)
+
+    Returns:
+        list: 모든 페이지의 항목
+    """
+    redmine_url = os.environ.get("REDMINE_URL")
+    redmine_api_key = os.environ.get("REDMINE_API_KEY")
+    headers = {"X-Redmine-API-Key": redmine_api_key}
+    url = f"{redmine_url}/{endpoint}"
+
+    def fetch_page(page):
+        offset = (page - 1) * REDMINE_PAGE_LIMIT
+        response = http_client.get(url, module_id="redmine_manager", headers=headers, params={**(params or {}), "offset": offset, "limit": REDMINE_PAGE_LIMIT})
+        response.raise_for_status()
+
+        data = response.json()
+        # total_count가 없는 응답은 빈 페이지가 나올 때까지 순차 조회
+        total_count = data.get("total_count")
+        total_pages = -(-int(total_count) // REDMINE_PAGE_LIMIT) if total_count is not None else None
+        return data[key], total_pages
+
+    max_workers, requests_per_second = get_pager_settings("redmine_manager")
+    return fetch_paginated(fetch_page, max_workers=max_workers, rate_limiter=rate_limiter or TokenBucket(requests_per_second))
+
+@ttl_cache("gitlab_manager", "user_memberships", "GITLAB_HOST")
+def fetch_gitlab_user_memberships(user_id):
+    """GitLab 사용자 한 명의 프로젝트/그룹 멤버십 (관리자 토큰 필요)"""
+    return fetch_gitlab_pages(f"users/{user_id}/memberships")
+
+@ttl_cache("redmine_manager", "user_memberships", "REDMINE_URL")
+def fetch_redmine_user_memberships(user_id):
+    """Redmine 사용자 한 명의 프로젝트 멤버십"""
+    redmine_url = os.environ.get("REDMINE_URL")
+    redmine_api_key = os.environ.get("REDMINE_API_KEY")
+    headers = {"X-Redmine-API-Key": redmine_api_key}
+    url = f"{redmine_url}/users/{user_id}.json"
+
+    response = http_client.get(url, module_id="redmine_manager", headers=headers, params={"include": "memberships"})
+    response.raise_for_status()
+
+    return response.json()["user"].get("memberships", [])
+
+def get_grafana_auth():
+    """Grafana 관리자 계정 기본 인증"""
+    return HTTPBasicAuth(os.environ.get("GRAFANA_USERNAME"), os.environ.get("GRAFANA_PASSWORD"))
+
+def fetch_grafana_pages(endpoint, key):
+    """Grafana 검색 API의 모든 페이지를 병렬로 조회
+
+    첫 페이지 응답의 totalCount로 전체 페이지 수를 계산한 뒤 나머지 페이지를 동시에 요청합니다.
+
+    Args:
+        endpoint (str): API 경로 (예: "api/teams/search")
+        key (str): 응답에서 항목 목록이 담긴 키 (예: "teams")
+
+    Returns:
+        list: 모든 페이지의 항목
+    """
+    url = f"{os.environ.get('GRAFANA_URL')}/{endpoint}"
+    auth = get_grafana_auth()
+
+    def fetch_page(page):
+        response = http_client.get(url, module_id="grafana_manager", auth=auth, params={"perpage": GRAFANA_PAGE_SIZE, "page": page})
+        response.raise_for_status()
+        data = response.json()
+        return data[key], -(-int(data.get("totalCount", 0)) // GRAFANA_PAGE_SIZE)
+
+    max_workers, requests_per_second = get_pager_settings("grafana_manager")
+    return fetch_paginated(fetch_page, max_workers=max_workers, rate_limiter=TokenBucket(requests_per_second))
+
+@ttl_cache("grafana_manager", "user_teams", "GRAFANA_URL")
+def fetch_grafana_user_teams(user_id):
+    """Grafana 사용자 한 명의 소속 팀 목록 (서버 관리자 권한 필요)"""
+    url = f"{os.environ.get('GRAFANA_URL')}/api/users/{user_id}/teams"
+    response = http_client.get(url, module_id="grafana_manager", auth=get_grafana_auth())
+    response.raise_for_status()
+    return response.json()
+
+def get_redmine_employee_id(user):
+    """Redmine 사용자 객체에서 사번/ID 추출 (사번 사용자 정의 필드 또는 사번 형식의 로그인 ID)"""
+    for field in user.get("custom_fields", []):
+        if field.get("name", "").lower() in ["사번", "employeeid", "employee_id"]:
+            return field.get("value", "")
+
+    login = user.get("login", "")
+    if login.startswith(("A0", "K1", "K9")):
+        return login
+
+    return ""
@@ -1,6 +1,6 @@
-import requests
 import streamlit as st
 from packaging import version
+from modules.utils import http_client
 import re
 
 def get_latest_version(repo_url):
@@ -60,7 +60,7 @@ def check_github_release(repo_url):
         api_url = f"https://api.github.com/repos/{repo_path}/releases/latest"
         
         # API 요청
-        response = requests.get(api_url, timeout=5)
+        response = http_client.get(api_url, timeout=5, max_retries=0)
         response.raise_for_status()
         
         # 릴리스 정보 추출
@@ -103,7 +103,7 @@ def check_github_tags(repo_url):
         api_url = f"https://api.github.com/repos/{repo_path}/tags"
 
         # API 요청
-        response = requests.get(api_url, timeout=5)
+        response = http_client.get(api_url, timeout=5, max_retries=0)
         response.raise_for_status()
 
         # 태그 목록 추출
@@ -170,7 +170,7 @@ def check_gitlab_tags(repo_url):
         api_url = f"https://gitlab.com/api/v4/projects/{encoded_path}/repository/tags"
 
         # API 요청
-        response = requests.get(api_url, timeout=5)
+        response = http_client.get(api_url, timeout=5, max_retries=0)
         response.raise_for_status()
 
         # 태그 목록 추출
@@ -1,25 +1,35 @@
 import requests
 import csv
 import os
+import argparse
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
+import warehouse
 
 # .env 파일에서 환경변수 로드
 load_dotenv()
 
-GITLAB_HOST = os.getenv("GITLAB_HOST") 
-TOKEN = os.getenv("GITLAB_TOKEN") 
+GITLAB_HOST = os.getenv("GITLAB_HOST")
+TOKEN = os.getenv("GITLAB_TOKEN")
 HEADERS = {"PRIVATE-TOKEN": TOKEN}
-OUTPUT_FILE = "gitlab_repolist.csv" 
+OUTPUT_FILE = "gitlab_repolist.csv"
 
-def get_all_projects():
+# GitLab은 last_activity_at을 최대 1시간 간격으로 갱신하므로 증분 조회 시 여유를 둠
+ACTIVITY_LAG = timedelta(hours=1)
+
+def get_all_projects(params=None, strict=False):
     projects = []
     page = 1
 
     while True:
-        url = f"{GITLAB_HOST}/api/v4/projects?per_page=100&page={page}" 
-        response = requests.get(url, headers=HEADERS)
+        url = f"{GITLAB_HOST}/api/v4/projects"
+        response = requests.get(url, headers=HEADERS, params={**(params or {}), "per_page": 100, "page": page})
 
         if response.status_code != 200:
+            # 스냅샷 갱신 시에는 일부 페이지만 받은 목록을 반영하면 안 되므로 중단
+            if strict:
+                raise RuntimeError(f"프로젝트 목록 조회 실패: {response.status_code}")
             print(f"Error: {response.status_code}")
             break
         data = response.json()
@@ -31,8 +41,62 @@ def get_all_projects():
 
     return projects
 
-# 프로젝트 데이터 가져오기
-projects = get_all_projects()
+def sync_warehouse(conn, full=False):
+    """웨어하우스 projects 테이블을 갱신하고 전체 프로젝트 목록을 반환
+
+    처음이거나 full=True이면 전체 목록을 받고, 이후에는 last_activity_after로
+    변경분만 받은 뒤 simple 목록으로 삭제/누락된 프로젝트를 반영합니다.
+    """
+    started_at = datetime.now(timezone.utc)
+
+    warehouse.check_project_host(conn, GITLAB_HOST)
+    last_sync = warehouse.get_state(conn, warehouse.LAST_SYNC_KEY)
+
+    if full or not last_sync:
+        print("🔄 전체 프로젝트 목록 조회 중...")
+        projects = get_all_projects(strict=True)
+        warehouse.replace_projects(conn, projects)
+    else:
+        synced_at = datetime.strptime(last_sync, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+        cutoff = (synced_at - ACTIVITY_LAG).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+        print(f"🔄 {cutoff} 이후 변경된 프로젝트 조회 중...")
+        changed = get_all_projects({"last_activity_after": cutoff}, strict=True)
+
+        print("🔍 삭제된 프로젝트 확인 중...")
+        listing = get_all_projects({"simple": "true"}, strict=True)
+        listed_ids = {p["id"] for p in listing}
+        stored_ids = warehouse.project_ids(conn)
+        deleted_ids = stored_ids - listed_ids
+
+        warehouse.upsert_projects(conn, changed)
+        warehouse.delete_projects(conn, deleted_ids)
+
+        # 활동 시각이 갱신되지 않은 신규 프로젝트는 전체 정보를 따로 받아 추가
+        missing_ids = listed_ids - stored_ids - {p["id"] for p in changed}
+        missing = []
+        for project_id in missing_ids:
+            response = requests.get(f"{GITLAB_HOST}/api/v4/projects/{project_id}", headers=HEADERS)
+            if response.status_code == 200:
+                missing.append(response.json())
+        warehouse.upsert_projects(conn, missing)
+
+        print(f"✅ 변경 {len(changed)}개, 신규 {len(missing_ids)}개, 삭제 {len(deleted_ids)}개 반영")
+
+    warehouse.set_state(conn, warehouse.LAST_SYNC_KEY, started_at.strftime("%Y-%m-%dT%H:%M:%SZ"))
+    return warehouse.load_projects(conn)
+
+parser = argparse.ArgumentParser(description="GitLab 전체 프로젝트 목록 추출")
+parser.add_argument("--incremental", action="store_true", help=f"{warehouse.WAREHOUSE_FILE} 웨어하우스의 프로젝트 목록을 유지하고 변경된 프로젝트만 조회")
+parser.add_argument("--full", action="store_true", help="증분 모드에서 프로젝트 목록을 전체 다시 동기화")
+args = parser.parse_args()
+
+# 프로젝트 데이터 가져오기 (증분 모드는 웨어하우스를 함께 갱신)
+if args.incremental:
+    with closing(warehouse.connect()) as conn:
+        projects = sync_warehouse(conn, full=args.full)
+else:
+    projects = get_all_projects()
 
 # CSV 저장
 with open(OUTPUT_FILE, "w", newline="") as csvfile:
@@ -52,3 +116,9 @@ with open(OUTPUT_FILE, "w", newline="") as csvfile:
         ])
 
 print(f"총 {len(projects)}개의 프로젝트를 {OUTPUT_FILE}에 저장 완료했습니다.")
+
+# 로컬 웨어하우스 갱신 (adminui gitlab_manager에서 조회)
+if not args.incremental:
+    with closing(warehouse.connect()) as conn:
+        warehouse.replace_projects(conn, projects)
+print(f"웨어하우스 갱신 완료: {warehouse.WAREHOUSE_FILE}")
@@ -1,36 +1,122 @@
-import requests
+import asyncio
+import aiohttp
+import argparse
 import json
 import csv
 import os
+import time
+from contextlib import closing
 from dotenv import load_dotenv
+from checkpoint import CheckpointJournal
+import warehouse
+from datamodel import MEMBERSHIPS_FILE, COMMITS_FILE, MEMBERSHIP_COLUMNS, COMMIT_COLUMNS, MAX_MAINTAINERS, MAX_DEVELOPERS, MAX_COMMITS, membership_rows, commit_rows
 
 # .env 파일에서 환경변수 로드
 load_dotenv()
 
-GITLAB_HOST = os.getenv("GITLAB_HOST") 
-TOKEN = os.getenv("GITLAB_TOKEN") 
+GITLAB_HOST = os.getenv("GITLAB_HOST")
+TOKEN = os.getenv("GITLAB_TOKEN")
 HEADERS = {"PRIVATE-TOKEN": TOKEN}
-JSON_FILE = "gitlab_all_memberlist.json" 
-CSV_FILE = "gitlab_all_memberlist.csv" 
+JSON_FILE = "gitlab_all_memberlist.json"
+CSV_FILE = "gitlab_all_memberlist.csv"
+JOURNAL_FILE = "gitlab_all_memberlist.jsonl"  # 프로젝트별 수집 결과 체크포인트
 
-def get_project_members(project_id):
+MAX_CONCURRENCY = int(os.getenv("GITLAB_MAX_CONCURRENCY", "8"))  # 동시 요청(커넥션) 수
+RATE_LIMIT_MARGIN = 5  # RateLimit-Remaining이 이 값 이하가 되면 RateLimit-Reset까지 대기
+MAX_RETRIES = 3  # 429/5xx/네트워크 오류 재시도 횟수
+
+CSV_HEADER = (
+    ["project_id", "owner"] +
+    ["maintainer" + str(i) for i in range(1, MAX_MAINTAINERS + 1)] +
+    ["developer" + str(i) for i in range(1, MAX_DEVELOPERS + 1)] +
+    ["commit_user" + str(i) for i in range(1, MAX_COMMITS + 1)] +
+    ["commit_date" + str(i) for i in range(1, MAX_COMMITS + 1)]
+)
+
+# 와이드 행에서 커밋자/커밋 날짜 컬럼 위치 (이전 형식 체크포인트 복원용)
+COMMIT_USER_SLICE = slice(CSV_HEADER.index("commit_user1"), CSV_HEADER.index("commit_user1") + MAX_COMMITS)
+COMMIT_DATE_SLICE = slice(CSV_HEADER.index("commit_date1"), CSV_HEADER.index("commit_date1") + MAX_COMMITS)
+
+class RateLimitGate:
+    """GitLab RateLimit-* 응답 헤더를 보고 한도가 소진되면 모든 요청을 잠시 멈춤"""
+
+    def __init__(self):
+        self.resume_at = 0.0
+
+    async def wait(self):
+        delay = self.resume_at - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update(self, response):
+        if response.status == 429:
+            retry_after = response.headers.get("Retry-After", "")
+            delay = float(retry_after) if retry_after.isdigit() else 1.0
+            self.resume_at = max(self.resume_at, time.time() + delay)
+            return
+
+        remaining = response.headers.get("RateLimit-Remaining", "")
+        reset = response.headers.get("RateLimit-Reset", "")  # 한도가 초기화되는 Unix 시각
+        if remaining.isdigit() and reset.isdigit() and int(remaining) <= RATE_LIMIT_MARGIN:
+            self.resume_at = max(self.resume_at, float(reset))
+
+async def get_json(session, gate, url, params=None):
+    """GET 요청 후 (상태 코드, JSON, Link 헤더) 반환 (429/5xx/네트워크 오류는 재시도)"""
+    for attempt in range(MAX_RETRIES + 1):
+        await gate.wait()
+        try:
+            async with session.get(url, params=params) as response:
+                gate.update(response)
+
+                if (response.status == 429 or response.status >= 500) and attempt < MAX_RETRIES:
+                    await asyncio.sleep(2 ** attempt)
+                    continue
+                if response.status != 200:
+                    return response.status, None, response.links
+
+                return response.status, await response.json(), response.links
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt == MAX_RETRIES:
+                raise
+            await asyncio.sleep(2 ** attempt)
+
+async def get_project_ids(session, gate):
+    """프로젝트 목록에서 실제 존재하는 프로젝트 ID 조회 (keyset 페이지네이션)"""
+    project_ids = []
+    url = f"{GITLAB_HOST}/api/v4/projects"
+    params = {"pagination": "keyset", "order_by": "id", "sort": "asc", "per_page": 100, "simple": "true"}
+
+    while url:
+        status, data, links = await get_json(session, gate, url, params)
+        if status != 200:
+            raise RuntimeError(f"프로젝트 목록 조회 실패: {status}")
+
+        project_ids.extend(project["id"] for project in data)
+
+        # 다음 페이지 URL에 커서와 파라미터가 모두 포함되어 있음
+        next_link = links.get("next")
+        url = str(next_link["url"]) if next_link else None
+        params = None
+
+    return project_ids
+
+async def get_project_members(session, gate, project_id):
     members = []
     page = 1
     per_page = 100  # GitLab API 최대 100개씩 조회 가능
 
     while True:
-        url = f"{GITLAB_HOST}/api/v4/projects/{project_id}/members/all" 
+        url = f"{GITLAB_HOST}/api/v4/projects/{project_id}/members/all"
         params = {"per_page": per_page, "page": page}
-        response = requests.get(url, headers=HEADERS, params=params)
+        status, data, _ = await get_json(session, gate, url, params)
 
-        if response.status_code == 404:
+        if status == 404:
             print(f"프로젝트 id={project_id}는 삭제됨.")
             return None
-        if response.status_code != 200:
-            print(f"프로젝트 id={project_id} 조회 실패: {response.status_code}")
+        if status != 200:
+            print(f"프로젝트 id={project_id} 조회 실패: {status}")
             return None
 
-        data = response.json()
         if not data:
             break
 
@@ -43,18 +129,17 @@ def get_project_owner(members):
     for member in members:
         if member.get("access_level") == 50:
             return member.get("name", "")
-    return "" 
+    return ""
 
-def get_commit_authors(project_id):
-    url = f"{GITLAB_HOST}/api/v4/projects/{project_id}/repository/commits" 
-    params = {"per_page": 20}  # 최근 20개 커밋 조회
-    response = requests.get(url, headers=HEADERS, params=params)
+async def get_commit_authors(session, gate, project_id):
+    url = f"{GITLAB_HOST}/api/v4/projects/{project_id}/repository/commits"
+    params = {"per_page": MAX_COMMITS}  # 최근 커밋 조회
+    status, commits, _ = await get_json(session, gate, url, params)
 
-    if response.status_code != 200:
-        print(f"프로젝트 id={project_id} 커밋 조회 실패: {response.status_code}")
+    if status != 200:
+        print(f"프로젝트 id={project_id} 커밋 조회 실패: {status}")
         return [], []  # 커밋 내역이 없으면 빈 리스트 반환
 
-    commits = response.json()
     if not commits:
         return [], []
 
@@ -64,52 +149,116 @@ def get_commit_authors(project_id):
     # (이름, 날짜) 튜플을 분리하여 리스트로 변환
     authors, dates = zip(*unique_authors) if unique_authors else ([], [])
 
-    return list(authors)[:20], list(dates)[:20]  # 최대 20개 유지
-
-all_members = {}
-csv_data = []
-
-for project_id in range(1, 1330):
-    members = get_project_members(project_id)
-
-    if members is not None:
-        # 프로젝트 생성자의 이름(오너)을 가져옴
-        owner = get_project_owner(members)
-
-        # 중복 제거 후 메인테이너 및 디벨로퍼 이름 수집
-        maintainer_names = list(set(m.get("name", "") for m in members if m.get("access_level") == 40))[:25]
-        developer_names = list(set(m.get("name", "") for m in members if m.get("access_level") == 30))[:20]
-
-        # 커밋자 정보 가져오기
-        commit_authors_names, commit_authors_dates = get_commit_authors(project_id)
-
-        # 리스트 크기가 부족할 경우 빈 문자열로 채움
-        maintainer_names += [""] * (25 - len(maintainer_names))
-        developer_names += [""] * (20 - len(developer_names))
-        commit_authors_names += [""] * (20 - len(commit_authors_names))
-        commit_authors_dates += [""] * (20 - len(commit_authors_dates))
-
-        # CSV 데이터에 모든 정보 추가
-        csv_data.append(
-            [project_id, owner] + maintainer_names + developer_names + commit_authors_names + commit_authors_dates
-        )
-
-# JSON 파일 저장
-with open(JSON_FILE, "w", encoding="utf-8") as f:
-    json.dump(all_members, f, ensure_ascii=False, indent=4)
-
-# CSV 파일 저장
-with open(CSV_FILE, "w", encoding="utf-8-sig", newline="") as f:
-    writer = csv.writer(f)
-    writer.writerow(
-        ["project_id", "owner"] + 
-        ["maintainer" + str(i) for i in range(1, 26)] + 
-        ["developer" + str(i) for i in range(1, 21)] + 
-        ["commit_user" + str(i) for i in range(1, 21)] + 
-        ["commit_date" + str(i) for i in range(1, 21)]
-    )
-    for row in csv_data:
-        writer.writerow(row)
-
-print(f"- JSON 저장 완료: {JSON_FILE}")
-print(f"- CSV 저장 완료: {CSV_FILE}")
+    return list(authors)[:MAX_COMMITS], list(dates)[:MAX_COMMITS]  # 최대 MAX_COMMITS개 유지
+
+def make_csv_row(project_id, members, commit_authors_names, commit_authors_dates):
+    # 프로젝트 생성자의 이름(오너)을 가져옴
+    owner = get_project_owner(members)
+
+    # 중복 제거 후 메인테이너 및 디벨로퍼 이름 수집
+    maintainer_names = list(set(m.get("name", "") for m in members if m.get("access_level") == 40))[:MAX_MAINTAINERS]
+    developer_names = list(set(m.get("name", "") for m in members if m.get("access_level") == 30))[:MAX_DEVELOPERS]
+
+    # 리스트 크기가 부족할 경우 빈 문자열로 채움 (전체 목록은 memberships/commits 테이블에 기록)
+    maintainer_names += [""] * (MAX_MAINTAINERS - len(maintainer_names))
+    developer_names += [""] * (MAX_DEVELOPERS - len(developer_names))
+    commit_authors_names = commit_authors_names + [""] * (MAX_COMMITS - len(commit_authors_names))
+    commit_authors_dates = commit_authors_dates + [""] * (MAX_COMMITS - len(commit_authors_dates))
+
+    return [project_id, owner] + maintainer_names + developer_names + commit_authors_names + commit_authors_dates
+
+async def collect_project(session, gate, semaphore, project_id):
+    """프로젝트 하나의 멤버/커밋자를 동시에 조회 (실패 시 None)"""
+    try:
+        async with semaphore:
+            members, (names, dates) = await asyncio.gather(
+                get_project_members(session, gate, project_id),
+                get_commit_authors(session, gate, project_id)
+            )
+    except Exception as e:
+        print(f"프로젝트 id={project_id} 조회 실패: {e}")
+        return None
+
+    if members is None:
+        return None
+
+    return project_id, members, (names, dates), make_csv_row(project_id, members, names, dates)
+
+async def main(resume=False):
+    all_members = {}
+
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENCY)
+    # 커넥션 풀 대기 시간은 제외하고 연결/응답 시간만 제한
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=60)
+
+    with CheckpointJournal(JOURNAL_FILE, resume=resume) as journal, closing(warehouse.connect()) as conn:
+        async with aiohttp.ClientSession(headers=HEADERS, connector=connector, timeout=timeout) as session:
+            gate = RateLimitGate()
+            semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+            project_ids = await get_project_ids(session, gate)
+            pending_ids = [project_id for project_id in project_ids if project_id not in journal]
+            if resume:
+                print(f"♻️ 체크포인트에서 {len(project_ids) - len(pending_ids)}개 프로젝트 재사용")
+            print(f"🚀 프로젝트 {len(pending_ids)}개 멤버/커밋 조회 시작 (동시 요청 {MAX_CONCURRENCY}개)")
+
+            # 완료되는 순서대로 CSV(와이드 리포트, memberships, commits 테이블)에 바로 기록
+            with open(CSV_FILE, "w", encoding="utf-8-sig", newline="") as f, \
+                    open(MEMBERSHIPS_FILE, "w", encoding="utf-8-sig", newline="") as memberships_f, \
+                    open(COMMITS_FILE, "w", encoding="utf-8-sig", newline="") as commits_f:
+                writer = csv.writer(f)
+                writer.writerow(CSV_HEADER)
+                memberships_writer = csv.writer(memberships_f)
+                memberships_writer.writerow(MEMBERSHIP_COLUMNS)
+                commits_writer = csv.writer(commits_f)
+                commits_writer.writerow(COMMIT_COLUMNS)
+
+                def write_project(project_id, members, commits, row):
+                    all_members[project_id] = members
+                    writer.writerow(row)
+                    memberships_writer.writerows(membership_rows(project_id, members))
+                    commits_writer.writerows(commit_rows(project_id, *commits))
+                    warehouse.replace_project_members(conn, project_id, members, commits)
+
+                # 이전 실행에서 완료된 프로젝트 (현재 목록에 있는 것만)
+                for project_id in project_ids:
+                    if project_id in journal:
+                        record = journal.get(project_id)
+                        # commits가 없는 이전 형식의 체크포인트는 와이드 행에서 복원
+                        commits = record.get("commits") or (
+                            [name for name in record["row"][COMMIT_USER_SLICE] if name],
+                            [date for date in record["row"][COMMIT_DATE_SLICE] if date]
+                        )
+                        write_project(project_id, record["members"], commits, record["row"])
+
+                tasks = [collect_project(session, gate, semaphore, project_id) for project_id in pending_ids]
+                for done, task in enumerate(asyncio.as_completed(tasks), start=1):
+                    result = await task
+                    if result:
+                        project_id, members, commits, row = result
+                        journal.add(project_id, {"members": members, "commits": commits, "row": row})
+                        write_project(project_id, members, commits, row)
+                        for file in (f, memberships_f, commits_f):
+                            file.flush()
+
+                    if done % 100 == 0:
+                        print(f"📝 {done}/{len(pending_ids)}개 처리 완료...")
+
+            # 삭제된 프로젝트의 멤버/커밋자는 웨어하우스에서 제거
+            warehouse.prune_project_members(conn, project_ids)
+
+    # JSON 파일 저장
+    with open(JSON_FILE, "w", encoding="utf-8") as f:
+        json.dump(all_members, f, ensure_ascii=False, indent=4)
+
+    print(f"- JSON 저장 완료: {JSON_FILE}")
+    print(f"- CSV 저장 완료: {CSV_FILE}")
+    print(f"- 정규화 테이블 저장 완료: {MEMBERSHIPS_FILE}, {COMMITS_FILE}")
+    print(f"- 웨어하우스 갱신 완료: {warehouse.WAREHOUSE_FILE}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="GitLab 프로젝트별 멤버/커밋자 수집")
+    parser.add_argument("--resume", action="store_true", help=f"{JOURNAL_FILE} 체크포인트에 기록된 프로젝트는 건너뛰고 이어서 수집")
+    args = parser.parse_args()
+
+    asyncio.run(main(resume=args.resume))
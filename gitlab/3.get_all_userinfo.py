@@ -3,7 +3,11 @@ import json
 import csv
 import os
 import time
+import argparse
+from contextlib import closing
 from dotenv import load_dotenv
+from checkpoint import CheckpointJournal
+import warehouse
 
 # .env 파일 로드
 load_dotenv()
@@ -16,6 +20,7 @@ HEADERS = {"PRIVATE-TOKEN": TOKEN}
 # 저장할 파일명
 JSON_FILE = "gitlab_allusers.json"
 CSV_FILE = "gitlab_allusers.csv"
+JOURNAL_FILE = "gitlab_allusers.jsonl"  # 유저별 상세 정보 체크포인트
 
 
 def get_all_users():
@@ -59,44 +64,71 @@ def get_user_details(user_id):
     return response.json()
 
 
-# 전체 유저 리스트 가져오기
-print("🚀 전체 유저 리스트 조회 시작...")
-users = get_all_users()
-print(f"✅ 전체 유저 {len(users)}명 조회 완료!")
-
-user_data = []
-
-for idx, user in enumerate(users, start=1):
-    user_id = user.get("id")
-    user_details = get_user_details(user_id)
-    
-    if user_details:
-        user_data.append({
-            "id": user_details.get("id"),
-            "username": user_details.get("username"),
-            "name": user_details.get("name"),
-            "email": user_details.get("email", ""),
-            "state": user_details.get("state"),
-            "created_at": user_details.get("created_at"),
-            "is_admin": user_details.get("is_admin"),
-            "last_sign_in_at": user_details.get("last_sign_in_at", ""),
-            "two_factor_enabled": user_details.get("two_factor_enabled"),
-            "external": user_details.get("external"),
-            "bio": user_details.get("bio", "").replace("\n", " "),
-            "organization": user_details.get("organization", ""),
-        })
-    
-    if idx % 50 == 0:
-        print(f"📝 {idx}명 처리 완료...")
-
-# JSON 파일 저장
-with open(JSON_FILE, "w", encoding="utf-8") as f:
-    json.dump(user_data, f, ensure_ascii=False, indent=4)
-print(f"✅ JSON 저장 완료: {JSON_FILE}")
-
-# CSV 파일 저장
-with open(CSV_FILE, "w", encoding="utf-8-sig", newline="") as f:
-    writer = csv.DictWriter(f, fieldnames=user_data[0].keys())
-    writer.writeheader()
-    writer.writerows(user_data)
-print(f"✅ CSV 저장 완료: {CSV_FILE}")
+def make_user_record(user_details):
+    return {
+        "id": user_details.get("id"),
+        "username": user_details.get("username"),
+        "name": user_details.get("name"),
+        "email": user_details.get("email", ""),
+        "state": user_details.get("state"),
+        "created_at": user_details.get("created_at"),
+        "is_admin": user_details.get("is_admin"),
+        "last_sign_in_at": user_details.get("last_sign_in_at", ""),
+        "two_factor_enabled": user_details.get("two_factor_enabled"),
+        "external": user_details.get("external"),
+        "bio": user_details.get("bio", "").replace("\n", " "),
+        "organization": user_details.get("organization", ""),
+    }
+
+
+def main(resume=False):
+    # 전체 유저 리스트 가져오기
+    print("🚀 전체 유저 리스트 조회 시작...")
+    users = get_all_users()
+    print(f"✅ 전체 유저 {len(users)}명 조회 완료!")
+
+    with CheckpointJournal(JOURNAL_FILE, resume=resume) as journal:
+        if resume:
+            print(f"♻️ 체크포인트에서 {len(journal)}명 정보 재사용")
+
+        for idx, user in enumerate(users, start=1):
+            user_id = user.get("id")
+            if user_id in journal:
+                continue
+
+            user_details = get_user_details(user_id)
+
+            # 조회에 성공한 유저만 기록 (실패한 유저는 --resume 시 다시 조회)
+            if user_details:
+                journal.add(user_id, make_user_record(user_details))
+
+            if idx % 50 == 0:
+                print(f"📝 {idx}명 처리 완료...")
+
+        # 유저 목록 순서대로 정리
+        user_data = [journal.get(user.get("id")) for user in users if user.get("id") in journal]
+
+    # JSON 파일 저장
+    with open(JSON_FILE, "w", encoding="utf-8") as f:
+        json.dump(user_data, f, ensure_ascii=False, indent=4)
+    print(f"✅ JSON 저장 완료: {JSON_FILE}")
+
+    # CSV 파일 저장
+    with open(CSV_FILE, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=user_data[0].keys())
+        writer.writeheader()
+        writer.writerows(user_data)
+    print(f"✅ CSV 저장 완료: {CSV_FILE}")
+
+    # 로컬 웨어하우스 갱신 (adminui gitlab_manager에서 조회)
+    with closing(warehouse.connect()) as conn:
+        warehouse.replace_users(conn, user_data)
+    print(f"✅ 웨어하우스 갱신 완료: {warehouse.WAREHOUSE_FILE}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="GitLab 전체 유저 정보 수집")
+    parser.add_argument("--resume", action="store_true", help=f"{JOURNAL_FILE} 체크포인트에 기록된 유저는 건너뛰고 이어서 수집")
+    args = parser.parse_args()
+
+    main(resume=args.resume)
@@ -2,209 +2,257 @@ import pandas as pd
 import os
 import csv
 import sys
+import argparse
+
+# Parquet 출력은 pyarrow가 설치된 경우에만 사용 가능
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+from datamodel import MEMBERSHIPS_FILE, COMMITS_FILE, load_long_tables, long_to_wide
 
 # 파일 경로 설정
 REPO_FILE = "gitlab_repolist.csv"
 USER_FILE = "gitlab_allusers.csv"
 MEMBER_FILE = "gitlab_all_memberlist.csv"
 OUTPUT_FILE = "gitlab_integrated_data.csv"
+PARQUET_FILE = "gitlab_integrated_data.parquet"
 
 # 최대 그룹 depth 설정
 MAX_GROUP_DEPTH = 3  # 최대 3단계 그룹 (그룹이 많으면 조정 가능)
+MAX_MAINTAINERS = 18  # 통합 데이터에 포함할 최대 메인테이너 수
+
+# 멤버 파일에서 사용할 컬럼
+MEMBER_COLUMNS = (
+    ['owner'] +
+    [f'maintainer{i}' for i in range(1, MAX_MAINTAINERS + 1)] +
+    [f'developer{i}' for i in range(1, 21)] +
+    [f'commit_user{i}' for i in range(1, 21)] +
+    [f'commit_date{i}' for i in range(1, 21)]
+)
+
+# 최종 컬럼 순서
+FINAL_COLUMNS = (
+    ['id'] +
+    [f'group{i}' for i in range(1, MAX_GROUP_DEPTH + 1)] +
+    ['project', 'repository', 'description', 'url', 'created_at', 'last_update', 'archive'] +
+    MEMBER_COLUMNS
+)
+
+# 반복 값이 많은 컬럼은 category로 저장하여 메모리 절약
+CATEGORY_COLUMNS = [f'group{i}' for i in range(1, MAX_GROUP_DEPTH + 1)] + ['owner']
 
 def check_files_exist():
     """필요한 파일들이 존재하는지 확인"""
     missing_files = []
-    for file in [REPO_FILE, USER_FILE, MEMBER_FILE]:
+    for file in [REPO_FILE, USER_FILE]:
         if not os.path.exists(file):
             missing_files.append(file)
     
+    # 멤버 정보는 정규화 테이블(memberships, commits) 또는 와이드 멤버 리스트 중 하나만 있으면 됨
+    if not has_long_tables() and not os.path.exists(MEMBER_FILE):
+        missing_files.append(MEMBER_FILE)
+    
     if missing_files:
         print(f"❌ 다음 파일들이 존재하지 않습니다: {', '.join(missing_files)}")
         print("📌 먼저 get_all_repolist.py, get_all_userinfo.py, get_all_repo2user.py를 실행해주세요.")
         return False
     return True
 
-def merge_gitlab_data():
-    """GitLab 레포지토리, 유저, 멤버 정보를 통합"""
+def has_long_tables():
+    return os.path.exists(MEMBERSHIPS_FILE) and os.path.exists(COMMITS_FILE)
+
+def load_members():
+    """멤버/커밋 정보 로드 (필요한 컬럼만 문자열로 읽음)
+
+    정규화 테이블(memberships, commits)이 있으면 그 테이블에서 와이드 형식을 생성하고,
+    없으면 기존 와이드 멤버 리스트를 읽습니다.
+    """
+    if has_long_tables():
+        print(f"📂 정규화 테이블에서 멤버 정보 생성: {MEMBERSHIPS_FILE}, {COMMITS_FILE}")
+        memberships_df, commits_df = load_long_tables()
+        members_df = long_to_wide(memberships_df, commits_df, max_maintainers=MAX_MAINTAINERS)
+        return members_df[['project_id'] + MEMBER_COLUMNS]
+
+    header = pd.read_csv(MEMBER_FILE, nrows=0).columns
+    member_cols = [col for col in MEMBER_COLUMNS if col in header]
+
+    excess_maintainers = [col for col in header if col.startswith('maintainer') and col not in member_cols]
+    if excess_maintainers:
+        print(f"📝 메인테이너 컬럼 {MAX_MAINTAINERS}개로 제한됨 (초과 컬럼 {len(excess_maintainers)}개 제외)")
+
+    members_df = pd.read_csv(
+        MEMBER_FILE,
+        usecols=['project_id'] + member_cols,
+        dtype={col: "string" for col in member_cols}
+    )
+    return members_df
+
+def split_repository_paths(repos_df):
+    """repository 경로를 group1~N, project 컬럼으로 분리 (벡터 연산)"""
+    paths = repos_df['repository'].astype("string")
+    head_tail = paths.str.rsplit('/', n=1, expand=True)
+
+    # 마지막 부분은 항상 프로젝트 이름
+    repos_df['project'] = head_tail[head_tail.columns[-1]].fillna(paths)
+
+    # 나머지 부분을 그룹으로 분리 (최대 MAX_GROUP_DEPTH단계까지만 사용)
+    group_paths = head_tail[0].where(paths.str.contains('/', regex=False))
+    groups = group_paths.str.split('/', n=MAX_GROUP_DEPTH, expand=True)
+
+    for i in range(1, MAX_GROUP_DEPTH + 1):
+        group = groups[i - 1] if i - 1 in groups.columns else pd.Series(pd.NA, index=repos_df.index, dtype="string")
+        repos_df[f'group{i}'] = group.fillna("").astype("category")
+
+    # 기존 'group' 컬럼이 있다면 제거 (이제 group1, group2, group3로 대체)
+    if 'group' in repos_df.columns:
+        repos_df = repos_df.drop(columns=['group'])
+
+    return repos_df
+
+def merge_chunk(repos_df, members_df):
+    """레포지토리 청크와 멤버 정보를 병합하여 최종 컬럼 순서로 반환"""
+    repos_df = split_repository_paths(repos_df)
+
+    # repo_id(id)와 project_id를 기준으로 조인
+    merged_df = pd.merge(repos_df, members_df, left_on='id', right_on='project_id', how='left')
+
+    # project_id 컬럼 제거 (중복)
+    if 'project_id' in merged_df.columns:
+        merged_df = merged_df.drop(columns=['project_id'])
+
+    # archive 컬럼 추가 (기본값: False)
+    merged_df['archive'] = False
+
+    # 누락된 컬럼 추가
+    for col in FINAL_COLUMNS:
+        if col not in merged_df.columns:
+            merged_df[col] = ""
+
+    # NaN 값을 빈 문자열로 대체 (category 컬럼은 그대로 유지)
+    text_cols = [col for col in FINAL_COLUMNS if col not in CATEGORY_COLUMNS and merged_df[col].dtype == "string"]
+    merged_df[text_cols] = merged_df[text_cols].fillna("")
+    merged_df['owner'] = merged_df['owner'].astype("string").fillna("").astype("category")
+
+    return merged_df[FINAL_COLUMNS]
+
+def read_repos(chunk_size=None):
+    """레포지토리 정보 로드 (chunk_size가 있으면 청크 단위로 반환)"""
+    dtypes = {'id': "Int64", 'group': "string", 'project': "string", 'repository': "string",
+              'description': "string", 'url': "string", 'created_at': "string", 'last_update': "string"}
+    if chunk_size:
+        return pd.read_csv(REPO_FILE, dtype=dtypes, chunksize=chunk_size)
+    return [pd.read_csv(REPO_FILE, dtype=dtypes)]
+
+def get_parquet_schema(schema):
+    """Parquet 파일 스키마 (category 컬럼은 int32 인덱스 사전으로 고정)
+
+    pandas category의 인덱스 폭(int8/int16)은 청크의 카테고리 수에 따라 달라지므로,
+    첫 청크 스키마를 그대로 쓰면 카테고리가 더 많은 청크를 맞출 수 없습니다.
+    """
+    dictionary_type = pa.dictionary(pa.int32(), pa.string())
+    for name in CATEGORY_COLUMNS:
+        index = schema.get_field_index(name)
+        if index >= 0:
+            schema = schema.set(index, schema.field(index).with_type(dictionary_type))
+    return schema
+
+def merge_gitlab_data(chunk_size=None, parquet=False):
+    """GitLab 레포지토리, 유저, 멤버 정보를 통합
+
+    Args:
+        chunk_size (int, optional): 지정하면 레포지토리 파일을 청크 단위로 읽어 병합/저장 (메모리 사용량 제한)
+        parquet (bool): CSV와 함께 Parquet 파일도 저장
+    """
     print("🔄 GitLab 데이터 통합 시작...")
     
     if not check_files_exist():
         return
     
-    # 1. 레포지토리 정보 로드
-    print("📂 레포지토리 정보 로드 중...")
-    try:
-        repos_df = pd.read_csv(REPO_FILE)
-        print(f"✅ 레포지토리 {len(repos_df)}개 로드 완료")
-    except Exception as e:
-        print(f"❌ 레포지토리 파일 로드 실패: {e}")
+    if parquet and pq is None:
+        print("❌ Parquet 출력에는 pyarrow가 필요합니다. (pip install pyarrow)")
         return
     
-    # 2. 사용자 정보 로드 (참조용)
+    # 1. 사용자 정보 로드 (참조용)
     print("👤 사용자 정보 로드 중...")
     try:
-        users_df = pd.read_csv(USER_FILE)
+        users_df = pd.read_csv(USER_FILE, usecols=[0])
         print(f"✅ 사용자 {len(users_df)}명 로드 완료")
     except Exception as e:
         print(f"❌ 사용자 파일 로드 실패: {e}")
         return
     
-    # 3. 멤버 및 커밋 정보 로드
+    # 2. 멤버 및 커밋 정보 로드
     print("👥 멤버 및 커밋 정보 로드 중...")
     try:
-        members_df = pd.read_csv(MEMBER_FILE)
+        members_df = load_members()
         print(f"✅ 프로젝트 멤버 정보 {len(members_df)}개 로드 완료")
-        
-        # 필요한 메인테이너 컬럼만 선택 (1-18만 사용)
-        maintainer_cols = [f'maintainer{i}' for i in range(1, 26) if f'maintainer{i}' in members_df.columns]
-        
-        # 유지할 컬럼 리스트
-        keep_cols = ['project_id', 'owner'] 
-        keep_cols.extend(maintainer_cols[:18])  # 최대 18개까지만 유지
-        keep_cols.extend([f'developer{i}' for i in range(1, 21) if f'developer{i}' in members_df.columns])
-        keep_cols.extend([f'commit_user{i}' for i in range(1, 21) if f'commit_user{i}' in members_df.columns])
-        keep_cols.extend([f'commit_date{i}' for i in range(1, 21) if f'commit_date{i}' in members_df.columns])
-        
-        # 실제 데이터프레임에 있는 컬럼만 선택
-        existing_cols = [col for col in keep_cols if col in members_df.columns]
-        members_df = members_df[existing_cols]
-        
-        # maintainer 컬럼 수 확인
-        maintainer_count = sum(1 for col in members_df.columns if col.startswith('maintainer'))
-        if maintainer_count > 18:
-            excess_maintainers = [f'maintainer{i}' for i in range(19, 26) if f'maintainer{i}' in members_df.columns]
-            members_df = members_df.drop(columns=excess_maintainers)
-            print(f"📝 메인테이너 컬럼 18개로 제한됨 (초과 컬럼 {len(excess_maintainers)}개 제외)")
-        
     except Exception as e:
         print(f"❌ 멤버 파일 로드 실패: {e}")
         return
     
-    # 4. 레포지토리 경로 분석 및 그룹/프로젝트 분리
-    print("📊 레포지토리 경로 분석 중...")
+    # 3. 레포지토리 정보를 (청크 단위로) 읽어 경로 분석 후 병합/저장
+    print("🔄 레포지토리 경로 분석 및 데이터 병합 중...")
+    total_records = 0
+    projects_filled = 0
+    parquet_writer = None
+    
     try:
-        # 새로운 컬럼들 초기화
-        for i in range(1, MAX_GROUP_DEPTH + 1):
-            repos_df[f'group{i}'] = ""
-        
-        # project 컬럼 추가 (기존에 있으면 유지)
-        if 'project' not in repos_df.columns:
-            repos_df['project'] = ""
-        
-        # 각 레포지토리 경로 분석 및 분할
-        for idx, repo_path in enumerate(repos_df['repository']):
-            parts = repo_path.split('/')
+        for chunk_index, repos_df in enumerate(read_repos(chunk_size)):
+            final_df = merge_chunk(repos_df, members_df)
             
-            # 마지막 부분은 항상 프로젝트 이름
-            if parts:
-                repos_df.at[idx, 'project'] = parts[-1]
+            if chunk_index == 0:
+                # 결과 확인 (처음 5개만)
+                print("📝 레포지토리 경로 분석 샘플 (처음 5개):")
+                print(final_df[['repository', 'group1', 'group2', 'group3', 'project']].head(5).to_string())
+                print("📝 저장할 데이터 샘플 (처음 3개 레코드의 일부 컬럼):")
+                print(final_df[['id', 'group1', 'group2', 'group3', 'project', 'repository']].head(3).to_string())
             
-            # 그룹 부분 채우기 (마지막 부분 제외)
-            for i, part in enumerate(parts[:-1], start=1):
-                if i <= MAX_GROUP_DEPTH:  # 최대 그룹 depth까지만 처리
-                    repos_df.at[idx, f'group{i}'] = part
-        
-        # 기존 'group' 컬럼이 있다면 제거 (이제 group1, group2, group3로 대체)
-        if 'group' in repos_df.columns:
-            repos_df = repos_df.drop(columns=['group'])
-        
-        print(f"✅ 레포지토리 경로 분석 완료")
-        
-        # 결과 확인 (처음 5개만)
-        print("📝 레포지토리 경로 분석 샘플 (처음 5개):")
-        sample_cols = ['repository', 'group1', 'group2', 'group3', 'project']
-        existing_sample_cols = [col for col in sample_cols if col in repos_df.columns]
-        print(repos_df[existing_sample_cols].head(5).to_string())
-        
+            # CSV 파일로 저장 (한글 지원 및 Excel 호환성 위해 첫 청크만 utf-8-sig로 BOM 기록)
+            if chunk_index == 0:
+                final_df.to_csv(OUTPUT_FILE, index=False, encoding='utf-8-sig')
+            else:
+                final_df.to_csv(OUTPUT_FILE, index=False, header=False, mode='a', encoding='utf-8')
+            
+            if parquet:
+                table = pa.Table.from_pandas(final_df, preserve_index=False)
+                if parquet_writer is None:
+                    parquet_writer = pq.ParquetWriter(PARQUET_FILE, get_parquet_schema(table.schema))
+                table = table.cast(parquet_writer.schema)
+                parquet_writer.write_table(table)
+            
+            total_records += len(final_df)
+            projects_filled += (final_df['project'] != "").sum()
+            
+            if chunk_size:
+                print(f"📝 {total_records}개 레코드 처리 완료...")
     except Exception as e:
-        print(f"❌ 레포지토리 경로 분석 실패: {e}")
+        print(f"❌ 데이터 병합/저장 실패: {e}")
         return
+    finally:
+        if parquet_writer is not None:
+            parquet_writer.close()
     
-    # 5. 데이터 병합 - repo_id를 기준으로 병합
-    print("🔄 데이터 병합 중...")
-    try:
-        # repo_id(id)와 project_id를 기준으로 조인
-        merged_df = pd.merge(
-            repos_df, 
-            members_df,
-            left_on='id',
-            right_on='project_id',
-            how='left'
-        )
-        
-        # project_id 컬럼 제거 (중복)
-        if 'project_id' in merged_df.columns:
-            merged_df = merged_df.drop(columns=['project_id'])
-        
-        # archive 컬럼 추가 (기본값: False)
-        merged_df['archive'] = False
-        
-        # 최종 컬럼 순서 정의
-        final_columns = [
-            'id', 
-            'group1', 'group2', 'group3', 
-            'project', 'repository', 'description', 
-            'url', 'created_at', 'last_update', 'archive',
-            'owner'
-        ]
-        
-        # maintainer 컬럼 추가 (18개)
-        final_columns.extend([f'maintainer{i}' for i in range(1, 19)])
-        
-        # developer 컬럼 추가 (20개)
-        final_columns.extend([f'developer{i}' for i in range(1, 21)])
-        
-        # commit_user 컬럼 추가 (20개)
-        final_columns.extend([f'commit_user{i}' for i in range(1, 21)])
-        
-        # commit_date 컬럼 추가 (20개)
-        final_columns.extend([f'commit_date{i}' for i in range(1, 21)])
-        
-        # 누락된 컬럼 추가
-        for col in final_columns:
-            if col not in merged_df.columns:
-                merged_df[col] = ""
-        
-        # NaN 값을 빈 문자열로 대체
-        merged_df = merged_df.fillna("")
-        
-        # 최종 컬럼 순서대로 정렬
-        final_df = merged_df[final_columns]
-        
-        print(f"✅ 데이터 병합 완료: {len(final_df)}개 레코드")
-        
-        # project 컬럼 값 확인
-        projects_filled = (final_df['project'] != "").sum()
-        print(f"📊 project 컬럼이 채워진 레코드: {projects_filled}개 / {len(final_df)}개")
-        
-    except Exception as e:
-        print(f"❌ 데이터 병합 실패: {e}")
-        print(f"오류 상세: {str(e)}")
-        return
+    print(f"✅ 데이터 병합 완료: {total_records}개 레코드")
+    print(f"📊 project 컬럼이 채워진 레코드: {projects_filled}개 / {total_records}개")
+    print(f"✅ 통합 데이터 저장 완료: {OUTPUT_FILE}")
+    if parquet:
+        print(f"✅ Parquet 저장 완료: {PARQUET_FILE}")
     
-    # 6. CSV 파일로 저장 (한글 지원 및 Excel 호환성 위해 utf-8-sig 인코딩 사용)
-    print("💾 통합 데이터 저장 중...")
-    try:
-        # 샘플 데이터 출력 (처음 3개 레코드)
-        sample_cols = ['id', 'group1', 'group2', 'group3', 'project', 'repository']
-        print("📝 저장할 데이터 샘플 (처음 3개 레코드의 일부 컬럼):")
-        print(final_df[sample_cols].head(3).to_string())
-        
-        # CSV 파일로 저장
-        final_df.to_csv(OUTPUT_FILE, index=False, encoding='utf-8-sig')
-        print(f"✅ 통합 데이터 저장 완료: {OUTPUT_FILE}")
-        
-        # 컬럼 정보 출력
-        print(f"📋 저장된 컬럼 목록과 순서:")
-        for i, col in enumerate(final_columns, 1):
-            print(f"   {i:2d}. {col}")
-    except Exception as e:
-        print(f"❌ 통합 데이터 저장 실패: {e}")
-        return
+    # 컬럼 정보 출력
+    print(f"📋 저장된 컬럼 목록과 순서:")
+    for i, col in enumerate(FINAL_COLUMNS, 1):
+        print(f"   {i:2d}. {col}")
     
     print("🎉 모든 작업이 성공적으로 완료되었습니다!")
     print(f"📁 결과 파일: {os.path.abspath(OUTPUT_FILE)}")
 
 if __name__ == "__main__":
-    merge_gitlab_data()
+    parser = argparse.ArgumentParser(description="GitLab 레포지토리/유저/멤버 정보 통합")
+    parser.add_argument("--chunk-size", type=int, default=None, help="레포지토리 파일을 지정한 행 수씩 나누어 처리 (메모리 사용량 제한)")
+    parser.add_argument("--parquet", action="store_true", help=f"CSV와 함께 {PARQUET_FILE} 저장 (pyarrow 필요)")
+    args = parser.parse_args()
+
+    merge_gitlab_data(chunk_size=args.chunk_size, parquet=args.parquet)
@@ -2,6 +2,7 @@ import pandas as pd
 import re
 import os
 import json
+import hashlib
 from difflib import SequenceMatcher
 from datetime import datetime
 
@@ -11,6 +12,7 @@ USERS_DATA = "gitlab_allusers.csv"              # 사용자 정보
 MEMBERLIST_DATA = "gitlab_all_memberlist.csv"   # 프로젝트별 멤버 정보
 OUTPUT_FILE = "gitlab_normalized_data.csv"      # 정규화된 출력 파일
 MAPPING_FILE = "user_mapping.json"              # 매핑 정보 저장 파일 (재사용 가능)
+MAPPING_CACHE_FILE = os.path.join(os.path.dirname(MAPPING_FILE), "user_mapping_cache.json")  # 커밋 사용자별 매칭 결과 캐시
 LOG_FILE = "normalization_log.txt"              # 로그 파일
 
 # 이메일에서 사용자 이름 추출 패턴
@@ -22,6 +24,85 @@ SIMILARITY_THRESHOLD = 0.75
 
 # 매핑 캐시
 mapping_cache = {}
+# 커밋 사용자별 매칭에 사용한 입력 (step, 조회한 매핑 키, 일치한 키, 프로젝트 멤버 해시)
+mapping_cache_inputs = {}
+
+# 매칭 로직이나 캐시 형식이 바뀌면 올려서 기존 캐시 파일을 무효화
+MAPPING_CACHE_VERSION = 2
+
+# 전체 매핑 유사도 검색 인덱스 (매핑 객체별로 한 번 생성)
+fuzzy_index_cache = {}
+
+class FuzzyIndex:
+    """매핑 키 유사도 검색 인덱스
+
+    전체 키를 SequenceMatcher로 비교하는 것과 같은 결과(가장 높은 ratio, 동률이면 먼저 나온 키)를
+    반환하되, ratio의 상한값으로 후보를 먼저 걸러 실제 ratio는 소수의 후보에 대해서만 계산합니다.
+    - real_quick_ratio: 길이만으로 계산한 상한 -> 키를 길이별로 묶고, 상한이 높은 길이부터 조회
+    - quick_ratio: 문자 빈도로 계산한 상한 -> 상한이 높은 후보부터 ratio 계산
+    상한이 현재 최고 ratio보다 낮은 길이/후보는 최고값을 넘을 수 없으므로 건너뜁니다.
+    """
+
+    def __init__(self, keys, threshold=SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self.buckets = {}  # 키 길이 -> [(순서, 키, SequenceMatcher)]
+
+        for order, key in enumerate(keys):
+            # 키 쪽(b) 전처리 결과를 재사용하기 위해 키마다 SequenceMatcher를 유지
+            matcher = SequenceMatcher(None, "", key)
+            self.buckets.setdefault(len(key), []).append((order, key, matcher))
+
+    def best_match(self, text):
+        """임계값 이상에서 ratio가 가장 높은 키 반환 (없으면 None)"""
+        length_bounds = []
+        for length in self.buckets:
+            total = len(text) + length
+            bound = 2.0 * min(len(text), length) / total if total else 1.0
+            if bound >= self.threshold:
+                length_bounds.append((bound, length))
+        length_bounds.sort(reverse=True)
+
+        best_match = None
+        best_order = None
+        highest_ratio = 0
+
+        def can_beat(bound, order):
+            # 동률이면 먼저 나온 키가 우선 (전체 스캔의 ratio > highest_ratio 조건과 동일)
+            return bound > highest_ratio or (bound == highest_ratio and order < best_order)
+
+        for length_bound, length in length_bounds:
+            if length_bound < highest_ratio:
+                break
+
+            candidates = []
+            for order, key, matcher in self.buckets[length]:
+                matcher.set_seq1(text)
+                bound = matcher.quick_ratio()
+                if bound >= self.threshold and can_beat(bound, order):
+                    candidates.append((bound, order, key, matcher))
+            candidates.sort(key=lambda candidate: (-candidate[0], candidate[1]))
+
+            for bound, order, key, matcher in candidates:
+                if not can_beat(bound, order):
+                    if bound < highest_ratio:
+                        break
+                    continue
+
+                ratio = matcher.ratio()
+                if ratio >= self.threshold and can_beat(ratio, order):
+                    highest_ratio = ratio
+                    best_match = key
+                    best_order = order
+
+        return best_match
+
+def get_fuzzy_index(mapping):
+    """매핑에 대한 유사도 검색 인덱스 반환 (매핑이 바뀌면 다시 생성)"""
+    cache_key = (id(mapping), len(mapping))
+    if cache_key not in fuzzy_index_cache:
+        fuzzy_index_cache.clear()
+        fuzzy_index_cache[cache_key] = FuzzyIndex(list(mapping))
+    return fuzzy_index_cache[cache_key]
 
 def setup_logging():
     """로깅 설정"""
@@ -82,6 +163,89 @@ def save_mapping(mapping):
     except Exception:
         return False
 
+def get_fingerprint(value):
+    """매핑 항목, 멤버 목록 등 매칭 입력 값의 해시"""
+    return hashlib.sha256(json.dumps(value, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()[:16]
+
+def get_members_fingerprint(project_id, project_members):
+    """프로젝트 멤버 유사도 매칭(4단계)에 쓰이는 멤버 목록의 해시 (프로젝트가 없으면 None)"""
+    if not project_id or project_id not in project_members:
+        return None
+    # 멤버 목록은 set으로 중복을 제거해 순서가 실행마다 다르므로 정렬해서 계산
+    return get_fingerprint(sorted(map(str, project_members[project_id])))
+
+def is_cached_match_valid(inputs, changed_keys, added_index, project_members):
+    """이전 실행의 매칭 결과를 그대로 쓸 수 있는지 확인
+
+    결과마다 기록한 입력(정확히 조회한 매핑 키, 일치한 매핑 키, 프로젝트 멤버 목록)이 바뀌지 않았고,
+    유사도 매칭(5단계)까지 간 결과는 새로 추가된 매핑 키 중 임계값을 넘는 후보가 없어야 합니다.
+    """
+    if any(key in changed_keys for key in inputs['probes']):
+        return False
+    if inputs['key'] and inputs['key'] in changed_keys:
+        return False
+    if inputs['step'] == 'exact':
+        return True
+
+    if get_members_fingerprint(inputs['project_id'], project_members) != inputs['members']:
+        return False
+    if inputs['step'] == 'member':
+        return True
+
+    return added_index is None or added_index.best_match(inputs['text']) is None
+
+def load_mapping_cache(mapping, project_members):
+    """이전 실행의 매칭 결과 중 입력이 바뀌지 않은 것만 mapping_cache로 불러옵니다.
+
+    Returns:
+        tuple: (재사용한 결과 수, 입력이 바뀌어 다시 매칭할 결과 수)
+    """
+    if not os.path.exists(MAPPING_CACHE_FILE):
+        return 0, 0
+    try:
+        with open(MAPPING_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except Exception:
+        return 0, 0
+
+    if cache.get('version') != MAPPING_CACHE_VERSION or cache.get('threshold') != SIMILARITY_THRESHOLD:
+        return 0, 0
+
+    # 이전 실행 이후 추가/삭제/변경된 매핑 키
+    previous_keys = cache.get('keys', {})
+    current_keys = {key: get_fingerprint(value) for key, value in mapping.items()}
+    added_keys = [key for key in current_keys if key not in previous_keys]
+    changed_keys = set(added_keys) | {key for key, fingerprint in previous_keys.items() if current_keys.get(key) != fingerprint}
+    added_index = FuzzyIndex(added_keys) if added_keys else None
+
+    stale = 0
+    for commit_user, entry in cache.get('entries', {}).items():
+        if is_cached_match_valid(entry['inputs'], changed_keys, added_index, project_members):
+            mapping_cache[commit_user] = entry['result']
+            mapping_cache_inputs[commit_user] = entry['inputs']
+        else:
+            stale += 1
+
+    return len(mapping_cache), stale
+
+def save_mapping_cache(mapping):
+    """mapping_cache를 결과별 입력 정보와 함께 파일로 저장합니다."""
+    try:
+        with open(MAPPING_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': MAPPING_CACHE_VERSION,
+                'threshold': SIMILARITY_THRESHOLD,
+                'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'keys': {key: get_fingerprint(value) for key, value in mapping.items()},
+                'entries': {
+                    commit_user: {'result': result, 'inputs': mapping_cache_inputs[commit_user]}
+                    for commit_user, result in mapping_cache.items() if commit_user in mapping_cache_inputs
+                }
+            }, f, ensure_ascii=False, indent=2)
+        return True
+    except Exception:
+        return False
+
 def extract_name_email(text):
     """'홍길동 <hong@company.com>' 형식에서 이름과 이메일 추출"""
     if not text or not isinstance(text, str):
@@ -92,6 +256,25 @@ def extract_name_email(text):
         return match.group(1).strip(), match.group(2).strip()
     return None, None
 
+def melt_commit_users(integrated_df):
+    """commit_user* 컬럼을 (row, col, project_id, commit_user) 형식의 긴 테이블로 변환합니다.
+
+    빈 값은 제외하고 공백을 제거하며, 기존 iterrows 순회와 같은 순서(행 -> 컬럼)로 정렬합니다.
+    """
+    commit_user_cols = [col for col in integrated_df.columns if col.startswith('commit_user')]
+
+    wide_df = integrated_df[commit_user_cols].copy()
+    wide_df.columns = range(1, len(commit_user_cols) + 1)
+    wide_df['row'] = range(len(integrated_df))
+    wide_df['project_id'] = integrated_df['id'].values if 'id' in integrated_df.columns else None
+
+    long_df = wide_df.melt(id_vars=['row', 'project_id'], var_name='col', value_name='commit_user')
+    long_df = long_df[long_df['commit_user'].map(lambda value: isinstance(value, str))]
+    long_df['commit_user'] = long_df['commit_user'].str.strip()
+    long_df = long_df[long_df['commit_user'] != ""]
+
+    return long_df.sort_values(['row', 'col'], kind='stable').reset_index(drop=True)
+
 def build_mapping_table(users_df, members_df, integrated_df, log_file):
     """사용자 이름, 이메일, 사용자명에 대한 매핑 테이블을 구축합니다."""
     log_message(log_file, "📊 사용자 매핑 테이블 구축 중...")
@@ -190,77 +373,73 @@ def build_mapping_table(users_df, members_df, integrated_df, log_file):
     commit_mappings = 0
     
     if integrated_df is not None:
-        commit_cols = [col for col in integrated_df.columns if col.startswith('commit_user')]
-        for _, row in integrated_df.iterrows():
-            for col in commit_cols:
-                commit_user = row.get(col)
-                if commit_user and isinstance(commit_user, str) and commit_user.strip():
-                    commit_user = commit_user.strip()
-                    commit_users.add(commit_user)
-                    
-                    # "홍길동 <hong@company.com>" 형식 처리
-                    name, email = extract_name_email(commit_user)
-                    if name and email:
-                        name_key = name.lower()
-                        email_key = email.lower()
-                        
-                        # 이메일 기반 매핑 추가
-                        if email_key not in mapping:
-                            mapping[email_key] = {
-                                'name': name,
-                                'email': email,
-                                'username': '',
-                                'source': 'commit_user_email'
-                            }
-                            commit_mappings += 1
-                        
-                        # 이름 기반 매핑 추가
-                        if name_key not in mapping:
-                            mapping[name_key] = {
-                                'name': name,
-                                'email': email,
-                                'username': '',
-                                'source': 'commit_user_name'
-                            }
-                            commit_mappings += 1
+        # 고유 커밋 사용자를 처음 등장한 순서대로 한 번씩만 처리
+        for commit_user in melt_commit_users(integrated_df)['commit_user'].drop_duplicates():
+            commit_users.add(commit_user)
+            
+            # "홍길동 <hong@company.com>" 형식 처리
+            name, email = extract_name_email(commit_user)
+            if name and email:
+                name_key = name.lower()
+                email_key = email.lower()
+                
+                # 이메일 기반 매핑 추가
+                if email_key not in mapping:
+                    mapping[email_key] = {
+                        'name': name,
+                        'email': email,
+                        'username': '',
+                        'source': 'commit_user_email'
+                    }
+                    commit_mappings += 1
+                
+                # 이름 기반 매핑 추가
+                if name_key not in mapping:
+                    mapping[name_key] = {
+                        'name': name,
+                        'email': email,
+                        'username': '',
+                        'source': 'commit_user_name'
+                    }
+                    commit_mappings += 1
+                
+                # 커밋 사용자 전체 문자열 매핑
+                commit_key = commit_user.lower()
+                if commit_key not in mapping:
+                    mapping[commit_key] = {
+                        'name': name,
+                        'email': email,
+                        'username': '',
+                        'source': 'commit_user_full'
+                    }
+                    commit_mappings += 1
+            else:
+                # 이메일 형식인지 확인
+                if '@' in commit_user:
+                    email_key = commit_user.lower()
+                    if email_key not in mapping:
+                        # 이메일에서 사용자 이름 추출 시도
+                        email_id = EMAIL_PATTERN.match(commit_user)
+                        extracted_name = email_id.group(1) if email_id else ''
                         
-                        # 커밋 사용자 전체 문자열 매핑
-                        commit_key = commit_user.lower()
-                        if commit_key not in mapping:
-                            mapping[commit_key] = {
-                                'name': name,
-                                'email': email,
-                                'username': '',
-                                'source': 'commit_user_full'
-                            }
-                            commit_mappings += 1
-                    else:
-                        # 이메일 형식인지 확인
-                        if '@' in commit_user:
-                            email_key = commit_user.lower()
-                            if email_key not in mapping:
-                                # 이메일에서 사용자 이름 추출 시도
-                                email_id = EMAIL_PATTERN.match(commit_user)
-                                extracted_name = email_id.group(1) if email_id else ''
-                                
-                                mapping[email_key] = {
-                                    'name': extracted_name,
-                                    'email': commit_user,
-                                    'username': '',
-                                    'source': 'commit_email'
-                                }
-                                commit_mappings += 1
-                        else:
-                            # 이름으로 간주
-                            name_key = commit_user.lower()
-                            if name_key not in mapping:
-                                mapping[name_key] = {
-                                    'name': commit_user,
-                                    'email': '',
-                                    'username': '',
-                                    'source': 'commit_name'
-                                }
-                                commit_mappings += 1
+                        mapping[email_key] = {
+                            'name': extracted_name,
+                            'email': commit_user,
+                            'username': '',
+                            'source': 'commit_email'
+                        }
+                        commit_mappings += 1
+                else:
+                    # 이름으로 간주
+                    name_key = commit_user.lower()
+                    if name_key not in mapping:
+                        mapping[name_key] = {
+                            'name': commit_user,
+                            'email': '',
+                            'username': '',
+                            'source': 'commit_name'
+                        }
+                        commit_mappings += 1
         
         log_message(log_file, f"✅ 통합 데이터에서 {len(commit_users)}명의 고유 커밋 사용자 발견")
         log_message(log_file, f"✅ 커밋 사용자에서 {commit_mappings}개 매핑 항목 추가")
@@ -287,38 +466,47 @@ def find_best_match(commit_user, mapping, project_id, project_members, log_file=
         return mapping_cache[commit_user]
     
     commit_user_lower = commit_user.lower()
+    probes = [commit_user_lower]  # 정확히 조회한 매핑 키 (나중에 추가되면 결과가 바뀜)
+    
+    def remember(result, step, key=None):
+        """결과와 매칭에 사용한 입력을 캐시에 기록"""
+        mapping_cache[commit_user] = result
+        mapping_cache_inputs[commit_user] = {
+            'step': step,
+            'text': commit_user_lower,
+            'probes': probes,
+            'key': key,
+            'project_id': None if step == 'exact' else project_id,
+            'members': None if step == 'exact' else get_members_fingerprint(project_id, project_members)
+        }
+        return result
     
     # 1. 정확한 매칭 시도
     if commit_user_lower in mapping:
-        mapping_cache[commit_user] = mapping[commit_user_lower]
-        return mapping[commit_user_lower]
+        return remember(mapping[commit_user_lower], 'exact', commit_user_lower)
     
     # 2. 이름과 이메일 추출 시도 (홍길동 <hong@company.com> 형식)
     name, email = extract_name_email(commit_user)
     if name and email:
         email_lower = email.lower()
+        probes.append(email_lower)
         if email_lower in mapping:
-            mapping_cache[commit_user] = mapping[email_lower]
-            return mapping[email_lower]
+            return remember(mapping[email_lower], 'exact', email_lower)
         
         name_lower = name.lower()
+        probes.append(name_lower)
         if name_lower in mapping:
-            mapping_cache[commit_user] = mapping[name_lower]
-            return mapping[name_lower]
+            return remember(mapping[name_lower], 'exact', name_lower)
     
-    # 3. 이메일 패턴 매칭 시도
+    # 3. 이메일 패턴 매칭 시도 (이메일 자체는 1단계에서 확인)
     if '@' in commit_user:
-        # 이메일 자체로 매칭
-        if commit_user_lower in mapping:
-            mapping_cache[commit_user] = mapping[commit_user_lower]
-            return mapping[commit_user_lower]
-        
         # 이메일 ID로 매칭
         email_match = EMAIL_PATTERN.match(commit_user)
-        if email_match and email_match.group(1).lower() in mapping:
+        if email_match:
             email_id = email_match.group(1).lower()
-            mapping_cache[commit_user] = mapping[email_id]
-            return mapping[email_id]
+            probes.append(email_id)
+            if email_id in mapping:
+                return remember(mapping[email_id], 'exact', email_id)
     
     # 4. 프로젝트 멤버와 유사도 매칭 시도
     if project_id and project_id in project_members:
@@ -332,24 +520,17 @@ def find_best_match(commit_user, mapping, project_id, project_members, log_file=
                 highest_ratio = ratio
                 best_match = member
         
-        if best_match and best_match.lower() in mapping:
+        if best_match:
             best_match_lower = best_match.lower()
-            mapping_cache[commit_user] = mapping[best_match_lower]
-            return mapping[best_match_lower]
-    
-    # 5. 전체 매핑에서 유사도 매칭 시도
-    best_match = None
-    highest_ratio = 0
+            probes.append(best_match_lower)
+            if best_match_lower in mapping:
+                return remember(mapping[best_match_lower], 'member', best_match_lower)
     
-    for key in mapping:
-        ratio = SequenceMatcher(None, commit_user_lower, key).ratio()
-        if ratio > highest_ratio and ratio >= SIMILARITY_THRESHOLD:
-            highest_ratio = ratio
-            best_match = key
+    # 5. 전체 매핑에서 유사도 매칭 시도 (인덱스로 후보를 걸러 전체 스캔과 같은 결과 반환)
+    best_match = get_fuzzy_index(mapping).best_match(commit_user_lower)
     
     if best_match:
-        mapping_cache[commit_user] = mapping[best_match]
-        return mapping[best_match]
+        return remember(mapping[best_match], 'fuzzy', best_match)
     
     # 매칭 실패 - 기본 정보 생성
     if '@' in commit_user:
@@ -371,8 +552,60 @@ def find_best_match(commit_user, mapping, project_id, project_members, log_file=
             'source': 'default_name'
         }
     
-    mapping_cache[commit_user] = default_info
-    return default_info
+    return remember(default_info, 'default')
+
+def normalize_commit_columns(integrated_df, mapping, project_members, log_file=None):
+    """commit_user* 컬럼을 고유 값 단위로 매칭하여 normalized_* 컬럼을 채웁니다.
+
+    커밋 사용자 컬럼을 긴 테이블로 펼친 뒤 고유 문자열마다 find_best_match를 한 번만 호출하고,
+    결과를 조인하여 원래 행/컬럼 위치로 되돌립니다. 프로젝트 멤버 유사도 매칭에는
+    해당 사용자가 처음 등장한 행의 프로젝트를 사용합니다 (기존 mapping_cache 동작과 동일).
+
+    Returns:
+        tuple: (정규화된 DataFrame, 매칭 통계 dict)
+    """
+    commit_user_cols = [col for col in integrated_df.columns if col.startswith('commit_user')]
+    
+    # 정규화된 이름과 이메일 컬럼 추가
+    for i, col in enumerate(commit_user_cols, 1):
+        integrated_df[f'normalized_name{i}'] = ""
+        integrated_df[f'normalized_email{i}'] = ""
+        integrated_df[f'normalized_username{i}'] = ""
+    
+    long_df = melt_commit_users(integrated_df)
+    first_seen = long_df.drop_duplicates('commit_user')
+    log_message(log_file, f"🔍 고유 커밋 사용자 {len(first_seen)}명 매칭 중 (전체 {len(long_df)}건)...")
+    
+    match_rows = []
+    for commit_user, project_id in zip(first_seen['commit_user'], first_seen['project_id']):
+        match = find_best_match(commit_user, mapping, project_id, project_members, log_file)
+        if match:
+            match_rows.append({
+                'commit_user': commit_user,
+                'name': match['name'],
+                'email': match['email'],
+                'username': match.get('username', ''),
+                'source': match.get('source', 'unknown')
+            })
+    
+    match_df = pd.DataFrame(match_rows, columns=['commit_user', 'name', 'email', 'username', 'source'])
+    matched_df = long_df.merge(match_df, on='commit_user', how='inner')
+    
+    # 매칭 결과를 원래 행/컬럼 위치로 되돌림
+    for field in ['name', 'email', 'username']:
+        field_df = matched_df.pivot(index='row', columns='col', values=field)
+        for i in field_df.columns:
+            integrated_df[f'normalized_{field}{i}'] = field_df[i].reindex(range(len(integrated_df))).fillna("").values
+    
+    # 매칭 통계 (건수 기준)
+    match_stats = {
+        'total': len(long_df),
+        'matched': len(matched_df),
+        'unmatched': len(long_df) - len(matched_df),
+        'sources': matched_df['source'].value_counts().to_dict()
+    }
+    
+    return integrated_df, match_stats
 
 def normalize_commit_users():
     """커밋 사용자 정보를 정규화합니다."""
@@ -394,49 +627,16 @@ def normalize_commit_users():
     # 3. 정규화 작업
     log_message(log_file, "🔄 커밋 사용자 정규화 중...")
     
-    # 커밋 사용자 컬럼과 날짜 컬럼 리스트
-    commit_user_cols = [col for col in integrated_df.columns if col.startswith('commit_user')]
-    
-    # 정규화된 이름과 이메일 컬럼 추가
-    for i, col in enumerate(commit_user_cols, 1):
-        integrated_df[f'normalized_name{i}'] = ""
-        integrated_df[f'normalized_email{i}'] = ""
-        integrated_df[f'normalized_username{i}'] = ""
+    # 이전 실행의 매칭 결과 재사용 (결과별로 사용한 매핑 키/프로젝트 멤버가 바뀐 경우만 다시 매칭)
+    cached_count, stale_count = load_mapping_cache(mapping, project_members)
+    if cached_count or stale_count:
+        log_message(log_file, f"♻️ {MAPPING_CACHE_FILE}에서 {cached_count}개 매칭 결과 재사용 (입력이 바뀐 {stale_count}개는 다시 매칭)")
     
-    # 매칭 통계
-    match_stats = {
-        'total': 0,
-        'matched': 0,
-        'unmatched': 0,
-        'sources': {}
-    }
+    integrated_df, match_stats = normalize_commit_columns(integrated_df, mapping, project_members, log_file)
     
-    # 각 행을 처리
-    for idx, row in integrated_df.iterrows():
-        project_id = row.get('id')
-        
-        for i, col in enumerate(commit_user_cols, 1):
-            commit_user = row.get(col)
-            
-            if commit_user and isinstance(commit_user, str) and commit_user.strip():
-                match_stats['total'] += 1
-                
-                match = find_best_match(commit_user, mapping, project_id, project_members, log_file)
-                
-                if match:
-                    integrated_df.at[idx, f'normalized_name{i}'] = match['name']
-                    integrated_df.at[idx, f'normalized_email{i}'] = match['email']
-                    integrated_df.at[idx, f'normalized_username{i}'] = match.get('username', '')
-                    
-                    match_stats['matched'] += 1
-                    
-                    # 매칭 소스 통계
-                    source = match.get('source', 'unknown')
-                    if source not in match_stats['sources']:
-                        match_stats['sources'][source] = 0
-                    match_stats['sources'][source] += 1
-                else:
-                    match_stats['unmatched'] += 1
+    log_message(log_file, f"✅ 새로 매칭한 커밋 사용자: {len(mapping_cache) - cached_count}명")
+    if not save_mapping_cache(mapping):
+        log_message(log_file, f"⚠️ 매칭 캐시 저장 실패")
     
     # 4. 매칭 통계 출력
     match_percentage = (match_stats['matched'] / match_stats['total'] * 100) if match_stats['total'] > 0 else 0
@@ -0,0 +1,90 @@
+import argparse
+import importlib.util
+import os
+import random
+import string
+import time
+from difflib import SequenceMatcher
+
+# 5.user_mapping_regex.py는 숫자로 시작하여 일반 import가 불가능하므로 파일 경로로 로드
+spec = importlib.util.spec_from_file_location(
+    "user_mapping_regex", os.path.join(os.path.dirname(os.path.abspath(__file__)), "5.user_mapping_regex.py")
+)
+user_mapping_regex = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(user_mapping_regex)
+
+SURNAMES = ["kim", "lee", "park", "choi", "jung", "kang", "cho", "yoon", "jang", "lim", "han", "oh", "seo", "shin", "kwon"]
+
+def make_mapping(user_count, rng):
+    """이름/이메일 ID/이메일 키를 가진 합성 매핑 생성 (build_mapping_table과 같은 키 구성)"""
+    mapping = {}
+    for i in range(user_count):
+        given = "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 8)))
+        name = f"{rng.choice(SURNAMES)} {given}"
+        email_id = f"{given}.{rng.choice(SURNAMES)}{i}"
+        info = {"name": name, "email": f"{email_id}@example.com", "username": email_id, "source": "gitlab_user"}
+
+        mapping.setdefault(name, info)
+        mapping.setdefault(email_id, info)
+        mapping.setdefault(f"{email_id}@example.com", info)
+    return mapping
+
+def make_queries(mapping, query_count, rng):
+    """매핑 키에 오타를 넣은 질의와 매칭되지 않을 무작위 질의 생성"""
+    keys = list(mapping)
+    queries = []
+    for _ in range(query_count):
+        if rng.random() < 0.7:
+            chars = list(rng.choice(keys))
+            for _ in range(rng.randint(1, 2)):
+                chars[rng.randrange(len(chars))] = rng.choice(string.ascii_lowercase)
+            queries.append("".join(chars))
+        else:
+            queries.append("".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(5, 20))))
+    return queries
+
+def full_scan(text, mapping, threshold):
+    """기존 find_best_match 5단계 방식 (전체 키 SequenceMatcher 스캔)"""
+    best_match = None
+    highest_ratio = 0
+
+    for key in mapping:
+        ratio = SequenceMatcher(None, text, key).ratio()
+        if ratio > highest_ratio and ratio >= threshold:
+            highest_ratio = ratio
+            best_match = key
+
+    return best_match
+
+def main():
+    parser = argparse.ArgumentParser(description="find_best_match 유사도 매칭 벤치마크 (전체 스캔 vs 인덱스)")
+    parser.add_argument("--users", type=int, default=10000, help="합성 사용자 수")
+    parser.add_argument("--queries", type=int, default=200, help="질의 수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    threshold = user_mapping_regex.SIMILARITY_THRESHOLD
+    mapping = make_mapping(args.users, rng)
+    queries = make_queries(mapping, args.queries, rng)
+    print(f"📊 사용자 {args.users}명, 매핑 키 {len(mapping)}개, 질의 {len(queries)}개")
+
+    start = time.perf_counter()
+    expected = [full_scan(query, mapping, threshold) for query in queries]
+    scan_time = time.perf_counter() - start
+    print(f"⏱️ 전체 스캔: {scan_time:.2f}초 ({scan_time / len(queries) * 1000:.1f}ms/질의)")
+
+    start = time.perf_counter()
+    index = user_mapping_regex.FuzzyIndex(list(mapping), threshold)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = [index.best_match(query) for query in queries]
+    index_time = time.perf_counter() - start
+    print(f"⏱️ 인덱스: {index_time:.2f}초 ({index_time / len(queries) * 1000:.1f}ms/질의, 인덱스 생성 {build_time:.2f}초)")
+
+    mismatches = sum(1 for a, b in zip(expected, actual) if a != b)
+    print(f"✅ 결과 일치: {len(queries) - mismatches}/{len(queries)}, 속도 향상 {scan_time / index_time:.1f}배")
+
+if __name__ == "__main__":
+    main()
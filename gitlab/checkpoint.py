@@ -0,0 +1,52 @@
+import json
+import os
+
+class CheckpointJournal:
+    """수집 결과를 한 줄씩 기록하는 append-only JSONL 체크포인트
+
+    각 줄은 {"id": 프로젝트/유저 ID, "data": 결과} 형식입니다.
+    resume=True이면 기존 기록을 읽어 이어서 기록하고, 아니면 새로 시작합니다.
+    """
+
+    def __init__(self, path, resume=False):
+        self.path = path
+        self.entries = {}
+
+        needs_newline = False
+        if resume and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    needs_newline = not line.endswith("\n")
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # 중단 시점에 마지막 줄이 잘렸을 수 있음
+                    self.entries[record["id"]] = record["data"]
+
+        self.file = open(path, "a" if resume else "w", encoding="utf-8")
+        if needs_newline:
+            self.file.write("\n")
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def get(self, key, default=None):
+        return self.entries.get(key, default)
+
+    def add(self, key, data):
+        """결과 한 건을 기록하고 바로 디스크에 반영"""
+        self.entries[key] = data
+        self.file.write(json.dumps({"id": key, "data": data}, ensure_ascii=False) + "\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
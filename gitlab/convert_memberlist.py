@@ -0,0 +1,50 @@
+import argparse
+import os
+import pandas as pd
+from datamodel import MEMBERSHIPS_FILE, COMMITS_FILE, load_long_tables, wide_to_long, long_to_wide
+
+# 기존 와이드 형식 멤버 리스트
+WIDE_FILE = "gitlab_all_memberlist.csv"
+
+def convert_to_long(wide_file):
+    """와이드 멤버 리스트를 memberships, commits 테이블로 변환"""
+    if not os.path.exists(wide_file):
+        print(f"❌ 파일이 존재하지 않습니다: {wide_file}")
+        return
+
+    print(f"🔄 {wide_file} 변환 중...")
+    wide_df = pd.read_csv(wide_file, dtype="string").astype({"project_id": "Int64"})
+    memberships_df, commits_df = wide_to_long(wide_df)
+
+    memberships_df.to_csv(MEMBERSHIPS_FILE, index=False, encoding="utf-8-sig")
+    commits_df.to_csv(COMMITS_FILE, index=False, encoding="utf-8-sig")
+
+    print(f"✅ {len(wide_df)}개 프로젝트 -> 멤버십 {len(memberships_df)}건: {MEMBERSHIPS_FILE}")
+    print(f"✅ {len(wide_df)}개 프로젝트 -> 커밋자 {len(commits_df)}건: {COMMITS_FILE}")
+    print("⚠️ 와이드 형식에서 이미 잘린 멤버와 user_id/username은 복원되지 않습니다. 전체 정보는 2.get_all_repo2user.py를 다시 실행하세요.")
+
+def render_wide(output_file):
+    """memberships, commits 테이블에서 와이드 리포트 생성"""
+    for file in [MEMBERSHIPS_FILE, COMMITS_FILE]:
+        if not os.path.exists(file):
+            print(f"❌ 파일이 존재하지 않습니다: {file}")
+            return
+
+    print("🔄 와이드 리포트 생성 중...")
+    memberships_df, commits_df = load_long_tables()
+    wide_df = long_to_wide(memberships_df, commits_df)
+
+    wide_df.to_csv(output_file, index=False, encoding="utf-8-sig")
+    print(f"✅ 와이드 리포트 저장 완료: {output_file} ({len(wide_df)}개 프로젝트)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="멤버 리스트 와이드 형식 <-> 정규화 테이블(memberships, commits) 변환")
+    parser.add_argument("--to-wide", action="store_true", help="정규화 테이블에서 와이드 리포트 생성")
+    parser.add_argument("--input", default=WIDE_FILE, help=f"변환할 와이드 멤버 리스트 (기본값: {WIDE_FILE})")
+    parser.add_argument("--output", default=WIDE_FILE, help=f"--to-wide 결과 파일 (기본값: {WIDE_FILE})")
+    args = parser.parse_args()
+
+    if args.to_wide:
+        render_wide(args.output)
+    else:
+        convert_to_long(args.input)
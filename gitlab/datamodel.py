@@ -0,0 +1,144 @@
+import pandas as pd
+
+# 정규화 테이블 파일
+# - projects: 1.get_all_repolist.py 결과 (1행 = 1프로젝트)
+# - users: 3.get_all_userinfo.py 결과 (1행 = 1유저)
+# - memberships: 프로젝트 멤버 (1행 = 프로젝트의 멤버 1명)
+# - commits: 프로젝트 커밋자 (1행 = 프로젝트의 커밋자/날짜 1건)
+PROJECTS_FILE = "gitlab_repolist.csv"
+USERS_FILE = "gitlab_allusers.csv"
+MEMBERSHIPS_FILE = "gitlab_memberships.csv"
+COMMITS_FILE = "gitlab_commits.csv"
+
+MEMBERSHIP_COLUMNS = ["project_id", "user_id", "username", "name", "access_level", "role"]
+COMMIT_COLUMNS = ["project_id", "author_name", "created_at"]
+
+ACCESS_LEVEL_ROLES = {50: "owner", 40: "maintainer", 30: "developer", 20: "reporter", 10: "guest"}
+ROLE_ACCESS_LEVELS = {role: level for level, role in ACCESS_LEVEL_ROLES.items()}
+
+# 와이드 리포트(gitlab_all_memberlist.csv 형식)의 역할별 최대 컬럼 수
+MAX_MAINTAINERS = 25
+MAX_DEVELOPERS = 20
+MAX_COMMITS = 20
+
+def membership_rows(project_id, members):
+    """GitLab members API 응답을 memberships 행 목록으로 변환"""
+    return [
+        [project_id, member.get("id", ""), member.get("username", ""), member.get("name", ""),
+         member.get("access_level", ""), ACCESS_LEVEL_ROLES.get(member.get("access_level"), "")]
+        for member in members
+    ]
+
+def commit_rows(project_id, authors, dates):
+    """커밋자 이름/날짜 목록을 commits 행 목록으로 변환"""
+    return [[project_id, author, date] for author, date in zip(authors, dates)]
+
+def load_long_tables():
+    """memberships, commits 테이블 로드"""
+    memberships_df = pd.read_csv(MEMBERSHIPS_FILE, dtype={"name": "string", "username": "string", "role": "string"})
+    commits_df = pd.read_csv(COMMITS_FILE, dtype={"author_name": "string", "created_at": "string"})
+    return memberships_df, commits_df
+
+def wide_to_long(wide_df):
+    """와이드 멤버 리스트(owner, maintainer1.., developer1.., commit_user1.., commit_date1..)를
+    memberships, commits 테이블로 변환합니다. (빈 칸은 제외)
+
+    Returns:
+        tuple: (memberships DataFrame, commits DataFrame)
+    """
+    # 1. 멤버: owner/maintainerN/developerN 컬럼을 (project_id, name, role)로 펼침
+    member_cols = [col for col in wide_df.columns if col == "owner" or col.startswith(("maintainer", "developer"))]
+    members = wide_df[["project_id"] + member_cols].melt(id_vars="project_id", var_name="column", value_name="name")
+    members["role"] = members["column"].str.extract(r"^([a-z]+)", expand=False)
+    members["name"] = members["name"].astype("string").str.strip()
+    members = members[members["name"].fillna("") != ""]
+
+    memberships_df = pd.DataFrame({
+        "project_id": members["project_id"],
+        "user_id": "",
+        "username": "",
+        "name": members["name"],
+        "access_level": members["role"].map(ROLE_ACCESS_LEVELS),
+        "role": members["role"],
+    }).drop_duplicates(["project_id", "name", "role"]).sort_values("project_id", kind="stable")
+
+    # 2. 커밋: commit_userN / commit_dateN 쌍을 (project_id, author_name, created_at)으로 펼침
+    user_cols = [col for col in wide_df.columns if col.startswith("commit_user")]
+    commits = pd.concat(
+        [
+            pd.DataFrame({
+                "project_id": wide_df["project_id"],
+                "author_name": wide_df[col].astype("string").str.strip(),
+                "created_at": wide_df.get(col.replace("commit_user", "commit_date"), pd.Series("", index=wide_df.index)).astype("string"),
+            })
+            for col in user_cols
+        ],
+        ignore_index=True,
+    ) if user_cols else pd.DataFrame(columns=COMMIT_COLUMNS)
+    commits_df = commits[commits["author_name"].fillna("") != ""].fillna("").sort_values("project_id", kind="stable")
+
+    return memberships_df[MEMBERSHIP_COLUMNS].reset_index(drop=True), commits_df[COMMIT_COLUMNS].reset_index(drop=True)
+
+def pivot_numbered(df, value_cols, prefixes, limit, index):
+    """프로젝트별 값 목록을 prefix1..prefixN 컬럼으로 펼침 (limit개 초과분은 제외)"""
+    df = df.copy()
+    df["n"] = df.groupby("project_id").cumcount() + 1
+    df = df[df["n"] <= limit]
+
+    columns = {}
+    for value_col, prefix in zip(value_cols, prefixes):
+        wide = df.pivot(index="project_id", columns="n", values=value_col).reindex(index=index, columns=range(1, limit + 1))
+        for n in range(1, limit + 1):
+            columns[f"{prefix}{n}"] = wide[n].astype("string").fillna("").values
+
+    return pd.DataFrame(columns, index=index)
+
+def long_to_wide(memberships_df, commits_df, project_ids=None,
+                 max_maintainers=MAX_MAINTAINERS, max_developers=MAX_DEVELOPERS, max_commits=MAX_COMMITS):
+    """memberships, commits 테이블에서 와이드 리포트(gitlab_all_memberlist.csv 형식)를 생성합니다.
+
+    역할별 최대 컬럼 수를 넘는 멤버는 리포트에서만 제외되며, 초과 인원은 로그로 알립니다.
+
+    Args:
+        memberships_df (DataFrame): memberships 테이블
+        commits_df (DataFrame): commits 테이블
+        project_ids (list, optional): 리포트에 포함할 프로젝트 ID (기본값: 두 테이블에 나오는 모든 프로젝트)
+        max_maintainers (int): 최대 메인테이너 컬럼 수
+        max_developers (int): 최대 디벨로퍼 컬럼 수
+        max_commits (int): 최대 커밋자 컬럼 수
+
+    Returns:
+        DataFrame: project_id, owner, maintainerN, developerN, commit_userN, commit_dateN 컬럼
+    """
+    if project_ids is None:
+        project_ids = sorted(set(memberships_df["project_id"]) | set(commits_df["project_id"]))
+    index = pd.Index(project_ids, name="project_id")
+
+    # 프로젝트 내 같은 이름은 한 번만 사용 (기존 수집 스크립트와 동일)
+    members = memberships_df.drop_duplicates(["project_id", "name", "access_level"])
+    owners = members[members["access_level"] == 50].drop_duplicates("project_id").set_index("project_id")["name"]
+    maintainers = members[members["access_level"] == 40]
+    developers = members[members["access_level"] == 30]
+    commits = commits_df.drop_duplicates(["project_id", "author_name", "created_at"])
+
+    for label, df, limit in [("메인테이너", maintainers, max_maintainers), ("디벨로퍼", developers, max_developers)]:
+        overflow = df.groupby("project_id").size().sub(limit).clip(lower=0).sum()
+        if overflow:
+            print(f"📝 {label} {limit}명 초과로 와이드 리포트에서 제외된 인원: {overflow}명 (memberships 테이블에는 모두 보존)")
+
+    wide_df = pd.concat([
+        pd.DataFrame({"owner": owners.reindex(index).astype("string").fillna("").values}, index=index),
+        pivot_numbered(maintainers, ["name"], ["maintainer"], max_maintainers, index),
+        pivot_numbered(developers, ["name"], ["developer"], max_developers, index),
+        pivot_numbered(commits, ["author_name", "created_at"], ["commit_user", "commit_date"], max_commits, index),
+    ], axis=1)
+
+    # commit_user/commit_date 순서를 기존 형식(commit_user1..N, commit_date1..N)에 맞춤
+    ordered_cols = (
+        ["owner"] +
+        [f"maintainer{i}" for i in range(1, max_maintainers + 1)] +
+        [f"developer{i}" for i in range(1, max_developers + 1)] +
+        [f"commit_user{i}" for i in range(1, max_commits + 1)] +
+        [f"commit_date{i}" for i in range(1, max_commits + 1)]
+    )
+    return wide_df[ordered_cols].reset_index()
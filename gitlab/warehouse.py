@@ -0,0 +1,216 @@
+import os
+import sqlite3
+import argparse
+from contextlib import closing
+from datetime import datetime
+import pandas as pd
+from dotenv import load_dotenv
+from datamodel import PROJECTS_FILE, USERS_FILE, MEMBERSHIPS_FILE, COMMITS_FILE
+
+# .env 파일에서 환경변수 로드
+load_dotenv()
+
+# 수집 스크립트와 adminui gitlab_manager가 함께 사용하는 로컬 웨어하우스
+WAREHOUSE_FILE = os.getenv("GITLAB_WAREHOUSE", "gitlab_warehouse.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    namespace TEXT,
+    name TEXT,
+    path_with_namespace TEXT,
+    description TEXT,
+    web_url TEXT,
+    created_at TEXT,
+    last_activity_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_projects_last_activity ON projects (last_activity_at);
+
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    username TEXT,
+    name TEXT,
+    email TEXT,
+    state TEXT,
+    created_at TEXT,
+    last_sign_in_at TEXT,
+    is_admin INTEGER,
+    external INTEGER,
+    organization TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_users_username ON users (username);
+CREATE INDEX IF NOT EXISTS idx_users_email ON users (email);
+
+CREATE TABLE IF NOT EXISTS members (
+    project_id INTEGER NOT NULL,
+    user_id INTEGER,
+    username TEXT,
+    name TEXT,
+    access_level INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_members_project ON members (project_id, access_level);
+CREATE INDEX IF NOT EXISTS idx_members_user_id ON members (user_id, access_level);
+CREATE INDEX IF NOT EXISTS idx_members_username ON members (username, access_level);
+CREATE INDEX IF NOT EXISTS idx_members_name ON members (name, access_level);
+
+CREATE TABLE IF NOT EXISTS commit_authors (
+    project_id INTEGER NOT NULL,
+    author_name TEXT,
+    created_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_commit_authors_project ON commit_authors (project_id);
+CREATE INDEX IF NOT EXISTS idx_commit_authors_name ON commit_authors (author_name);
+
+CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+# 프로젝트 목록 증분 동기화 상태 키 (adminui gitlab_warehouse와 동일)
+HOST_KEY = "projects_host"
+LAST_SYNC_KEY = "projects_last_sync"
+
+USER_FIELDS = ["id", "username", "name", "email", "state", "created_at", "last_sign_in_at", "is_admin", "external", "organization"]
+
+def connect(path=WAREHOUSE_FILE):
+    """웨어하우스 연결 (WAL 모드라 수집 중에도 adminui에서 조회 가능)"""
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+def mark_updated(conn, table):
+    conn.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+                 (f"{table}_updated_at", datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+
+def get_state(conn, key):
+    row = conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+def set_state(conn, key, value):
+    with conn:
+        conn.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, value))
+
+def project_row(p):
+    return (p["id"], p["namespace"]["name"], p["name"], p["path_with_namespace"], p.get("description") or "",
+            p["web_url"], p["created_at"], p["last_activity_at"])
+
+def replace_projects(conn, projects):
+    """프로젝트 테이블 전체 교체 (GitLab projects API 응답 형식)"""
+    with conn:
+        conn.execute("DELETE FROM projects")
+        conn.executemany("INSERT INTO projects VALUES (?, ?, ?, ?, ?, ?, ?, ?)", [project_row(p) for p in projects])
+        mark_updated(conn, "projects")
+
+def upsert_projects(conn, projects):
+    """프로젝트 추가 또는 갱신"""
+    with conn:
+        conn.executemany("INSERT OR REPLACE INTO projects VALUES (?, ?, ?, ?, ?, ?, ?, ?)", [project_row(p) for p in projects])
+        mark_updated(conn, "projects")
+
+def delete_projects(conn, project_ids):
+    with conn:
+        conn.executemany("DELETE FROM projects WHERE id = ?", [(i,) for i in project_ids])
+        mark_updated(conn, "projects")
+
+def project_ids(conn):
+    return {row[0] for row in conn.execute("SELECT id FROM projects")}
+
+def load_projects(conn):
+    """프로젝트 테이블을 GitLab projects API 응답 형식으로 반환"""
+    return [
+        {"id": row[0], "namespace": {"name": row[1]}, "name": row[2], "path_with_namespace": row[3], "description": row[4],
+         "web_url": row[5], "created_at": row[6], "last_activity_at": row[7]}
+        for row in conn.execute("SELECT * FROM projects ORDER BY id")
+    ]
+
+def check_project_host(conn, host):
+    """증분 동기화 대상 호스트가 바뀌었으면 프로젝트 테이블과 동기화 시각 초기화"""
+    if get_state(conn, HOST_KEY) != host:
+        with conn:
+            conn.execute("DELETE FROM projects")
+            conn.execute("DELETE FROM sync_state WHERE key = ?", (LAST_SYNC_KEY,))
+            conn.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (HOST_KEY, host))
+
+def replace_users(conn, users):
+    """유저 테이블 전체 교체 (3.get_all_userinfo.py 레코드 형식)"""
+    with conn:
+        conn.execute("DELETE FROM users")
+        conn.executemany(
+            f"INSERT INTO users ({', '.join(USER_FIELDS)}) VALUES ({', '.join('?' * len(USER_FIELDS))})",
+            [tuple(user.get(field) for field in USER_FIELDS) for user in users]
+        )
+        mark_updated(conn, "users")
+
+def replace_project_members(conn, project_id, members, commit_authors):
+    """프로젝트 하나의 멤버/커밋자 교체
+
+    Args:
+        members (list): GitLab members API 응답
+        commit_authors (tuple): (커밋자 이름 목록, 커밋 날짜 목록)
+    """
+    names, dates = commit_authors
+    with conn:
+        conn.execute("DELETE FROM members WHERE project_id = ?", (project_id,))
+        conn.execute("DELETE FROM commit_authors WHERE project_id = ?", (project_id,))
+        conn.executemany(
+            "INSERT INTO members VALUES (?, ?, ?, ?, ?)",
+            [(project_id, m.get("id"), m.get("username", ""), m.get("name", ""), m.get("access_level")) for m in members]
+        )
+        conn.executemany("INSERT INTO commit_authors VALUES (?, ?, ?)", [(project_id, n, d) for n, d in zip(names, dates)])
+        mark_updated(conn, "members")
+
+def prune_project_members(conn, project_ids):
+    """목록에 없는(삭제된) 프로젝트의 멤버/커밋자 삭제"""
+    with conn:
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS current_projects (id INTEGER PRIMARY KEY)")
+        conn.execute("DELETE FROM current_projects")
+        conn.executemany("INSERT OR IGNORE INTO current_projects VALUES (?)", [(i,) for i in project_ids])
+        conn.execute("DELETE FROM members WHERE project_id NOT IN (SELECT id FROM current_projects)")
+        conn.execute("DELETE FROM commit_authors WHERE project_id NOT IN (SELECT id FROM current_projects)")
+
+def import_csv_files(path=WAREHOUSE_FILE):
+    """기존 수집 결과 CSV(프로젝트, 유저, memberships, commits)를 웨어하우스로 가져오기"""
+    with closing(connect(path)) as conn:
+        if os.path.exists(PROJECTS_FILE):
+            repos_df = pd.read_csv(PROJECTS_FILE, dtype=str, keep_default_na=False)
+            with conn:
+                conn.execute("DELETE FROM projects")
+                conn.executemany(
+                    "INSERT INTO projects VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    repos_df[["id", "group", "project", "repository", "description", "url", "created_at", "last_update"]]
+                    .itertuples(index=False, name=None)
+                )
+                mark_updated(conn, "projects")
+            print(f"✅ 프로젝트 {len(repos_df)}개 가져옴")
+
+        if os.path.exists(USERS_FILE):
+            users_df = pd.read_csv(USERS_FILE, dtype=str, keep_default_na=False)
+            replace_users(conn, users_df.to_dict("records"))
+            print(f"✅ 유저 {len(users_df)}명 가져옴")
+
+        if os.path.exists(MEMBERSHIPS_FILE) and os.path.exists(COMMITS_FILE):
+            memberships_df = pd.read_csv(MEMBERSHIPS_FILE, dtype={"username": str, "name": str}).astype(object)
+            commits_df = pd.read_csv(COMMITS_FILE, dtype=str, keep_default_na=False)
+            memberships_df = memberships_df.where(memberships_df.notna(), None)
+            with conn:
+                conn.execute("DELETE FROM members")
+                conn.execute("DELETE FROM commit_authors")
+                conn.executemany(
+                    "INSERT INTO members VALUES (?, ?, ?, ?, ?)",
+                    memberships_df[["project_id", "user_id", "username", "name", "access_level"]].itertuples(index=False, name=None)
+                )
+                conn.executemany(
+                    "INSERT INTO commit_authors VALUES (?, ?, ?)",
+                    commits_df[["project_id", "author_name", "created_at"]].itertuples(index=False, name=None)
+                )
+                mark_updated(conn, "members")
+            print(f"✅ 멤버십 {len(memberships_df)}건, 커밋자 {len(commits_df)}건 가져옴")
+
+    print(f"📁 웨어하우스: {os.path.abspath(path)}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="GitLab 수집 결과 CSV를 로컬 SQLite 웨어하우스로 가져오기")
+    parser.add_argument("--path", default=WAREHOUSE_FILE, help=f"웨어하우스 파일 (기본값: {WAREHOUSE_FILE}, GITLAB_WAREHOUSE 환경변수)")
+    args = parser.parse_args()
+
+    import_csv_files(args.path)
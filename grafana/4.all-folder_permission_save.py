@@ -5,6 +5,7 @@ import logging
 from datetime import datetime
 import base64
 import urllib.parse
+from folder_tree import walk_folder_tree, DEFAULT_MAX_WORKERS
 from dotenv import load_dotenv
 import os
 
@@ -95,23 +96,21 @@ class GrafanaFolderPermissions:
     def get_team_detaild(self, team_id: int) -> Dict:
         return self._make_request("GET", f"/api/teams/{team_id}")
     
-    def get_nested_folders(self, parent_uid: Optional[str] = None) -> List[Dict]:
-        url = '/api/folders'
-        if parent_uid:
-            url += f'?parentUid={parent_uid}'
-        
-        folders = self._make_request("GET", url)
-
-        result = []
-        for folder in folders:
-            result.append(folder)
+    def get_nested_folders(self, parent_uid: Optional[str] = None, max_workers: int = DEFAULT_MAX_WORKERS) -> List[Dict]:
+        def fetch_children(uid: Optional[str]) -> List[Dict]:
             try:
-                nested = self.get_nested_folders(folder['uid'])
-                result.extend(nested)
+                return self._make_request("GET", "/api/folders", params={'parentUid': uid or parent_uid} if uid or parent_uid else None)
             except requests.exceptions.RequestException as e:
-                self.logger.error(f"Failed to get nested folders for {folder['title']}: {str(e)}")
-        
-        return result
+                # 하위 폴더 조회 실패는 해당 가지만 건너뜀 (최상위 조회 실패는 호출자에게 전달)
+                if not uid:
+                    raise
+                self.logger.error(f"Failed to get nested folders for {uid}: {str(e)}")
+                return []
+
+        return [
+            {**folder, 'parentUid': folder['parentUid'] or (parent_uid or '')}
+            for folder in walk_folder_tree(fetch_children, max_workers)
+        ]
     
     def _is_team_permission(self, permission: Dict) -> bool:
         return (
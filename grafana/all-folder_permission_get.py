@@ -4,6 +4,7 @@ from typing import List, Dict, Optional
 import logging
 from datetime import datetime
 import base64
+from folder_tree import walk_folder_tree, DEFAULT_MAX_WORKERS
 
 class GrafanaFolderPermissions:
     def __init__(
@@ -64,26 +65,25 @@ class GrafanaFolderPermissions:
     def get_team_details(self, team_id: int) -> Dict:
         return self._make_request('GET', f'/api/teams/{team_id}')
 
-    def get_nested_folders(self, parent_uid: Optional[str] = None) -> List[Dict]:
+    def get_nested_folders(self, parent_uid: Optional[str] = None, max_workers: int = DEFAULT_MAX_WORKERS) -> List[Dict]:
         """
-        Recursively get all folders and their nested folders
+        Get all folders and their nested folders, one tree level at a time
         
         Args:
             parent_uid: UID of parent folder (None for root level)
+            max_workers: maximum number of concurrent requests per level
         """
-        url = '/api/folders'
-        if parent_uid:
-            url += f'?parentUid={parent_uid}'
-        
-        folders = self._make_request('GET', url)
-        
-        result = []
-        for folder in folders:
-            result.append(folder)
-            nested = self.get_nested_folders(folder['uid'])
-            result.extend(nested)
-        
-        return result
+        def fetch_children(uid: Optional[str]) -> List[Dict]:
+            return self._make_request('GET', '/api/folders', params={'parentUid': uid} if uid else None)
+
+        if not parent_uid:
+            return walk_folder_tree(fetch_children, max_workers)
+
+        # Walk the subtree below parent_uid, keeping parentUid of the top level children
+        return [
+            {**folder, 'parentUid': folder['parentUid'] or parent_uid}
+            for folder in walk_folder_tree(lambda uid: fetch_children(uid or parent_uid), max_workers)
+        ]
 
     # Collect permissions data for all folders and save to DataFrame
     def collect_permissions(self) -> pd.DataFrame:
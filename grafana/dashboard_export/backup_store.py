@@ -0,0 +1,207 @@
+import gzip
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+# 대시보드 백업 저장소 기본 위치
+DEFAULT_STORE_DIR = "dashboard_store"
+
+INDEX_FILE = "index.json"
+OBJECTS_DIR = "objects"
+
+# 스냅샷에 함께 보관할 메타 정보 (복원 시 폴더 위치 확인용, 매번 바뀌는 created/updated 등은 제외)
+KEPT_META_FIELDS = ["folderId", "folderUid", "folderTitle", "slug"]
+
+def canonicalize(snapshot):
+    """키 정렬, 공백 없는 JSON 바이트 (같은 내용이면 항상 같은 바이트)"""
+    return json.dumps(snapshot, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def make_snapshot(dashboard_data):
+    """/api/dashboards/uid/{uid} 응답을 저장용 스냅샷으로 변환
+
+    대시보드 모델에서 version을 빼고 저장하므로, 내용 변경 없이 버전만 올라간 대시보드도
+    같은 객체를 가리킵니다. 버전은 인덱스에 기록됩니다.
+    """
+    dashboard = {key: value for key, value in dashboard_data["dashboard"].items() if key != "version"}
+    meta = {key: dashboard_data.get("meta", {})[key] for key in KEPT_META_FIELDS if key in dashboard_data.get("meta", {})}
+    return {"dashboard": dashboard, "meta": meta}
+
+def write_atomic(path, data):
+    """임시 파일에 쓴 뒤 이름을 바꿔 중간에 멈춰도 깨진 파일이 남지 않게 저장"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp_")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+class DashboardBackupStore:
+    """내용 주소 기반(content-addressed) 대시보드 백업 저장소
+
+    스냅샷은 정규화된 JSON의 SHA-256 해시를 이름으로 gzip 압축해 objects/ 아래에 한 번만 저장하고,
+    index.json에 UID -> 버전 -> 해시를 기록합니다. 매일 같은 대시보드를 백업해도 내용이 같으면
+    인덱스 항목만 늘어나고 파일은 늘어나지 않습니다.
+
+    여러 스레드에서 put을 호출해도 되며, 인덱스는 save()를 호출할 때 파일로 기록됩니다.
+    """
+
+    def __init__(self, root=DEFAULT_STORE_DIR):
+        self.root = Path(root)
+        self.lock = threading.Lock()
+        self.index = self._load_index()
+
+    def _load_index(self):
+        index_path = self.root / INDEX_FILE
+        if not index_path.exists():
+            return {"dashboards": {}}
+
+        with open(index_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _object_path(self, digest):
+        return self.root / OBJECTS_DIR / digest[:2] / f"{digest[2:]}.json.gz"
+
+    def has(self, uid, version):
+        """UID의 해당 버전이 이미 저장되어 있는지 확인"""
+        with self.lock:
+            return str(version) in self.index["dashboards"].get(uid, {}).get("versions", {})
+
+    def put(self, dashboard_data):
+        """대시보드 스냅샷 저장
+
+        Args:
+            dashboard_data (dict): /api/dashboards/uid/{uid} 응답 (dashboard, meta)
+
+        Returns:
+            tuple: (해시, 새 객체 파일을 썼는지 여부)
+        """
+        dashboard = dashboard_data["dashboard"]
+        data = canonicalize(make_snapshot(dashboard_data))
+        digest = hashlib.sha256(data).hexdigest()
+
+        object_path = self._object_path(digest)
+        written = False
+        if not object_path.exists():
+            # mtime=0으로 같은 내용이면 압축 결과도 같게 유지
+            write_atomic(object_path, gzip.compress(data, mtime=0))
+            written = True
+
+        with self.lock:
+            entry = self.index["dashboards"].setdefault(dashboard["uid"], {"versions": {}})
+            entry["title"] = dashboard.get("title", "")
+            entry["versions"].setdefault(str(dashboard.get("version", 0)), {
+                "hash": digest,
+                "savedAt": datetime.now().isoformat(),
+                "folderTitle": dashboard_data.get("meta", {}).get("folderTitle", "General")
+            })
+
+        return digest, written
+
+    def versions(self, uid):
+        """UID의 저장된 버전 목록 ([(버전, 인덱스 항목)], 오래된 버전부터)"""
+        with self.lock:
+            versions = self.index["dashboards"].get(uid, {}).get("versions", {})
+            return sorted(((int(version), entry) for version, entry in versions.items()), key=lambda item: item[0])
+
+    def get(self, uid, version=None):
+        """저장된 스냅샷을 /api/dashboards/uid/{uid} 응답 형식으로 복원 (version 생략 시 최신 버전)
+
+        Raises:
+            KeyError: 저장되지 않은 UID 또는 버전
+        """
+        versions = dict(self.versions(uid))
+        if not versions:
+            raise KeyError(f"저장된 대시보드가 없습니다: {uid}")
+
+        version = max(versions) if version is None else int(version)
+        if version not in versions:
+            raise KeyError(f"저장된 버전이 없습니다: {uid} v{version} (저장된 버전: {', '.join(map(str, versions))})")
+
+        with open(self._object_path(versions[version]["hash"]), 'rb') as f:
+            snapshot = json.loads(gzip.decompress(f.read()))
+
+        snapshot["dashboard"]["version"] = version
+        return snapshot
+
+    def save(self):
+        """인덱스를 파일로 기록"""
+        with self.lock:
+            data = json.dumps(self.index, indent=2, ensure_ascii=False).encode("utf-8")
+        write_atomic(self.root / INDEX_FILE, data)
+
+    def get_stats(self):
+        """대시보드 수, 인덱스 항목(버전) 수, 객체 파일 수와 디스크 사용량(바이트)"""
+        objects = list((self.root / OBJECTS_DIR).glob("*/*.json.gz"))
+        with self.lock:
+            dashboards = self.index["dashboards"]
+            return {
+                "dashboards": len(dashboards),
+                "versions": sum(len(entry["versions"]) for entry in dashboards.values()),
+                "objects": len(objects),
+                "bytes": sum(path.stat().st_size for path in objects)
+            }
+
+def print_stats(store):
+    """저장소 통계 출력"""
+    stats = store.get_stats()
+    print(f"📦 백업 저장소: {store.root}")
+    print(f"   - 대시보드: {stats['dashboards']}개")
+    print(f"   - 저장된 버전: {stats['versions']}개")
+    print(f"   - 객체 파일: {stats['objects']}개 ({stats['bytes'] / 1024:.1f} KB)")
+
+def main():
+    """저장소 조회/복원 명령"""
+    parser = argparse.ArgumentParser(description="Grafana 대시보드 백업 저장소 조회/복원")
+    parser.add_argument("--store", default=DEFAULT_STORE_DIR, help=f"백업 저장소 디렉토리 (기본값: {DEFAULT_STORE_DIR})")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="저장된 대시보드 또는 특정 대시보드의 버전 목록")
+    list_parser.add_argument("uid", nargs="?", help="대시보드 UID")
+
+    restore_parser = subparsers.add_parser("restore", help="저장된 버전을 JSON 파일로 복원 (import_dashboard.py로 업로드 가능)")
+    restore_parser.add_argument("uid", help="대시보드 UID")
+    restore_parser.add_argument("--version", type=int, help="복원할 버전 (기본값: 최신)")
+    restore_parser.add_argument("--output", help="출력 파일 경로 (기본값: restore_{UID}_v{버전}.json)")
+
+    args = parser.parse_args()
+    store = DashboardBackupStore(args.store)
+
+    if args.command == "list":
+        if not args.uid:
+            for uid, entry in sorted(store.index["dashboards"].items(), key=lambda item: item[1].get("title", "")):
+                print(f"{uid}\t{entry.get('title', '')}\t버전 {len(entry['versions'])}개")
+            print_stats(store)
+            return
+
+        versions = store.versions(args.uid)
+        if not versions:
+            print(f"❌ 저장된 대시보드가 없습니다: {args.uid}")
+            sys.exit(1)
+        for version, entry in versions:
+            print(f"v{version}\t{entry['savedAt']}\t{entry.get('folderTitle', '')}\t{entry['hash'][:12]}")
+        return
+
+    try:
+        snapshot = store.get(args.uid, args.version)
+    except KeyError as e:
+        print(f"❌ {e.args[0]}")
+        sys.exit(1)
+
+    version = snapshot["dashboard"]["version"]
+    output_path = Path(args.output or f"restore_{args.uid}_v{version}.json")
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(snapshot, f, indent=2, ensure_ascii=False)
+
+    print(f"✅ 복원 완료: {snapshot['dashboard'].get('title', '')} v{version} → {output_path}")
+
+if __name__ == "__main__":
+    main()
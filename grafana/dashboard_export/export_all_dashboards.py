@@ -3,8 +3,12 @@ import json
 import os
 from datetime import datetime
 import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
+from backup_store import DashboardBackupStore, print_stats
 
 # .env 파일에서 환경변수 로드
 load_dotenv()
@@ -16,9 +20,21 @@ GRAFANA_TOKEN = os.getenv("GRAFANA_TOKEN")
 # 출력 디렉토리 설정
 EXPORT_DIR = f"grafana_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
-def setup_session():
-    """HTTP 세션 설정"""
+# 증분 추출은 매번 같은 디렉토리를 갱신
+INCREMENTAL_EXPORT_DIR = "grafana_export"
+
+# 이전 추출 결과(대시보드별 버전, 파일 경로)를 기록하는 파일
+MANIFEST_FILE = "export_manifest.json"
+
+# 동시 추출 작업 수 기본값
+DEFAULT_WORKERS = 8
+
+def setup_session(pool_size=DEFAULT_WORKERS):
+    """HTTP 세션 설정 (워커 스레드가 공유하므로 동시 작업 수만큼 연결 유지)"""
     session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
     session.headers.update({
         "Authorization": f"Bearer {GRAFANA_TOKEN}",
         "Content-Type": "application/json"
@@ -223,13 +239,59 @@ def get_folder_info(session):
         print(f"❌ 폴더 정보 조회 실패: {e}")
         return {}
 
-def export_dashboard(session, dashboard_info, folder_map):
-    """개별 대시보드 추출"""
+def load_manifest(export_dir):
+    """이전 추출의 매니페스트 로드 ({UID: 추출 결과}, 없으면 빈 사전)"""
+    manifest_path = Path(export_dir) / MANIFEST_FILE
+    if not manifest_path.exists():
+        return {}
+    
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)["dashboards"]
+    except Exception as e:
+        print(f"⚠️  매니페스트를 읽을 수 없어 전체 추출합니다: {e}")
+        return {}
+
+def save_manifest(export_dir, dashboards, export_results, previous_manifest):
+    """이번 추출 결과로 매니페스트 저장
+
+    추출에 실패한 대시보드는 이전 기록을 유지해 다음 실행에서 다시 비교하고,
+    Grafana에서 삭제된 대시보드는 매니페스트에서 제외합니다.
+    """
+    manifest = {}
+    for dashboard, result in zip(dashboards, export_results):
+        entry = result or previous_manifest.get(dashboard["uid"])
+        if entry:
+            manifest[dashboard["uid"]] = {key: value for key, value in entry.items() if key != "status"}
+    
+    removed = [entry["title"] for uid, entry in previous_manifest.items() if uid not in manifest]
+    if removed:
+        print(f"🗑️  Grafana에서 삭제된 대시보드 {len(removed)}개를 매니페스트에서 제외했습니다: {', '.join(removed)}")
+    
+    manifest_path = Path(export_dir) / MANIFEST_FILE
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump({"exportedAt": datetime.now().isoformat(), "dashboards": manifest}, f, indent=2, ensure_ascii=False)
+    
+    print(f"✅ 매니페스트 저장: {manifest_path}")
+
+def export_dashboard(session, dashboard_info, folder_map, export_dir=EXPORT_DIR, previous=None):
+    """개별 대시보드 추출
+
+    previous(매니페스트의 이전 추출 결과)가 있으면 버전이 같고 파일이 남아 있는 대시보드는 다시 저장하지 않습니다.
+    검색 결과에 버전이 있으면 대시보드 조회도 생략합니다.
+
+    Returns:
+        dict: 추출 결과 (status: exported/unchanged, 실패 시 None)
+    """
     uid = dashboard_info["uid"]
     title = dashboard_info["title"]
     folder_id = dashboard_info.get("folderId", 0)
     
-    print(f"📄 대시보드 추출 중: {title} (UID: {uid})")
+    def is_unchanged(version):
+        return previous and previous.get("version") == version and (Path(export_dir) / previous["relativePath"]).exists()
+    
+    if "version" in dashboard_info and is_unchanged(dashboard_info["version"]):
+        return {**previous, "status": "unchanged"}
     
     url = f"{GRAFANA_URL}/api/dashboards/uid/{uid}"
     
@@ -239,6 +301,10 @@ def export_dashboard(session, dashboard_info, folder_map):
         
         dashboard_data = response.json()
         
+        version = dashboard_data["dashboard"].get("version", 0)
+        if is_unchanged(version):
+            return {**previous, "status": "unchanged"}
+        
         # 메타데이터 추가
         dashboard_data["meta"]["exportInfo"] = {
             "exportedAt": datetime.now().isoformat(),
@@ -251,7 +317,6 @@ def export_dashboard(session, dashboard_info, folder_map):
         safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
         safe_title = safe_title.replace(' ', '_')
         
-        version = dashboard_data["dashboard"].get("version", 0)
         filename = f"{uid}_{safe_title}_v{version}.json"
         
         # 폴더별 디렉토리 생성
@@ -259,10 +324,11 @@ def export_dashboard(session, dashboard_info, folder_map):
             folder_name = folder_map[folder_id]["title"]
             safe_folder_name = "".join(c for c in folder_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
             safe_folder_name = safe_folder_name.replace(' ', '_')
-            output_dir = Path(EXPORT_DIR) / "folders" / safe_folder_name
+            relative_dir = Path("folders") / safe_folder_name
         else:
-            output_dir = Path(EXPORT_DIR) / "folders" / "General"
+            relative_dir = Path("folders") / "General"
         
+        output_dir = Path(export_dir) / relative_dir
         output_dir.mkdir(parents=True, exist_ok=True)
         
         # JSON 파일 저장
@@ -270,7 +336,11 @@ def export_dashboard(session, dashboard_info, folder_map):
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(dashboard_data, f, indent=2, ensure_ascii=False)
         
-        print(f"✅ 저장 완료: {output_path}")
+        # 버전, 제목, 폴더가 바뀌어 파일명이 달라졌으면 이전 파일 삭제
+        if previous:
+            previous_path = Path(export_dir) / previous["relativePath"]
+            if previous_path != output_path and previous_path.exists():
+                previous_path.unlink()
         
         return {
             "uid": uid,
@@ -280,23 +350,100 @@ def export_dashboard(session, dashboard_info, folder_map):
             "folderTitle": folder_map.get(folder_id, {}).get("title", "General"),
             "filename": filename,
             "path": str(output_path),
+            "relativePath": str(relative_dir / filename),
             "panels_count": len(dashboard_data["dashboard"].get("panels", [])),
             "has_descriptions": sum(1 for panel in dashboard_data["dashboard"].get("panels", []) 
-                                  if panel.get("description", "").strip())
+                                  if panel.get("description", "").strip()),
+            "status": "exported"
         }
         
     except Exception as e:
         print(f"❌ 대시보드 추출 실패 [{title}]: {e}")
         return None
 
-def create_export_summary(export_results, folder_map):
+def export_dashboards(session, dashboards, folder_map, export_dir, workers=DEFAULT_WORKERS, manifest=None):
+    """대시보드를 여러 작업으로 동시에 추출
+
+    Returns:
+        list: dashboards 순서의 추출 결과 (실패한 대시보드는 None)
+    """
+    manifest = manifest or {}
+    export_results = [None] * len(dashboards)
+    
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {
+            executor.submit(export_dashboard, session, dashboard, folder_map, export_dir, manifest.get(dashboard["uid"])): i
+            for i, dashboard in enumerate(dashboards)
+        }
+        
+        for done, future in enumerate(as_completed(futures), 1):
+            i = futures[future]
+            result = future.result()
+            export_results[i] = result
+            
+            if result and result["status"] == "exported":
+                print(f"[{done}/{len(dashboards)}] ✅ 저장 완료: {result['path']}")
+            elif result:
+                print(f"[{done}/{len(dashboards)}] ⏭️  변경 없음: {result['title']} (v{result['version']})")
+    
+    return export_results
+
+def backup_dashboard(session, dashboard_info, store):
+    """개별 대시보드를 백업 저장소에 저장
+
+    검색 결과에 버전이 있고 저장소에 같은 버전이 있으면 조회하지 않습니다.
+
+    Returns:
+        str: stored(새 객체 저장)/deduplicated(같은 내용의 객체 재사용)/unchanged(이미 저장된 버전), 실패 시 None
+    """
+    uid = dashboard_info["uid"]
+    
+    if "version" in dashboard_info and store.has(uid, dashboard_info["version"]):
+        return "unchanged"
+    
+    try:
+        response = session.get(f"{GRAFANA_URL}/api/dashboards/uid/{uid}")
+        response.raise_for_status()
+        dashboard_data = response.json()
+        
+        if store.has(uid, dashboard_data["dashboard"].get("version", 0)):
+            return "unchanged"
+        
+        _, written = store.put(dashboard_data)
+        return "stored" if written else "deduplicated"
+        
+    except Exception as e:
+        print(f"❌ 대시보드 백업 실패 [{dashboard_info['title']}]: {e}")
+        return None
+
+def backup_dashboards(session, dashboards, store, workers=DEFAULT_WORKERS):
+    """대시보드를 여러 작업으로 동시에 백업 저장소에 저장하고 결과 건수 출력"""
+    counts = {"stored": 0, "deduplicated": 0, "unchanged": 0, None: 0}
+    
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for done, status in enumerate(executor.map(lambda dashboard: backup_dashboard(session, dashboard, store), dashboards), 1):
+            counts[status] += 1
+            if done % 100 == 0 or done == len(dashboards):
+                print(f"   [{done}/{len(dashboards)}] 처리 중...")
+    
+    store.save()
+    
+    print(f"\n📊 백업 요약:")
+    print(f"   - 새로 저장: {counts['stored']}개")
+    print(f"   - 같은 내용 재사용: {counts['deduplicated']}개")
+    print(f"   - 이미 저장된 버전: {counts['unchanged']}개")
+    print(f"   - 실패: {counts[None]}개")
+    print_stats(store)
+
+def create_export_summary(export_results, folder_map, export_dir=EXPORT_DIR):
     """추출 결과 요약 생성"""
     summary = {
         "exportInfo": {
             "exportedAt": datetime.now().isoformat(),
             "totalDashboards": len(export_results),
             "successfulExports": len([r for r in export_results if r is not None]),
-            "failedExports": len([r for r in export_results if r is None])
+            "failedExports": len([r for r in export_results if r is None]),
+            "unchangedDashboards": len([r for r in export_results if r is not None and r["status"] == "unchanged"])
         },
         "folderStructure": folder_map,
         "dashboards": [r for r in export_results if r is not None]
@@ -315,7 +462,7 @@ def create_export_summary(export_results, folder_map):
     }
     
     # 요약 파일 저장
-    summary_path = Path(EXPORT_DIR) / "export_summary.json"
+    summary_path = Path(export_dir) / "export_summary.json"
     with open(summary_path, 'w', encoding='utf-8') as f:
         json.dump(summary, f, indent=2, ensure_ascii=False)
     
@@ -323,6 +470,7 @@ def create_export_summary(export_results, folder_map):
     print(f"   - 총 대시보드: {summary['exportInfo']['totalDashboards']}개")
     print(f"   - 성공: {summary['exportInfo']['successfulExports']}개")
     print(f"   - 실패: {summary['exportInfo']['failedExports']}개")
+    print(f"   - 변경 없음(저장 생략): {summary['exportInfo']['unchangedDashboards']}개")
     print(f"   - 총 패널: {total_panels}개")
     print(f"   - Description 있는 패널: {total_descriptions}개")
     print(f"   - Description 커버리지: {summary['statistics']['descriptionCoverage']}")
@@ -330,8 +478,17 @@ def create_export_summary(export_results, folder_map):
 
 def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="Grafana 대시보드 전체 추출 스크립트")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help=f"동시 추출 작업 수 (기본값: {DEFAULT_WORKERS})")
+    parser.add_argument("--incremental", action="store_true", help="이전 추출 이후 버전이 바뀐 대시보드만 저장")
+    parser.add_argument("--output-dir", help=f"출력 디렉토리 (기본값: grafana_export_YYYYMMDD_HHMMSS, 증분 추출은 {INCREMENTAL_EXPORT_DIR})")
+    parser.add_argument("--store", help="JSON 파일 대신 지정한 백업 저장소에 압축 스냅샷으로 저장 (같은 내용은 한 번만 저장)")
+    
+    args = parser.parse_args()
+    export_dir = args.output_dir or (INCREMENTAL_EXPORT_DIR if args.incremental else EXPORT_DIR)
+    
     print("🚀 Grafana 대시보드 전체 추출을 시작합니다...")
-    print(f"📂 출력 디렉토리: {EXPORT_DIR}")
+    print(f"📂 출력 디렉토리: {args.store or export_dir}")
     
     # 환경변수 확인
     if not GRAFANA_URL or not GRAFANA_TOKEN:
@@ -341,11 +498,8 @@ def main():
         print("  GRAFANA_TOKEN=your-admin-api-token")
         return
     
-    # 출력 디렉토리 생성
-    Path(EXPORT_DIR).mkdir(exist_ok=True)
-    
     # HTTP 세션 설정
-    session = setup_session()
+    session = setup_session(args.workers)
     
     # 연결 테스트
     try:
@@ -368,21 +522,31 @@ def main():
         print("❌ 추출할 대시보드가 없습니다.")
         return
     
-    # 각 대시보드 추출
-    export_results = []
-    for i, dashboard in enumerate(dashboards, 1):
-        print(f"\n[{i}/{len(dashboards)}]", end=" ")
-        result = export_dashboard(session, dashboard, folder_map)
-        export_results.append(result)
-        
-        # API 제한 방지를 위한 지연
-        time.sleep(0.1)
+    # 백업 저장소 모드
+    if args.store:
+        print(f"\n📦 {len(dashboards)}개 대시보드를 {args.workers}개 작업으로 백업 저장소에 저장합니다...")
+        backup_dashboards(session, dashboards, DashboardBackupStore(args.store), args.workers)
+        print(f"\n🎉 모든 대시보드 백업이 완료되었습니다!")
+        return
+    
+    # 출력 디렉토리 생성
+    Path(export_dir).mkdir(parents=True, exist_ok=True)
+    
+    # 증분 추출이면 이전 매니페스트와 버전 비교
+    manifest = load_manifest(export_dir) if args.incremental else {}
+    if args.incremental:
+        print(f"🔁 증분 추출: 이전 기록 {len(manifest)}개와 버전을 비교합니다.")
+    
+    # 각 대시보드 동시 추출
+    print(f"\n📦 {len(dashboards)}개 대시보드를 {args.workers}개 작업으로 추출합니다...")
+    export_results = export_dashboards(session, dashboards, folder_map, export_dir, args.workers, manifest)
     
     # 추출 결과 요약
-    create_export_summary(export_results, folder_map)
+    create_export_summary(export_results, folder_map, export_dir)
+    save_manifest(export_dir, dashboards, export_results, manifest)
     
     print(f"\n🎉 모든 대시보드 추출이 완료되었습니다!")
-    print(f"📂 결과 확인: {EXPORT_DIR}/")
+    print(f"📂 결과 확인: {export_dir}/")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
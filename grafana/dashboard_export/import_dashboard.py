@@ -6,6 +6,7 @@ from datetime import datetime
 from pathlib import Path
 import argparse
 from dotenv import load_dotenv
+from backup_store import DashboardBackupStore
 
 # .env 파일에서 환경변수 로드
 load_dotenv()
@@ -14,6 +15,9 @@ load_dotenv()
 GRAFANA_URL = os.getenv("GRAFANA_URL")
 GRAFANA_TOKEN = os.getenv("GRAFANA_TOKEN")
 
+# 업로드 전 기존 대시보드를 백업할 저장소
+BACKUP_STORE_DIR = "backups"
+
 def setup_session():
     """HTTP 세션 설정"""
     session = requests.Session()
@@ -23,8 +27,8 @@ def setup_session():
     })
     return session
 
-def backup_existing_dashboard(session, uid):
-    """기존 대시보드 백업"""
+def backup_existing_dashboard(session, uid, store_dir=BACKUP_STORE_DIR):
+    """기존 대시보드 백업 (내용이 같은 이전 백업이 있으면 새 파일을 만들지 않음)"""
     print(f"💾 기존 대시보드 백업 중 (UID: {uid})...")
     
     url = f"{GRAFANA_URL}/api/dashboards/uid/{uid}"
@@ -38,28 +42,21 @@ def backup_existing_dashboard(session, uid):
         response.raise_for_status()
         dashboard_data = response.json()
         
-        # 백업 파일 생성
-        backup_dir = Path("backups")
-        backup_dir.mkdir(exist_ok=True)
-        
         title = dashboard_data["dashboard"]["title"]
         version = dashboard_data["dashboard"]["version"]
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-        safe_title = safe_title.replace(' ', '_')
-        
-        backup_filename = f"backup_{uid}_{safe_title}_v{version}_{timestamp}.json"
-        backup_path = backup_dir / backup_filename
         
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            json.dump(dashboard_data, f, indent=2, ensure_ascii=False)
+        # 백업 저장소에 저장
+        store = DashboardBackupStore(store_dir)
+        digest, written = store.put(dashboard_data)
+        store.save()
         
-        print(f"✅ 백업 완료: {backup_path}")
+        backup_path = f"{store_dir} ({uid} v{version}, {digest[:12]})"
+        print(f"✅ 백업 완료: {backup_path}{'' if written else ' - 동일한 내용의 백업이 있어 재사용'}")
+        print(f"   복원: python3 backup_store.py --store {store_dir} restore {uid} --version {version}")
         
         return {
             "original_version": version,
-            "backup_path": str(backup_path),
+            "backup_path": backup_path,
             "title": title
         }
         
@@ -0,0 +1,50 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+# Default number of concurrent /api/folders?parentUid= requests per level
+DEFAULT_MAX_WORKERS = 8
+
+def walk_folder_tree(fetch_children: Callable[[Optional[str]], List[Dict]], max_workers: int = DEFAULT_MAX_WORKERS) -> List[Dict]:
+    """
+    Walk the Grafana folder tree level by level (breadth-first)
+
+    All children of one level are fetched concurrently, so the serial chain of
+    requests is as long as the tree is deep instead of one request per folder.
+    Folders that were already visited are skipped, because Grafana without the
+    nested folders feature ignores parentUid and returns the root folders again.
+
+    Args:
+        fetch_children: returns the child folders of a parent UID (None for root level)
+        max_workers: maximum number of concurrent requests
+
+    Returns:
+        folders in breadth-first order with parentUid, depth (root = 0) and path ("parent/child")
+    """
+    folders = []
+    visited = set()
+    level: List[Optional[Dict]] = [None]
+    depth = 0
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        while level:
+            next_level = []
+
+            for parent, children in zip(level, executor.map(fetch_children, [parent['uid'] if parent else None for parent in level])):
+                for child in children:
+                    if child['uid'] in visited:
+                        continue
+                    visited.add(child['uid'])
+
+                    folder = {
+                        **child,
+                        'parentUid': parent['uid'] if parent else '',
+                        'depth': depth,
+                        'path': f"{parent['path']}/{child['title']}" if parent else child['title']
+                    }
+                    folders.append(folder)
+                    next_level.append(folder)
+
+            level = next_level
+            depth += 1
+
+    return folders